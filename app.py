@@ -1,25 +1,25 @@
+import cProfile
+import io
+import pstats
 import streamlit as st
 import numpy as np
-import plotly.graph_objects as go
-from scipy.signal import chebwin
-import plotly.express as px
-import random
-import colorsys
 from src.config.constants import (
     DEFAULT_N, DEFAULT_D, DEFAULT_BETA, DEFAULT_THETA_STEER,
-    DEFAULT_R_DB, DEFAULT_WAVELENGTH, PLOT_TYPES
+    DEFAULT_R_DB, DEFAULT_WAVELENGTH, DEFAULT_RESOLUTION,
+    MAX_N, MAX_LARGE_N, MAX_THETA_POINTS, MIN_POINTS_PER_LOBE, PROFILE_LOG_PATH, PROFILE_TOP_FUNCTIONS
 )
-from src.plots.radiation_pattern import RadiationPattern
-from src.plots.beam_steering import BeamSteering
-from src.plots.chebyshev_array import ChebyshevArray
-from src.plots.array_factor_3d import ArrayFactor3D
-from src.plots.grating_lobe_check import GratingLobeCheck
-from src.utils.plot_utils import get_next_color, format_legend_name
+from src.plots.registry import PLOT_REGISTRY, format_legend_name
+from src.utils.plot_utils import format_metrics_table, optimize_figure
+from src.utils.comparisons import ComparisonStore
+from src.engine.sampling import sample_theta, lobe_resolution
+from src.engine.metrics import pattern_metrics, null_positions
+from src.engine.cache import pattern_cache
+from src.utils.profiling import profiler, append_log, STAGES
 
 def initialize_session_state():
     """Initialize all session state variables."""
-    if 'comparison_plots' not in st.session_state:
-        st.session_state.comparison_plots = []
+    if 'comparisons' not in st.session_state:
+        st.session_state.comparisons = ComparisonStore()
     
     # Initialize current parameters
     if 'current_params' not in st.session_state:
@@ -39,12 +39,27 @@ def get_sidebar_controls():
         
         # Common parameters
         st.subheader("Common Parameters")
-        N = st.slider(
-            "Number of Elements (N)", 
-            2, 20, 
-            value=st.session_state.current_params['N'],
-            help="Number of antenna elements in the array"
+        large_n = st.checkbox(
+            "Large-N Mode",
+            value=st.session_state.current_params['N'] > MAX_N,
+            key='large_n',
+            help=f"Allow up to {MAX_LARGE_N:,} elements; weighted patterns switch to FFT evaluation automatically"
         )
+        if large_n:
+            N = st.number_input(
+                "Number of Elements (N)",
+                2, MAX_LARGE_N,
+                value=st.session_state.current_params['N'],
+                step=1,
+                help="Number of antenna elements in the array"
+            )
+        else:
+            N = st.slider(
+                "Number of Elements (N)", 
+                2, MAX_N, 
+                value=min(st.session_state.current_params['N'], MAX_N),
+                help="Number of antenna elements in the array"
+            )
         d = st.slider(
             "Element Spacing (d/λ)", 
             0.1, 1.0, 
@@ -55,15 +70,53 @@ def get_sidebar_controls():
         # Visualization type selector
         viz_type = st.radio(
             "Select Visualization Type",
-            PLOT_TYPES,
+            list(PLOT_REGISTRY),
             help="Choose the type of antenna array pattern to visualize"
         )
     
     return N, d, viz_type
 
+def get_debug_controls():
+    """Get the developer options for timing and profiling reruns."""
+    with st.sidebar.expander("🛠️ Developer Tools"):
+        panel = st.checkbox("Show debug panel", key='debug_panel',
+                            help="Per-stage timings and cache counters of every rerun")
+        log = st.checkbox("Append timings to log", key='debug_log',
+                          help=f"Write every rerun's timings to {PROFILE_LOG_PATH}.jsonl and .csv")
+        if st.button("Profile this rerun (cProfile)",
+                     help="Rerun the page once under cProfile and show the top functions"):
+            # Consumed by the next run of the plot area, which may be a fragment rerun
+            st.session_state.profile_rerun = True
+    return {'panel': panel, 'log': log}
+
+def show_debug_panel(report, profile=None):
+    """Show a rerun's timings, cache counters and optional cProfile statistics below the plot area."""
+    with st.expander("🐞 Debug Panel", expanded=True):
+        stages = [
+            {'Stage': name, 'Time (ms)': report[f"{name}_ms"]}
+            for name in STAGES if f"{name}_ms" in report
+        ]
+        st.dataframe(stages, use_container_width=True, hide_index=True)
+        if 'payload_bytes' in report:
+            st.caption(
+                f"Serialized figure payload: {report['payload_bytes'] / 1024:,.1f} KiB "
+                f"({report['payload_saved_bytes'] / 1024:,.1f} KiB saved by payload optimization)"
+            )
+        stats = pattern_cache.stats()
+        st.caption(
+            f"Pattern cache this rerun: {report['cache_hits']} hits, {report['cache_misses']} misses · "
+            f"{stats['entries']} entries, {stats['bytes'] / 2**20:.1f} MiB, hit rate {stats['hit_rate']:.0%}"
+        )
+        if profile is not None:
+            out = io.StringIO()
+            pstats.Stats(profile, stream=out).sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+            st.code(out.getvalue(), language=None)
+            st.download_button("Download profile", out.getvalue(), file_name="rerun_profile.txt")
+
 def handle_comparison_buttons(viz_type, N, d):
     """Handle the comparison buttons and return whether to rerun."""
-    if viz_type == "3D Array Factor":
+    plot_type = PLOT_REGISTRY[viz_type]
+    if not plot_type.comparable:
         return False
         
     col1, col2 = st.columns([1, 5])
@@ -71,28 +124,11 @@ def handle_comparison_buttons(viz_type, N, d):
     
     with col1:
         if st.button("➕ Add to Comparison", key="compare_button"):
-            # Get existing colors
-            existing_colors = [plot['color'] for plot in st.session_state.comparison_plots]
-            
-            plot_data = {
-                'type': viz_type,
-                'N': N,
-                'd': d,
-                'color': get_next_color(existing_colors),
-                'name': f"Plot {len(st.session_state.comparison_plots) + 1}"
-            }
-            
             # Get plot-specific parameters
-            if viz_type == "Basic Radiation Pattern":
-                plot_data['beta'] = st.session_state.current_params['beta']
-            elif viz_type == "Beam Steering":
-                plot_data['theta_steer_deg'] = st.session_state.current_params['theta_steer_deg']
-            elif viz_type == "Chebyshev Array":
-                plot_data['R_dB'] = st.session_state.current_params['R_dB']
-            elif viz_type == "Grating Lobe Check":
-                plot_data['wavelength'] = st.session_state.current_params['wavelength']
-            
-            st.session_state.comparison_plots.append(plot_data)
+            params = {name: st.session_state.current_params[name] for name in plot_type.parameters}
+            if not st.session_state.comparisons.add(viz_type, N=N, d=d, **params):
+                st.warning("This configuration is already in the comparison.")
+                return False
             
             # Reset current values to defaults
             st.session_state.current_params = {
@@ -107,43 +143,191 @@ def handle_comparison_buttons(viz_type, N, d):
 
     with col2:
         if st.button("🗑️ Reset Comparisons", key="reset_button"):
-            st.session_state.comparison_plots = []
+            st.session_state.comparisons.clear()
             should_rerun = True
     
     return should_rerun
 
+def get_comparison_file_controls():
+    """Export and import the comparisons; returns whether to rerun after an import."""
+    comparisons = st.session_state.comparisons
+    with st.sidebar.expander("📂 Comparison Files"):
+        st.download_button(
+            "Export Comparisons",
+            comparisons.to_json(),
+            file_name="comparisons.json",
+            mime="application/json",
+            disabled=not len(comparisons),
+            help="Save the parameters and colors of all comparisons"
+        )
+        uploaded = st.file_uploader("Comparison File", type="json",
+                                    help="A file written by Export Comparisons")
+        if uploaded is not None and st.button("Import Comparisons"):
+            try:
+                added = comparisons.load_json(uploaded.getvalue())
+            except (ValueError, KeyError) as e:
+                st.error(f"Could not import comparisons: {e}")
+                return False
+            st.session_state.comparison_import = f"Imported {added} new comparison(s)."
+            return True
+        if 'comparison_import' in st.session_state:
+            st.caption(st.session_state.pop('comparison_import'))
+    return False
+
 def create_plot(viz_type, N, d):
     """Create and return the appropriate plot based on visualization type."""
-    if viz_type == "Basic Radiation Pattern":
-        plot = RadiationPattern()
-    elif viz_type == "Beam Steering":
-        plot = BeamSteering()
-    elif viz_type == "Chebyshev Array":
-        plot = ChebyshevArray()
-    elif viz_type == "3D Array Factor":
-        plot = ArrayFactor3D()
-    else:  # Grating Lobe Check
-        plot = GratingLobeCheck()
-    
+    plot = PLOT_REGISTRY[viz_type].create()
     controls = plot.get_controls()
     return plot, controls
 
-def add_comparison_plots(plot, fig, viz_type):
-    """Add comparison plots to the main figure if they exist."""
-    if st.session_state.comparison_plots:
-        for plot_data in st.session_state.comparison_plots:
-            if plot_data['type'] == viz_type:
-                fig.add_trace(go.Scatter(
-                    x=np.degrees(np.linspace(0, np.pi, 1000)),
-                    y=plot.plot(
-                        plot_data['N'], 
-                        plot_data['d'], 
-                        **{k: v for k, v in plot_data.items() if k not in ['N', 'd', 'type', 'color', 'name']}
-                    ).data[0].y,
-                    mode='lines',
-                    name=format_legend_name(plot_data),
-                    line=dict(color=plot_data['color'], width=2, dash='dash')
-                ))
+def add_comparison_plots(plot, fig, viz_type, resolution=DEFAULT_RESOLUTION, comparisons=None):
+    """
+    Add comparison plots to the main figure and return their legend names with their batched result.
+    
+    ``comparisons`` defaults to the comparison store of the session state.
+    """
+    if comparisons is None:
+        comparisons = st.session_state.comparisons
+    group = comparisons.group(viz_type)
+    if group is None:
+        return [], None
+    
+    # One shared grid, dense enough for the largest array among the comparisons
+    # but capped since it holds a row per comparison; the group evaluates only
+    # comparisons it has no pattern for on this grid
+    N, d = group.columns['N'].max(), group.columns['d'].max()
+    theta = sample_theta(N, d, resolution, max_points=MAX_THETA_POINTS)
+    result = {**group.patterns(plot.compute_batch, theta), 'points_per_lobe': lobe_resolution(theta, N, d)}
+    
+    x = np.degrees(result['theta'])
+    records = group.records()
+    names = [format_legend_name(plot_data) for plot_data in records]
+    # Plain dicts in one add_traces call are validated once, trace objects twice
+    fig.add_traces([dict(
+        type='scatter',
+        x=x,
+        y=y,
+        mode='lines',
+        name=name,
+        line=dict(color=plot_data['color'], width=2, dash='dash')
+    ) for plot_data, name, y in zip(records, names, result['af'])])
+    
+    return names, result
+
+def show_pattern_metrics(plot, comparison_names=(), comparison_result=None):
+    """Show beamwidth, sidelobe and null metrics for the current and compared patterns."""
+    sources = []
+    if plot.result is not None and 'theta' in plot.result:
+        sources.append((plot.result.get('labels', ["Current"]), plot.result))
+    if comparison_result is not None:
+        sources.append((comparison_names, comparison_result))
+    if not sources:
+        return
+    
+    rows = []
+    for labels, result in sources:
+        if result.get('points_per_lobe', np.inf) < MIN_POINTS_PER_LOBE:
+            st.warning(f"⚠️ Metrics withheld for {', '.join(labels)}: the θ grid has only "
+                       f"{result['points_per_lobe']:.1f} samples per sidelobe (at least {MIN_POINTS_PER_LOBE} "
+                       f"needed), so the sampled pattern aliases")
+            continue
+        af = np.atleast_2d(result['af'])
+        metrics = pattern_metrics(result['theta'], af, result.get('target_deg'))
+        nulls = null_positions(result['theta'], af)
+        desired = result.get('desired_sll_db')
+        directivity = result.get('directivity_dbi')
+        rows.extend(format_metrics_table(
+            labels, metrics, nulls,
+            None if desired is None else np.atleast_1d(desired),
+            None if directivity is None else np.atleast_1d(directivity)
+        ))
+    
+    if not rows:
+        return
+    st.subheader("Pattern Metrics")
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+@st.fragment
+def render_visualization(viz_type, N, d, debug):
+    """
+    Render the plot-specific controls, the figure(s) and the metrics.
+
+    Runs as a Streamlit fragment, so changing a plot control
+    reruns only this function and re-sends only its figure; the sidebar and
+    styling are rebuilt on full reruns only.
+    """
+    profile_requested = st.session_state.pop('profile_rerun', False)
+    show_panel = debug['panel'] or profile_requested
+    profiler.start(show_panel or debug['log'])
+    profile = cProfile.Profile() if profile_requested else None
+    if profile is not None:
+        profile.enable()
+
+    # Create and display the appropriate plot
+    with profiler.stage('parameters'):
+        plot, controls = create_plot(viz_type, N, d)
+    
+    with profiler.stage('render'):
+        figures = plot.plot(N, d, **controls)
+    
+    payload = []
+    if isinstance(figures, tuple):
+        fig_3d, fig_contour = figures
+        with profiler.stage('optimize'):
+            payload = [optimize_figure(fig, measure=profiler.enabled) for fig in figures]
+        
+        # Display both plots side by side
+        col1, col2 = st.columns(2)
+        with profiler.stage('serialize'):
+            with col1:
+                st.plotly_chart(fig_3d, use_container_width=True)
+            with col2:
+                st.plotly_chart(fig_contour, use_container_width=True)
+        for level, message in plot.notices():
+            getattr(st, level)(message)
+    else:
+        fig = figures
+        overlay_start = len(fig.data)
+        with profiler.stage('comparisons'):
+            comparison_names, comparison_result = add_comparison_plots(
+                plot, fig, viz_type, controls.get('resolution', DEFAULT_RESOLUTION)
+            )
+        with profiler.stage('optimize'):
+            payload = [optimize_figure(fig, overlay_start, measure=profiler.enabled)]
+        with profiler.stage('serialize'):
+            st.plotly_chart(fig, use_container_width=True)
+        for level, message in plot.notices():
+            getattr(st, level)(message)
+        with profiler.stage('metrics'):
+            show_pattern_metrics(plot, comparison_names, comparison_result)
+
+        batch = plot.comparison_batch()
+        if batch is not None and st.button("➕ Add Sweep to Comparisons", key="compare_batch_button",
+                                           help=f"Add every swept configuration as a {batch[0]} comparison"):
+            added = st.session_state.comparisons.add(batch[0], **batch[1])
+            st.success(f"Added {added} new {batch[0]} comparison(s).")
+    
+    # Show about section
+    plot.show_about()
+
+    # Update current parameters
+    st.session_state.current_params.update({
+        'N': N,
+        'd': d,
+        **controls
+    })
+
+    if profile is not None:
+        profile.disable()
+    if profiler.enabled:
+        profiler.record('plot_type', viz_type)
+        profiler.record('payload_bytes', sum(stats['bytes_after'] for stats in payload))
+        profiler.record('payload_saved_bytes', sum(stats['bytes_before'] - stats['bytes_after'] for stats in payload))
+        report = profiler.finish()
+        if debug['log']:
+            append_log(report, PROFILE_LOG_PATH)
+        if show_panel:
+            show_debug_panel(report, profile)
 
 def main():
     """Main function to run the Streamlit app."""
@@ -184,6 +368,9 @@ def main():
 
     # Get parameters from sidebar
     N, d, viz_type = get_sidebar_controls()
+    debug = get_debug_controls()
+    if get_comparison_file_controls():
+        st.rerun()
 
     # Main content area
     st.title("📡 Antenna Array Pattern Visualizer")
@@ -192,32 +379,7 @@ def main():
     if handle_comparison_buttons(viz_type, N, d):
         st.rerun()
 
-    # Create and display the appropriate plot
-    plot, controls = create_plot(viz_type, N, d)
-    
-    if viz_type == "3D Array Factor":
-        fig_3d, fig_contour = plot.plot(N, d, **controls)
-        
-        # Display both plots side by side
-        col1, col2 = st.columns(2)
-        with col1:
-            st.plotly_chart(fig_3d, use_container_width=True)
-        with col2:
-            st.plotly_chart(fig_contour, use_container_width=True)
-    else:
-        fig = plot.plot(N, d, **controls)
-        add_comparison_plots(plot, fig, viz_type)
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Show about section
-    plot.show_about()
-
-    # Update current parameters
-    st.session_state.current_params.update({
-        'N': N,
-        'd': d,
-        **controls
-    })
+    render_visualization(viz_type, N, d, debug)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
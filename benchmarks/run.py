@@ -0,0 +1,285 @@
+"""
+Benchmark suite for pattern compute, figure construction and app reruns.
+
+Run from the repository root:
+    python -m benchmarks.run                   # compare against the stored baseline
+    python -m benchmarks.run --save-baseline   # record a new baseline
+    python -m benchmarks.run --filter 3d       # only cases whose name contains "3d"
+
+Every case reports the median wall time of a few repeats, with the pattern
+cache cleared before each repeat so the math is measured rather than cache
+lookups; ``steering slider`` cases instead time slider moves on a warm
+cache. ``plot`` stages cover numpy compute plus ``go.Figure`` construction,
+``json`` stages the Plotly serialization Streamlit performs. A case
+regresses when it is slower than its baseline by more than the threshold
+fraction and by more than ``MIN_DELTA_S``; the exit status is 1 if any case
+regresses. Baselines are machine-specific: record one on the machine that
+runs the suite.
+
+``--calibrate-fft`` instead fits the static cost model that picks between
+direct summation and the FFT path (``src.engine.fft_pattern.select_method``)
+and prints the coefficients to store in ``src/config/constants.py``.
+
+The ``import app`` case times a cold import of the app in a fresh interpreter,
+which is what a new container pays before its first page load. Independently
+of the baseline it must stay within ``--import-budget`` seconds.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import warnings
+import numpy as np
+import plotly.graph_objects as go
+from src.config.constants import RESOLUTION_POLICIES, GRID_RESOLUTIONS, FFT_BENCHMARK_SIZES, FFT_BENCHMARK_POINTS
+from src.engine.cache import pattern_cache
+from src.engine.fft_pattern import fft_size, direct_array_factor, fft_array_factor
+from src.plots.radiation_pattern import RadiationPattern
+from src.plots.beam_steering import BeamSteering
+from src.plots.chebyshev_array import ChebyshevArray
+from src.plots.grating_lobe_check import GratingLobeCheck
+from src.plots.array_factor_3d import ArrayFactor3D
+from src.plots.wideband_sweep import WidebandSweep
+from src.plots.grating_lobe_map import GratingLobeMap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+APP_PATH = os.path.join(ROOT, 'app.py')
+DEFAULT_THRESHOLD = 0.5
+MIN_DELTA_S = 0.002
+IMPORT_BUDGET_S = 1.0
+
+PLOT_CASES = [
+    ("Basic Radiation Pattern", RadiationPattern, {'beta': 0.3}),
+    ("Beam Steering", BeamSteering, {'theta_steer_deg': 25}),
+    ("Chebyshev Array", ChebyshevArray, {'R_dB': 30}),
+    ("Grating Lobe Check", GratingLobeCheck, {'wavelength': 1.0}),
+]
+PLOT_SIZES = (8, 20, 1000)
+COMPARISON_COUNTS = (1, 10, 50, 100)
+RERUN_CASE = "app rerun (default view)"
+IMPORT_CASE = "import app (cold)"
+IMPORT_SCRIPT = "import time; start = time.perf_counter(); import app; print(time.perf_counter() - start)"
+
+
+def median_time(func, repeats, warm=False):
+    """
+    Median wall time of ``func()`` over ``repeats`` calls, with the last return value.
+
+    The pattern cache is cleared before every call, unless ``warm`` is set, in
+    which case it is filled by one untimed call instead.
+    """
+    times = []
+    if warm:
+        func()
+    for _ in range(repeats):
+        if not warm:
+            pattern_cache.clear()
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)), value
+
+
+def figure_cases(name, make_figure, repeats, warm=False):
+    """Time building a figure (tuple of figures allowed) and serializing it to JSON."""
+    plot_time, figures = median_time(make_figure, repeats, warm)
+    figures = figures if isinstance(figures, tuple) else (figures,)
+    json_time, _ = median_time(lambda: [fig.to_json() for fig in figures], repeats)
+    return {f"{name}/plot": plot_time, f"{name}/json": json_time}
+
+
+def plot_cases():
+    for title, cls, params in PLOT_CASES:
+        for N in PLOT_SIZES:
+            for resolution in RESOLUTION_POLICIES:
+                yield (f"plot {title} N={N} {resolution}",
+                       lambda cls=cls, N=N, resolution=resolution, params=params:
+                       cls().plot(N, 0.5, resolution=resolution, **params))
+
+
+def comparison_cases():
+    from app import add_comparison_plots
+    from src.utils.comparisons import ComparisonStore
+
+    for count in COMPARISON_COUNTS:
+        i = np.arange(count)
+        columns = {'N': 4 + i % 17, 'd': 0.25 + 0.05 * (i % 10), 'beta': -1 + 0.02 * i}
+
+        def make_figure(columns=columns):
+            # A fresh store per repeat, so its pattern matrix is computed cold
+            comparisons = ComparisonStore()
+            comparisons.add("Basic Radiation Pattern", **columns)
+            fig = go.Figure()
+            add_comparison_plots(RadiationPattern(), fig, "Basic Radiation Pattern", comparisons=comparisons)
+            return fig
+
+        yield f"comparisons x{count}", make_figure
+
+
+def grid_cases():
+    for grid_points in GRID_RESOLUTIONS:
+        yield f"3d grid={grid_points}", lambda grid_points=grid_points: ArrayFactor3D().plot(
+            8, 0.5, grid_points=grid_points
+        )
+
+
+def scan_cases():
+    # A steering slider move: the scan cube of the (N, d) pair is already cached
+    for N in PLOT_SIZES:
+        for resolution in RESOLUTION_POLICIES:
+            angles = iter(range(181))
+            yield (f"steering slider N={N} {resolution}",
+                   lambda N=N, resolution=resolution, angles=angles:
+                   BeamSteering().plot(N, 0.5, next(angles), resolution=resolution))
+
+
+def wideband_cases():
+    for N in PLOT_SIZES:
+        for resolution in RESOLUTION_POLICIES:
+            yield (f"wideband N={N} {resolution}",
+                   lambda N=N, resolution=resolution:
+                   WidebandSweep().plot(N, 0.5, theta_steer_deg=30, resolution=resolution))
+
+
+def grating_map_cases():
+    for N in PLOT_SIZES:
+        yield f"grating map N={N}", lambda N=N: GratingLobeMap().plot(N, 0.5, frequency_ratio=1.2)
+
+
+def rerun_benchmark(repeats):
+    """Median time of a full ``main()`` rerun of the default view in the AppTest harness."""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP_PATH, default_timeout=300)
+    app.run()
+
+    def rerun():
+        app.run()
+        if app.exception:
+            raise RuntimeError(app.exception[0].message)
+
+    seconds, _ = median_time(rerun, repeats)
+    return seconds
+
+
+def import_benchmark(repeats):
+    """Median time of importing the app in a fresh interpreter."""
+    times = [
+        float(subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout)
+        for _ in range(repeats)
+    ]
+    return float(np.median(times))
+
+
+def run_suite(repeats, name_filter=""):
+    """Run every case whose name contains ``name_filter`` and return {case/stage: seconds}."""
+    results = {}
+    for cases, warm in ((plot_cases, False), (comparison_cases, False), (grid_cases, False), (scan_cases, True),
+                         (wideband_cases, False), (grating_map_cases, False)):
+        for name, make_figure in cases():
+            if name_filter.lower() in name.lower():
+                results.update(figure_cases(name, make_figure, repeats, warm))
+    if name_filter.lower() in IMPORT_CASE:
+        results[IMPORT_CASE] = import_benchmark(repeats)
+    if name_filter.lower() in RERUN_CASE:
+        results[RERUN_CASE] = rerun_benchmark(repeats)
+    return results
+
+
+def calibrate_fft(repeats):
+    """
+    Fit the coefficients of the FFT cost model to measured times.
+
+    Direct summation is timed per N · len(θ) term; the FFT path is fitted as
+    a·L·log₂ L + b·len(θ) + c by least squares, and a, b and c are returned
+    in units of one direct term.
+    """
+    direct, rows, fft = [], [], []
+    for num_points in FFT_BENCHMARK_POINTS:
+        theta = np.linspace(0, np.pi, num_points)
+        for N in FFT_BENCHMARK_SIZES:
+            weights = np.ones(N)
+            L = fft_size(N)
+            seconds, _ = median_time(lambda: direct_array_factor(weights, 0.5, theta), repeats)
+            direct.append(seconds / (N * num_points))
+            rows.append([L * np.log2(L), num_points, 1.0])
+            seconds, _ = median_time(lambda: fft_array_factor(weights, 0.5, theta), repeats)
+            fft.append(seconds)
+    term = float(np.median(direct))
+    coefficients, *_ = np.linalg.lstsq(np.array(rows), np.array(fft), rcond=None)
+    return dict(zip(('FFT_COST_PER_BUTTERFLY', 'FFT_COST_PER_ANGLE', 'FFT_COST_FIXED'),
+                    np.maximum(coefficients, 0) / term))
+
+
+def compare(results, baseline, threshold):
+    """Print a results table against the baseline and return the names of regressed cases."""
+    regressions = []
+    width = max(len(name) for name in results)
+    print(f"{'case':<{width}}  {'time (ms)':>10}  {'baseline':>10}  {'ratio':>6}")
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<{width}}  {1e3 * seconds:10.2f}  {'-':>10}  {'-':>6}")
+            continue
+        ratio = seconds / reference if reference > 0 else np.inf
+        regressed = ratio > 1 + threshold and seconds - reference > MIN_DELTA_S
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<{width}}  {1e3 * seconds:10.2f}  {1e3 * reference:10.2f}  {ratio:6.2f}{flag}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark plot compute, figure construction and app reruns.")
+    parser.add_argument("--repeats", type=int, default=5, help="Repeats per case (median is reported)")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction of the baseline")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET_S,
+                        help="Maximum cold import time of the app in seconds")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--calibrate-fft", action="store_true",
+                        help="Fit the direct/FFT cost model and print its constants instead of running the suite")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings('ignore')
+    if args.calibrate_fft:
+        for name, value in calibrate_fft(args.repeats).items():
+            print(f"{name} = {value:.3g}")
+        return
+    results = run_suite(args.repeats, args.filter)
+    if not results:
+        parser.error(f"No benchmark case matches {args.filter!r}")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)['cases']
+    regressions = compare(results, baseline, args.threshold)
+    over_budget = results.get(IMPORT_CASE, 0.0) > args.import_budget
+    if over_budget:
+        print(f"Cold import took {results[IMPORT_CASE]:.2f} s, over the {args.import_budget:.2f} s budget")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'machine': f"{platform.machine()} {platform.processor()} {os.cpu_count()} cores",
+                'python': platform.python_version(),
+                'cases': {**baseline, **results}
+            }, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    elif regressions or over_budget:
+        if regressions:
+            print(f"{len(regressions)} case(s) regressed by more than {100 * args.threshold:.0f}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
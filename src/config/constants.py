@@ -20,11 +20,109 @@ DISTINCT_COLORS = [
     '#17becf',  # cyan
 ]
 
-# Plot types
-PLOT_TYPES = [
-    "Basic Radiation Pattern",
-    "Beam Steering",
-    "Chebyshev Array",
-    "3D Array Factor",
-    "Grating Lobe Check"
-] 
\ No newline at end of file
+# Number of samples on the default θ grid for 1D patterns
+DEFAULT_THETA_POINTS = 1000
+
+# Default azimuth/elevation grid size for 3D patterns
+DEFAULT_GRID_POINTS = 100
+
+# Pattern cache limits (entries and total array bytes)
+PATTERN_CACHE_MAX_ENTRIES = 256
+PATTERN_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Upper bound on temporary steering-matrix entries per evaluation block
+ENGINE_CHUNK_ELEMENTS = 1 << 20
+
+# Configurations per chunk handed to a worker by the headless sweep runner
+BATCH_CHUNK_CONFIGS = 2048
+
+# Chunk memory maps a pattern store keeps open while browsing
+STORE_OPEN_CHUNKS = 64
+
+# Parameter sweep defaults
+SWEEP_PARAMETER_LABELS = {
+    'theta_steer': "Steering Angle θ₀ (degrees)",
+    'd': "Element Spacing (d/λ)",
+    'N': "Number of Elements (N)",
+    'beta': "Phase Shift β (rad)"
+}
+DEFAULT_SWEEP_STEPS = 181
+DB_FLOOR = -40
+
+# Angular resolution policies for 1D patterns
+RESOLUTION_POLICIES = ["adaptive", "fixed", "max-points"]
+DEFAULT_RESOLUTION = "adaptive"
+ADAPTIVE_POINTS_PER_LOBE = 16
+ADAPTIVE_MIN_POINTS = 181
+ADAPTIVE_REFINE_POINTS = 8
+# Default 'max-points' grid size, and cap for grids holding one row per
+# configuration (comparisons, scans, wideband maps); metrics are withheld on
+# grids with fewer samples per sidelobe width than MIN_POINTS_PER_LOBE
+MAX_THETA_POINTS = 20000
+MIN_POINTS_PER_LOBE = 4
+
+# Beam-steering scan cube: steering angles (degrees) precomputed per (N, d), and
+# the steering step and θ points per frame of the client-side scan animation
+SCAN_STEER_DEG = tuple(range(0, 181))
+SCAN_ANIMATION_STEP_DEG = 2
+SCAN_ANIMATION_POINTS = 2000
+
+# Array synthesis: u samples per null spacing of the steering matrix (at least
+# SYNTHESIS_MIN_POINTS), iteration limit, mask tolerance, null half-width in
+# null spacings, largest N, and control defaults
+SYNTHESIS_POINTS_PER_LOBE = 8
+SYNTHESIS_MIN_POINTS = 361
+SYNTHESIS_MAX_ITERATIONS = 300
+SYNTHESIS_TOLERANCE_DB = 0.1
+SYNTHESIS_NULL_WIDTH = 0.25
+MAX_SYNTHESIS_N = 512
+DEFAULT_SYNTHESIS_SLL_DB = -30
+DEFAULT_DYNAMIC_RANGE_DB = 20
+DEFAULT_NULL_DEPTH_DB = -60
+
+# Wideband sweep: limits and default of the band in f/f₀ (f₀ is the frequency
+# the phase taper is designed for) and the default number of frequencies
+WIDEBAND_RATIO_LIMITS = (0.1, 2.0)
+DEFAULT_WIDEBAND_BAND = (0.5, 1.5)
+DEFAULT_WIDEBAND_STEPS = 101
+
+# Grating lobe map: spacing axis (d/λ at f₀) and its number of points; the
+# steering axis has one point per degree
+GRATING_MAP_SPACING = (0.1, 2.0)
+GRATING_MAP_POINTS = 400
+
+# Selectable azimuth/elevation grid sizes for 3D patterns
+GRID_RESOLUTIONS = [50, 100, 200, 400, 600]
+
+# Planar array defaults
+DEFAULT_NY = 8
+DEFAULT_DY = 0.5
+DEFAULT_THETA0 = 0
+DEFAULT_PHI0 = 0
+
+# Custom geometry views
+GEOMETRY_VIEWS = ["3D", "Elevation Cut"]
+
+# Large-N mode: element limits and FFT evaluation settings
+MAX_N = 20
+MAX_LARGE_N = 10000
+FFT_OVERSAMPLE = 128
+# Cost model for choosing direct summation or the FFT path, in units of one
+# direct N·θ term; refit with `python -m benchmarks.run --calibrate-fft`
+FFT_COST_PER_BUTTERFLY = 0.1
+FFT_COST_PER_ANGLE = 0.96
+FFT_COST_FIXED = 2400
+FFT_BENCHMARK_SIZES = (4, 8, 16, 32, 64, 128, 256, 512, 1024)
+FFT_BENCHMARK_POINTS = (1001, 4001, 20001)
+
+# Figure payload optimization: array dtype sent to the browser, trace count
+# above which line traces use WebGL, LTTB target length for overlays, and the
+# display budget of main line traces (min and max of a bucket per pixel column)
+PAYLOAD_DTYPE = "float32"
+WEBGL_TRACE_THRESHOLD = 10
+OVERLAY_MAX_POINTS = 1000
+MAIN_TRACE_MAX_POINTS = 4000
+
+# Render profiling: log file stem (.jsonl and .csv are appended) and cProfile rows shown
+PROFILE_LOG_PATH = "logs/render_timings"
+PROFILE_TOP_FUNCTIONS = 30
@@ -0,0 +1,421 @@
+"""
+Pure-numpy array factor computations.
+
+Every function here returns plain numpy arrays and metadata in a dict so the
+math can be used from batch jobs, tests and other services without importing
+Streamlit or Plotly. The plot classes in ``src/plots`` render these results.
+"""
+import functools
+import numpy as np
+from src.config.constants import DEFAULT_THETA_POINTS, DEFAULT_GRID_POINTS, ENGINE_CHUNK_ELEMENTS, SCAN_STEER_DEG
+from src.engine.cache import cached_pattern
+from src.engine.directivity import uniform_directivity, tapered_directivity, to_dbi
+from src.engine.fft_pattern import linear_array_factor
+from src.engine.grating_lobes import max_spacing, max_scan_angle, grating_lobe_directions
+from src.engine.kernels import array_phase, dirichlet
+
+
+def theta_grid(num_points=DEFAULT_THETA_POINTS):
+    """Return the default θ grid in radians covering [0, π]."""
+    return np.linspace(0, np.pi, num_points)
+
+
+def normalize(AF, out=None):
+    """Normalize a pattern (or a stack of patterns along the last axis) to a peak of 1; ``out=AF`` works in place."""
+    return np.divide(AF, np.max(AF, axis=-1, keepdims=True), out=out)
+
+
+def uniform_pattern(N, d, theta, beta=0.0, dtype=np.float64):
+    """Normalized uniform array factor, evaluated in place in the phase buffer of ``dtype``."""
+    mu = array_phase(d, theta, beta, dtype)
+    return normalize(dirichlet(N, mu, out=mu), out=mu)
+
+
+def electrical_spacing(d, wavelength=1.0):
+    """
+    Spacing d·λ that enters the array phase 2πd cos θ.
+
+    This is the one place the ``wavelength`` parameter is applied: the
+    patterns, the sweep, the pattern store and the CLI all scale the spacing
+    with it here. Broadcasts over arrays.
+    """
+    return np.multiply(d, wavelength)
+
+
+def to_db(AF, floor_db=-60):
+    """Convert a normalized magnitude pattern to dB, clipped at ``floor_db``."""
+    return np.maximum(20 * np.log10(np.maximum(AF, 1e-300)), floor_db)
+
+
+@cached_pattern
+def radiation_pattern(N, d, beta=0, wavelength=1.0, theta=None):
+    """
+    Normalized pattern of a uniform linear array with progressive phase shift.
+
+    Parameters:
+    - N (int): Number of antenna elements
+    - d (float): Element spacing in wavelengths
+    - beta (float): Progressive phase shift in radians
+    - wavelength (float): Wavelength of operation
+    - theta (ndarray): Observation angles in radians, defaults to ``theta_grid()``
+
+    Returns:
+    - dict with ``theta``, the normalized ``af``, the intended main-beam
+      direction ``target_deg`` and the directivity ``directivity_dbi``
+    """
+    theta = theta_grid() if theta is None else theta
+    d_actual = electrical_spacing(d, wavelength)
+    return {
+        'theta': theta,
+        'af': uniform_pattern(N, d_actual, theta, beta),
+        'target_deg': main_beam_angle(d_actual, beta),
+        'directivity_dbi': to_dbi(uniform_directivity(N, d_actual, beta))
+    }
+
+
+def steering_phase(d, theta_steer_deg):
+    """Progressive phase shift β = -2πd cos(θ₀) that steers the main beam to θ₀."""
+    return -2 * np.pi * d * np.cos(np.radians(theta_steer_deg))
+
+
+def main_beam_angle(d, beta):
+    """Main-beam direction in degrees for phase shift β, NaN when it lies outside visible space."""
+    cos_theta0 = -np.asarray(beta, dtype=float) / (2 * np.pi * np.asarray(d, dtype=float))
+    visible = np.abs(cos_theta0) <= 1
+    return np.where(visible, np.degrees(np.arccos(np.clip(cos_theta0, -1, 1))), np.nan)
+
+
+@cached_pattern
+def beam_steering(N, d, theta_steer_deg, wavelength=1.0, theta=None):
+    """
+    Normalized pattern of a uniform linear array steered to ``theta_steer_deg``.
+
+    Parameters:
+    - N (int): Number of antenna elements
+    - d (float): Element spacing in wavelengths
+    - theta_steer_deg (float): Desired steering angle in degrees
+    - wavelength (float): Wavelength of operation
+    - theta (ndarray): Observation angles in radians, defaults to ``theta_grid()``
+
+    Returns:
+    - dict with ``theta``, the normalized ``af``, the applied phase shift
+      ``beta``, the intended main-beam direction ``target_deg`` and the
+      directivity ``directivity_dbi``
+    """
+    theta = theta_grid() if theta is None else theta
+    d_actual = electrical_spacing(d, wavelength)
+    beta = steering_phase(d_actual, theta_steer_deg)
+    return {
+        'theta': theta,
+        'af': uniform_pattern(N, d_actual, theta, beta),
+        'beta': beta,
+        'target_deg': theta_steer_deg,
+        'directivity_dbi': to_dbi(uniform_directivity(N, d_actual, beta))
+    }
+
+
+@cached_pattern
+def steering_scan(N, d, theta=None, steer_deg=SCAN_STEER_DEG, dtype=np.float32):
+    """
+    Beam-steering patterns of one array for a whole family of steering angles.
+
+    Steering only shifts a uniform array's pattern in u = cos θ, as
+    AF(u; θ₀) = D_N(2πd (u - cos θ₀)), so the scan is a single Dirichlet
+    evaluation over the (steering angle, u) grid. It is filled in row blocks
+    of at most ``ENGINE_CHUNK_ELEMENTS`` entries.
+
+    Parameters:
+    - N (int): Number of antenna elements
+    - d (float): Element spacing in wavelengths
+    - theta (ndarray): Observation angles in radians, defaults to ``theta_grid()``
+    - steer_deg (tuple): Steering angles in degrees, one cube row each
+    - dtype: Cube dtype; float32 halves memory for large N
+
+    Returns:
+    - dict with ``theta``, ``steer_deg``, the normalized ``af`` cube of shape
+      (len(steer_deg), len(theta)), the phase shifts ``beta`` and the
+      directivities ``directivity_dbi`` per steering angle
+    """
+    theta = theta_grid() if theta is None else theta
+    steer_deg = np.asarray(steer_deg, dtype=float)
+    beta = steering_phase(d, steer_deg)
+
+    AF = np.empty((len(steer_deg), len(theta)), dtype=dtype)
+    rows = max(1, ENGINE_CHUNK_ELEMENTS // len(theta))
+    work = np.empty((min(rows, len(AF)), len(theta)), dtype=dtype)
+    for start in range(0, len(AF), rows):
+        block = AF[start:start + rows]
+        np.multiply(2 * np.pi * d, np.cos(theta), out=block)
+        block += beta[start:start + rows, None]
+        dirichlet(N, block, out=block, work=work[:len(block)])
+    return {
+        'theta': theta,
+        'steer_deg': steer_deg,
+        'af': normalize(AF, out=AF),
+        'beta': beta,
+        'directivity_dbi': to_dbi(uniform_directivity(N, d, beta))
+    }
+
+
+@functools.lru_cache(maxsize=128)
+def chebyshev_weights(N, R_dB):
+    """
+    Dolph-Chebyshev amplitude taper for ``N`` elements and ``R_dB`` sidelobe level.
+
+    Memoized per (N, R_dB); the returned array is read-only because it is shared.
+    """
+    # Imported on first use: scipy.signal takes longer to import than the rest of the app
+    from scipy.signal.windows import chebwin
+
+    weights = chebwin(int(N), at=float(R_dB))
+    weights.setflags(write=False)
+    return weights
+
+
+def padded_chebyshev_weights(N, R_dB):
+    """
+    Chebyshev tapers for many configurations, zero-padded to the largest N.
+
+    Returns:
+    - ndarray of shape (M, max(N))
+    """
+    N, R_dB = np.broadcast_arrays(np.atleast_1d(N).astype(int), np.atleast_1d(R_dB))
+    weights = np.zeros((len(N), N.max()))
+    for i, (n_elements, r_db) in enumerate(zip(N, R_dB)):
+        weights[i, :n_elements] = chebyshev_weights(n_elements, r_db)
+    return weights
+
+
+@cached_pattern
+def chebyshev_directivity(N, d, R_dB):
+    """
+    Directivity in dBi of a Dolph-Chebyshev tapered linear array.
+
+    Cached on its own, without the θ grid in the key, so patterns of the same
+    array on several grids (such as the two passes of ``sample_pattern``)
+    share one computation.
+    """
+    return to_dbi(tapered_directivity(chebyshev_weights(N, R_dB), d))
+
+
+@cached_pattern
+def chebyshev_array(N, d, R_dB, wavelength=1.0, theta=None, method='auto'):
+    """
+    Normalized pattern of a Dolph-Chebyshev tapered linear array.
+
+    Parameters:
+    - N (int): Number of antenna elements
+    - d (float): Element spacing in wavelengths
+    - R_dB (float): Desired sidelobe level in decibels
+    - wavelength (float): Wavelength of operation
+    - theta (ndarray): Observation angles in radians, defaults to ``theta_grid()``
+    - method (str): 'auto', 'direct' or 'fft' evaluation of the weighted sum
+
+    Returns:
+    - dict with ``theta``, the normalized ``af``, the taper ``weights``, the
+      desired sidelobe level in linear scale ``sll`` and in dB
+      ``desired_sll_db``, the broadside ``target_deg`` and the directivity
+      ``directivity_dbi``
+    """
+    theta = theta_grid() if theta is None else theta
+    d_actual = electrical_spacing(d, wavelength)
+    weights = chebyshev_weights(N, R_dB)
+    AF = linear_array_factor(weights, d_actual, theta, method)
+    return {
+        'theta': theta,
+        'af': normalize(AF),
+        'weights': weights,
+        'sll': 10**(-R_dB/20),
+        'desired_sll_db': -R_dB,
+        'target_deg': 90.0,
+        'directivity_dbi': chebyshev_directivity(N, d_actual, R_dB)
+    }
+
+
+@cached_pattern
+def grating_lobe_check(N, d, wavelength, theta=None):
+    """
+    Normalized broadside pattern together with a grating lobe assessment.
+
+    The assessment is closed-form (see ``src.engine.grating_lobes``): it
+    locates the broadside grating lobes and the steering range that stays free
+    of grating lobes, with the lobes' null-to-null width included.
+
+    Parameters:
+    - N (int): Number of elements
+    - d (float): Element spacing in wavelengths
+    - wavelength (float): Wavelength of operation
+    - theta (ndarray): Observation angles in radians, defaults to ``theta_grid()``
+
+    Returns:
+    - dict with ``theta``, the normalized ``af``, ``critical_spacing`` (the
+      largest physical spacing that can scan to endfire without grating
+      lobes), ``d_actual``, ``has_grating_lobes`` (at broadside),
+      ``grating_lobe_angles`` (radians, empty when none are visible), the
+      grating-lobe-free steering range ``scan_range_deg`` (NaN when grating
+      lobes are visible at broadside), the broadside ``target_deg`` and the
+      directivity ``directivity_dbi``
+    """
+    critical_spacing = electrical_spacing(max_spacing(0.0, N), wavelength)
+    d_actual = electrical_spacing(d, wavelength)
+
+    theta = theta_grid() if theta is None else theta
+    AF = uniform_pattern(N, d, theta)
+
+    _, lobes = grating_lobe_directions(d, 0.0)
+    grating_lobe_angles = np.sort(np.radians(lobes[:, 0]))
+
+    return {
+        'theta': theta,
+        'af': AF,
+        'critical_spacing': critical_spacing,
+        'd_actual': d_actual,
+        'has_grating_lobes': len(grating_lobe_angles) > 0,
+        'grating_lobe_angles': grating_lobe_angles,
+        'scan_range_deg': tuple(float(angle) for angle in max_scan_angle(d, N)),
+        'target_deg': 90.0,
+        'directivity_dbi': to_dbi(uniform_directivity(N, d))
+    }
+
+
+@cached_pattern
+def array_factor_3d(N, d, wavelength=1.0, num_az=DEFAULT_GRID_POINTS, num_el=DEFAULT_GRID_POINTS,
+                    dtype=np.float32):
+    """
+    Normalized array factor of a linear array over an azimuth/elevation grid.
+
+    The array lies along the z axis, so the pattern is rotationally symmetric
+    and depends on elevation only: the 1D elevation cut is computed once and
+    broadcast across azimuth instead of being evaluated on the full mesh.
+
+    Parameters:
+    - N (int): Number of elements
+    - d (float): Element spacing in wavelengths
+    - wavelength (float): Wavelength of operation, scales the physical spacing
+    - num_az (int): Number of azimuth samples over [0, 2π]
+    - num_el (int): Number of elevation samples over [0, π]
+    - dtype: Output dtype; float32 halves memory and plot payload size
+
+    Returns:
+    - dict with the ``az`` and ``el`` axes (radians), the normalized elevation
+      ``cut``, the ``af`` grid (el × az) and its Cartesian surface coordinates
+      ``x``, ``y`` and ``z``
+    """
+    az = np.linspace(0, 2 * np.pi, num_az)
+    el = np.linspace(0, np.pi, num_el)
+    shape = (num_el, num_az)
+
+    cut = uniform_pattern(N, electrical_spacing(d, wavelength), el, dtype=dtype)
+    radius = cut * np.sin(el)
+
+    return {
+        'az': az,
+        'el': el,
+        'cut': cut.astype(dtype),
+        'af': np.broadcast_to(cut.astype(dtype)[:, None], shape),
+        'x': np.outer(radius, np.cos(az)).astype(dtype),
+        'y': np.outer(radius, np.sin(az)).astype(dtype),
+        'z': np.broadcast_to((cut * np.cos(el)).astype(dtype)[:, None], shape)
+    }
+
+
+def _column(values):
+    """Broadcast a scalar or 1D parameter array to a column against the θ axis."""
+    return np.asarray(values, dtype=float)[..., np.newaxis]
+
+
+@cached_pattern
+def radiation_pattern_batch(N, d, beta=0, wavelength=1.0, theta=None):
+    """
+    Batched ``radiation_pattern`` for many configurations in one broadcast.
+
+    Each parameter may be a scalar or a 1D array of length M; all arrays must
+    share the same length.
+
+    Returns:
+    - dict with the shared ``theta``, the normalized ``af`` of shape
+      (M, len(theta)), the intended main-beam directions ``target_deg`` and
+      the directivities ``directivity_dbi``
+    """
+    theta = theta_grid() if theta is None else theta
+    d_actual = electrical_spacing(d, wavelength)
+    return {
+        'theta': theta,
+        'af': uniform_pattern(_column(N), _column(d_actual), theta, _column(beta)),
+        'target_deg': main_beam_angle(d_actual, beta),
+        'directivity_dbi': to_dbi(uniform_directivity(N, d_actual, beta))
+    }
+
+
+@cached_pattern
+def beam_steering_batch(N, d, theta_steer_deg, wavelength=1.0, theta=None):
+    """
+    Batched ``beam_steering`` for many configurations in one broadcast.
+
+    Returns:
+    - dict with the shared ``theta``, the normalized ``af`` of shape
+      (M, len(theta)), the applied phase shifts ``beta``, ``target_deg`` and
+      the directivities ``directivity_dbi``
+    """
+    theta = theta_grid() if theta is None else theta
+    d_actual = electrical_spacing(d, wavelength)
+    beta = steering_phase(_column(d_actual), _column(theta_steer_deg))
+    return {
+        'theta': theta,
+        'af': uniform_pattern(_column(N), _column(d_actual), theta, beta),
+        'beta': beta[..., 0],
+        'target_deg': np.asarray(theta_steer_deg, dtype=float),
+        'directivity_dbi': to_dbi(uniform_directivity(N, d_actual, beta[..., 0]))
+    }
+
+
+@cached_pattern
+def chebyshev_array_batch(N, d, R_dB, wavelength=1.0, theta=None, method='auto'):
+    """
+    Batched ``chebyshev_array`` for many configurations.
+
+    Taper weights are zero-padded to the largest N so every configuration is
+    evaluated in one stacked call, by direct summation or per-row FFTs.
+
+    Returns:
+    - dict with the shared ``theta``, the normalized ``af`` of shape
+      (M, len(theta)), ``desired_sll_db``, the broadside ``target_deg`` and
+      the directivities ``directivity_dbi`` (one autocorrelation batch)
+    """
+    theta = theta_grid() if theta is None else theta
+    N, d, R_dB = np.broadcast_arrays(np.atleast_1d(N), np.atleast_1d(electrical_spacing(d, wavelength)),
+                                     np.atleast_1d(R_dB))
+    weights = padded_chebyshev_weights(N, R_dB)
+
+    AF = linear_array_factor(weights, d, theta, method)
+    return {
+        'theta': theta,
+        'af': normalize(AF),
+        'desired_sll_db': -R_dB.astype(float),
+        'target_deg': np.full(len(N), 90.0),
+        'directivity_dbi': to_dbi(tapered_directivity(weights, d))
+    }
+
+
+@cached_pattern
+def grating_lobe_check_batch(N, d, wavelength, theta=None):
+    """
+    Batched broadside patterns matching ``grating_lobe_check``.
+
+    As in the single-configuration version the pattern depends only on N and
+    d/λ; ``wavelength`` is accepted so comparison parameters can be passed
+    through unchanged.
+
+    Returns:
+    - dict with the shared ``theta``, the normalized ``af`` of shape
+      (M, len(theta)), the broadside ``target_deg`` and the directivities
+      ``directivity_dbi``
+    """
+    theta = theta_grid() if theta is None else theta
+    AF = uniform_pattern(_column(N), _column(d), theta)
+    return {
+        'theta': theta,
+        'af': AF,
+        'target_deg': np.full(len(AF), 90.0),
+        'directivity_dbi': to_dbi(uniform_directivity(N, d))
+    }
@@ -0,0 +1,110 @@
+"""
+Headless, multi-process parameter sweeps.
+
+A sweep spec names the values of every axis in ``SWEEP_PARAMETERS``; the
+flattened configurations are split into chunks that worker processes evaluate
+with the same ``sweep_block`` used by the Parameter Sweep plot. Workers write
+their chunk straight into a pattern store (see ``src.engine.store``), so
+nothing large is pickled back to the parent, and the parent registers each
+chunk in the store manifest as soon as it finishes.
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from src.config.constants import DEFAULT_THETA_POINTS, BATCH_CHUNK_CONFIGS
+from src.engine.array_factor import theta_grid
+from src.engine.store import PatternStoreWriter, chunk_names
+from src.engine.sweep import SWEEP_PARAMETERS, sweep_axes, sweep_configurations, sweep_block, sweep_directivity
+
+
+def _axis_values(value):
+    """Expand ``{"start", "stop", "num"}`` ranges; lists and scalars pass through."""
+    if isinstance(value, dict):
+        return np.linspace(value['start'], value['stop'], int(value['num'])).tolist()
+    return value
+
+
+def load_spec(source):
+    """
+    Read a sweep spec from a JSON file path or a dict.
+
+    Axis entries may be scalars, lists or ``{"start", "stop", "num"}`` ranges;
+    ``null`` means no steering for ``theta_steer`` and uniform weighting for
+    ``R_dB``. Optional keys are ``theta_points`` and ``dtype``.
+
+    Returns:
+    - dict with the sweep ``axes``, ``theta_points`` and ``dtype``
+    """
+    if not isinstance(source, dict):
+        with open(source) as f:
+            source = json.load(f)
+    unknown = set(source) - set(SWEEP_PARAMETERS) - {'theta_points', 'dtype'}
+    if unknown:
+        raise ValueError(f"Unknown sweep spec keys: {sorted(unknown)}")
+
+    params = {name: _axis_values(source[name]) for name in SWEEP_PARAMETERS if name in source}
+    return {
+        'axes': sweep_axes(**params),
+        'theta_points': int(source.get('theta_points', DEFAULT_THETA_POINTS)),
+        'dtype': source.get('dtype', 'float32')
+    }
+
+
+def run_chunk(axes, start, stop, theta_points, dtype, output_dir, index):
+    """
+    Evaluate configurations ``start:stop`` and save them as chunk ``index``.
+
+    Runs in a worker process; returns ``(index, start, stop)``.
+    """
+    params = sweep_configurations(axes, start, stop)
+    af_name, directivity_name = chunk_names(index)
+    np.save(os.path.join(output_dir, af_name), sweep_block(params, theta_grid(theta_points)).astype(dtype))
+    np.save(os.path.join(output_dir, directivity_name), sweep_directivity(params))
+    return index, start, stop
+
+
+def run_sweep(spec, output_dir, workers=None, chunk_configs=BATCH_CHUNK_CONFIGS, progress=None):
+    """
+    Run a sweep across a process pool into a pattern store.
+
+    Parameters:
+    - spec (dict): Sweep spec as returned by ``load_spec``
+    - output_dir (str): Pattern store directory
+    - workers (int): Number of worker processes, ``os.cpu_count()`` when None
+      and in-process evaluation when 0
+    - chunk_configs (int): Configurations per chunk
+    - progress (callable): Called as ``progress(done, total, elapsed)`` after
+      every chunk
+
+    Returns:
+    - dict with the final store manifest
+    """
+    axes = spec['axes']
+    total = int(np.prod([len(axes[name]) for name in SWEEP_PARAMETERS]))
+    writer = PatternStoreWriter(output_dir, axes, theta_grid(spec['theta_points']), spec['dtype'])
+    args = [(axes, start, min(start + chunk_configs, total), spec['theta_points'], spec['dtype'], output_dir, i)
+            for i, start in enumerate(range(0, total, chunk_configs))]
+
+    done = 0
+    started = time.perf_counter()
+
+    def finished(index, start, stop):
+        nonlocal done
+        writer.add_chunk(index, start, stop)
+        done += stop - start
+        if progress:
+            progress(done, total, time.perf_counter() - started)
+
+    if workers == 0:
+        for chunk_args in args:
+            finished(*run_chunk(*chunk_args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_chunk, *chunk_args) for chunk_args in args]
+            for future in as_completed(futures):
+                finished(*future.result())
+
+    writer.close(elapsed_s=time.perf_counter() - started)
+    return writer.manifest
@@ -0,0 +1,218 @@
+"""
+Parameter-keyed memoization for pattern computations.
+
+Streamlit reruns the whole script on every widget change, so the same
+(N, d, ...) configurations are requested over and over. ``PatternCache``
+keeps recently computed results in memory with an LRU policy bounded by
+both entry count and total array bytes. The cache is shared by every
+Streamlit session thread, so all of its bookkeeping runs under a lock.
+"""
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from src.config.constants import PATTERN_CACHE_MAX_ENTRIES, PATTERN_CACHE_MAX_BYTES
+
+
+def _freeze(value):
+    """Turn an argument into a hashable cache key component."""
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.shape, value.dtype.str, hash(value.tobytes()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze(value[k])) for k in sorted(value))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def result_nbytes(result):
+    """Approximate memory footprint of a cached result in bytes."""
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, dict):
+        return sum(result_nbytes(v) for v in result.values())
+    if isinstance(result, (list, tuple)):
+        return sum(result_nbytes(v) for v in result)
+    return 0
+
+
+def _arrays(value):
+    """Every ndarray in an argument, including those nested in lists, tuples and dicts."""
+    if isinstance(value, np.ndarray):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from _arrays(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _arrays(v)
+
+
+def _make_read_only(result, inputs=()):
+    """
+    Lock cached arrays so callers cannot corrupt shared entries.
+
+    Arrays that share memory with a writeable array of ``inputs`` (the
+    caller's arguments, such as a ``theta`` passed through into the result)
+    are copied first, so only arrays owned by the cache are frozen.
+    """
+    if isinstance(result, np.ndarray):
+        if any(array.flags.writeable and np.may_share_memory(result, array) for array in inputs):
+            result = result.copy()
+        result.setflags(write=False)
+    elif isinstance(result, dict):
+        for k, v in result.items():
+            result[k] = _make_read_only(v, inputs)
+    elif isinstance(result, list):
+        result[:] = [_make_read_only(v, inputs) for v in result]
+    elif isinstance(result, tuple):
+        result = tuple(_make_read_only(v, inputs) for v in result)
+    return result
+
+
+class PatternCache:
+    """
+    LRU cache with an entry limit and a byte budget.
+
+    Parameters:
+    - max_entries (int): Maximum number of cached results
+    - max_bytes (int): Maximum total size of cached arrays in bytes
+    """
+
+    def __init__(self, max_entries=PATTERN_CACHE_MAX_ENTRIES, max_bytes=PATTERN_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Counters of the calling thread only, so each session's rerun can
+        # attribute its own lookups while other sessions use the cache
+        self._local = threading.local()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Wall time spent computing results on cache misses
+        self.compute_seconds = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _thread_counters(self):
+        counters = getattr(self._local, 'counters', None)
+        if counters is None:
+            counters = self._local.counters = {'hits': 0, 'misses': 0, 'compute_seconds': 0.0}
+        return counters
+
+    def get(self, key, default=None):
+        """Return the cached value for ``key`` and mark it as recently used."""
+        counters = self._thread_counters()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                counters['misses'] += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            counters['hits'] += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """Store ``value`` under ``key`` and evict old entries if over budget."""
+        size = result_nbytes(value)
+        if size > self.max_bytes:
+            # Never cache something that would flush everything else
+            return value
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            self._evict()
+        return value
+
+    def add_compute_time(self, seconds):
+        """Add the wall time of a miss's computation to ``compute_seconds``."""
+        self._thread_counters()['compute_seconds'] += seconds
+        with self._lock:
+            self.compute_seconds += seconds
+
+    def _evict(self):
+        """Drop least recently used entries until within budget; the caller holds the lock."""
+        while self._entries and (len(self._entries) > self.max_entries or self.nbytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.nbytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.compute_seconds = 0.0
+
+    def thread_stats(self):
+        """Hits, misses and compute seconds of the lookups made by the calling thread, ever increasing."""
+        return dict(self._thread_counters())
+
+    def stats(self):
+        """Return the hit/miss counters and memory usage as a dict."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'compute_seconds': self.compute_seconds,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+# Shared cache used by the engine functions; it lives as long as the Python
+# process, so it survives Streamlit reruns.
+pattern_cache = PatternCache()
+
+
+def cached_pattern(func=None, cache=None):
+    """
+    Memoize an engine function in ``cache`` (defaults to ``pattern_cache``).
+
+    Arguments are bound against the function signature with defaults applied,
+    so positional and keyword calls share cache entries. Returned arrays are
+    made read-only because the same objects are handed to every caller;
+    arrays that alias a writeable argument are copied first.
+    """
+    if func is None:
+        return functools.partial(cached_pattern, cache=cache)
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        target = pattern_cache if cache is None else cache
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__module__, func.__qualname__, _freeze(bound.arguments))
+        result = target.get(key)
+        if result is None:
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            target.add_compute_time(time.perf_counter() - start)
+            inputs = list(_arrays(bound.arguments))
+            result = target.put(key, _make_read_only(result, inputs))
+        return result
+
+    wrapper.uncached = func
+    return wrapper
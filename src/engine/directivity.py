@@ -0,0 +1,157 @@
+"""
+Directivity of linear arrays of isotropic elements.
+
+With u = cos θ and ψ = 2πd u + β, directivity is
+
+    D = 2 max|AF|² / ∫₋₁¹ |AF(u)|² du
+
+Expanding |AF|² = Σₚ rₚ exp(jpψ) over the weight autocorrelation
+rₚ = Σₙ wₙ₊ₚ conj(wₙ) turns the integral into the series
+2 Re[r₀ + 2 Σₚ₌₁ rₚ sinc(2πpd) exp(jpβ)]. For uniform weighting rₚ = N - p,
+the classic closed form; for tapered weights rₚ comes from one zero-padded
+FFT per array, so the cost is O(N log N) and independent of d.
+"""
+import numpy as np
+from src.config.constants import ENGINE_CHUNK_ELEMENTS
+from src.engine.fft_pattern import linear_array_factor
+from src.engine.kernels import dirichlet_power
+
+
+def to_dbi(D):
+    """Directivity ratio to dBi."""
+    with np.errstate(divide='ignore'):
+        return 10 * np.log10(D)
+
+
+def _sinc(x):
+    """sin(x)/x with the x = 0 limit."""
+    return np.sinc(x / np.pi)
+
+
+def _beam_hidden(lo, hi):
+    """True where no main or grating lobe ψ = 2πk lies in the visible range [lo, hi] of ψ."""
+    return np.floor(hi / (2 * np.pi)) < np.ceil(lo / (2 * np.pi))
+
+
+def uniform_peak_power(N, d, beta, samples_per_lobe=64):
+    """
+    max|AF|² of a uniform array over visible space.
+
+    N² when ψ = 2πk is reachable for some u ∈ [-1, 1]. Otherwise the largest
+    lobe in view is a sidelobe and the visible ψ range is sampled densely
+    (``samples_per_lobe`` per 2π/N) for those configurations only.
+    """
+    N, kd, beta = np.broadcast_arrays(np.asarray(N, dtype=float), 2 * np.pi * np.asarray(d, dtype=float),
+                                      np.asarray(beta, dtype=float))
+    lo, hi = beta - kd, beta + kd
+    peak = np.asarray(N**2, dtype=float).copy()
+
+    hidden = _beam_hidden(lo, hi)
+    if hidden.any():
+        lobes = np.ceil(kd[hidden] * N[hidden] / np.pi).max()
+        fraction = np.linspace(0, 1, int(samples_per_lobe * lobes) + 1)
+        psi = lo[hidden][:, None] + (hi - lo)[hidden][:, None] * fraction
+        peak[hidden] = dirichlet_power(N[hidden][:, None], psi).max(axis=-1)
+    return peak
+
+
+def uniform_directivity(N, d, beta=0.0):
+    """
+    Directivity (ratio) of uniform linear arrays from the closed-form series.
+
+    Parameters:
+    - N (int or array): Number of elements
+    - d (float or array): Element spacing in wavelengths
+    - beta (float or array): Progressive phase shift in radians
+
+    All parameters broadcast against each other; the result has their
+    broadcast shape.
+    """
+    N, d, beta = np.broadcast_arrays(np.asarray(N, dtype=float), np.asarray(d, dtype=float),
+                                     np.asarray(beta, dtype=float))
+    p = np.arange(1, int(N.max()) if N.size else 1)
+    terms = (N[..., None] - p) * _sinc(2 * np.pi * p * d[..., None]) * np.cos(p * beta[..., None])
+    terms = np.where(p < N[..., None], terms, 0.0)
+    integral = N + 2 * terms.sum(axis=-1)
+    return 2 * uniform_peak_power(N, d, beta) / (2 * integral)
+
+
+def _sampled_peak_power(weights, d, beta, samples_per_lobe=64, chunk_elements=ENGINE_CHUNK_ELEMENTS):
+    """
+    max|AF|² of weighted arrays sampled over visible space.
+
+    The u axis is sampled with ``samples_per_lobe`` points per null spacing
+    1/(Nd) of the longest array, and rows are evaluated in blocks of at most
+    ``chunk_elements`` pattern samples.
+    """
+    N = weights.shape[-1]
+    phased = weights * np.exp(1j * np.arange(N) * beta[:, None])
+    lobes = int(np.ceil(2 * N * d.max()))
+    theta = np.arccos(np.linspace(-1, 1, samples_per_lobe * lobes + 1))
+
+    peak = np.empty(len(weights))
+    rows = max(1, chunk_elements // len(theta))
+    for start in range(0, len(weights), rows):
+        stop = start + rows
+        peak[start:stop] = linear_array_factor(phased[start:stop], d[start:stop], theta).max(axis=-1)**2
+    return peak
+
+
+def tapered_directivity(weights, d, beta=0.0, chunk_elements=ENGINE_CHUNK_ELEMENTS):
+    """
+    Directivity (ratio) of weighted linear arrays from the weight autocorrelation.
+
+    Parameters:
+    - weights (ndarray): Element weights, shape (N,) or (M, N); shorter
+      arrays can be zero-padded
+    - d (float or ndarray): Element spacing in wavelengths, scalar or (M,)
+    - beta (float or ndarray): Progressive phase shift in radians, scalar or (M,)
+    - chunk_elements (int): Maximum number of autocorrelation samples per block
+
+    The peak is taken at the main-beam direction -β/(2πd) when it is visible
+    and the weights are non-negative real (where it is exact); otherwise the
+    pattern is sampled over visible space for those rows only.
+
+    Returns:
+    - float for 1D weights, otherwise an (M,) array
+    """
+    from scipy import fft as sp_fft
+
+    weights = np.asarray(weights)
+    single = weights.ndim == 1
+    weights = np.atleast_2d(weights)
+    M, N = weights.shape
+    d = np.broadcast_to(np.asarray(d, dtype=float), (M,))
+    beta = np.broadcast_to(np.asarray(beta, dtype=float), (M,))
+    complex_weights = np.iscomplexobj(weights)
+    n = np.arange(N)
+    L = sp_fft.next_fast_len(2 * N - 1)
+
+    integral = np.empty(M)
+    peak = np.empty(M)
+    rows = max(1, chunk_elements // L)
+    for start in range(0, M, rows):
+        stop = start + rows
+        w = weights[start:stop]
+        # rₚ = Σₙ wₙ₊ₚ conj(wₙ) from one zero-padded FFT per row
+        if complex_weights:
+            r = sp_fft.ifft(np.abs(sp_fft.fft(w, n=L, axis=-1))**2, axis=-1)[:, :N]
+        else:
+            r = sp_fft.irfft(np.abs(sp_fft.rfft(w, n=L, axis=-1))**2, n=L, axis=-1)[:, :N]
+        series = r * np.exp(1j * n * beta[start:stop, None]) * _sinc(2 * np.pi * n * d[start:stop, None])
+        integral[start:stop] = 2 * (2 * series.real.sum(axis=-1) - r[:, 0].real)
+
+        u_beam = np.clip(-beta[start:stop] / (2 * np.pi * d[start:stop]), -1, 1)
+        psi = 2 * np.pi * d[start:stop] * u_beam + beta[start:stop]
+        peak[start:stop] = np.abs((w * np.exp(1j * n * psi[:, None])).sum(axis=-1))**2
+
+    sampled = _beam_hidden(beta - 2 * np.pi * d, beta + 2 * np.pi * d)
+    if complex_weights:
+        sampled[:] = True
+    else:
+        sampled |= (weights < 0).any(axis=-1)
+    if sampled.any():
+        peak[sampled] = np.maximum(peak[sampled], _sampled_peak_power(weights[sampled], d[sampled], beta[sampled]))
+
+    D = 2 * peak / integral
+    return D[0] if single else D
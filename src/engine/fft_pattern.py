@@ -0,0 +1,147 @@
+"""
+FFT-based array factor for linear arrays with thousands of elements.
+
+For a linear array with arbitrary weights, AF(ψ) = Σ wₙ exp(jnψ) with
+ψ = 2πd cos θ is a trigonometric polynomial, so a single zero-padded FFT of
+the weights samples it on a dense uniform ψ grid. The pattern is then mapped
+onto the requested θ values by linear interpolation of the complex samples.
+That costs O(L log L + len(θ)) instead of O(N · len(θ)) for direct summation;
+``select_method`` picks the cheaper path from a static cost model whose
+coefficients are calibrated offline with ``python -m benchmarks.run --calibrate-fft``.
+"""
+import numpy as np
+from src.config.constants import (
+    ENGINE_CHUNK_ELEMENTS, FFT_OVERSAMPLE, FFT_COST_PER_BUTTERFLY, FFT_COST_PER_ANGLE, FFT_COST_FIXED
+)
+
+
+def fft_size(N, oversample=FFT_OVERSAMPLE):
+    """Zero-padded FFT length giving ``oversample`` samples per ψ-space null spacing."""
+    # Imported on first use to keep scipy out of the app's cold start
+    from scipy import fft as sp_fft
+
+    return sp_fft.next_fast_len(int(oversample * N))
+
+
+def _as_rows(weights, d):
+    """Promote weights to (M, N) and spacings to (M,) for row-wise evaluation."""
+    weights = np.asarray(weights)
+    single = weights.ndim == 1
+    weights = np.atleast_2d(weights)
+    d = np.broadcast_to(np.asarray(d, dtype=float), (len(weights),))
+    return weights, d, single
+
+
+def fft_array_factor(weights, d, theta, oversample=FFT_OVERSAMPLE, chunk_elements=ENGINE_CHUNK_ELEMENTS):
+    """
+    |Σ wₙ exp(j2πnd cos θ)| via a zero-padded FFT in ψ-space and interpolation onto θ.
+
+    Parameters:
+    - weights (ndarray): Element weights, shape (N,) or (M, N) for M arrays
+    - d (float or ndarray): Element spacing in wavelengths, scalar or shape (M,)
+    - theta (ndarray): Observation angles in radians, 1D
+    - oversample (int): FFT samples per null spacing; the default of 128 keeps
+      the interpolation error below about -95 dB of the peak
+    - chunk_elements (int): Maximum number of spectrum samples held at once
+
+    Returns:
+    - ndarray of |AF| with shape (len(theta),) or (M, len(theta)), not normalized
+    """
+    from scipy import fft as sp_fft
+
+    weights, d, single = _as_rows(weights, d)
+    theta = np.asarray(theta, dtype=float)
+    N = weights.shape[-1]
+    L = fft_size(N, oversample)
+    cos_theta = np.cos(theta)
+
+    # Referencing the phase to the array centre removes the exp(j(N-1)ψ/2)
+    # ramp, so neighbouring samples are nearly in phase and interpolating
+    # between them does not dip in magnitude. Index L is ψ = 2π (the wrap).
+    centre = np.exp(-1j * np.pi * (N - 1) * np.arange(L + 1) / L)
+
+    AF = np.empty((len(weights), len(theta)))
+    block = max(1, chunk_elements // L)
+    for start in range(0, len(weights), block):
+        stop = start + block
+        # L * ifft gives Σ wₙ exp(+j2πnk/L), i.e. AF sampled at ψₖ = 2πk/L
+        spectrum = sp_fft.ifft(weights[start:stop], n=L, axis=-1) * L
+        spectrum = np.concatenate([spectrum, spectrum[:, :1]], axis=-1) * centre
+
+        position = np.mod(d[start:stop, None] * cos_theta, 1.0) * L
+        index = np.minimum(position.astype(int), L - 1)
+        frac = position - index
+        lower = np.take_along_axis(spectrum, index, axis=-1)
+        upper = np.take_along_axis(spectrum, index + 1, axis=-1)
+        AF[start:stop] = np.abs(lower + (upper - lower) * frac)
+
+    return AF[0] if single else AF
+
+
+def direct_array_factor(weights, d, theta, chunk_elements=ENGINE_CHUNK_ELEMENTS):
+    """
+    |Σ wₙ exp(j2πnd cos θ)| by direct summation as a stacked matrix product.
+
+    Accepts the same shapes as ``fft_array_factor``; rows are processed in
+    blocks so the steering tensor stays below ``chunk_elements`` entries.
+    """
+    weights, d, single = _as_rows(weights, d)
+    theta = np.asarray(theta, dtype=float)
+    n = np.arange(weights.shape[-1])
+    cos_theta = np.cos(theta)
+
+    AF = np.empty((len(weights), len(theta)))
+    per_row = weights.shape[-1] * len(theta)
+    rows = max(1, chunk_elements // per_row)
+    if per_row > chunk_elements:
+        # A single row does not fit: split θ instead
+        cols = max(1, chunk_elements // weights.shape[-1])
+        for i in range(len(weights)):
+            for start in range(0, len(theta), cols):
+                stop = start + cols
+                steering = np.exp(1j * 2 * np.pi * d[i] * np.outer(cos_theta[start:stop], n))
+                AF[i, start:stop] = np.abs(steering @ weights[i])
+    else:
+        for start in range(0, len(weights), rows):
+            stop = start + rows
+            steering = np.exp(1j * 2 * np.pi * d[start:stop, None, None] * n[None, :, None] * cos_theta)
+            AF[start:stop] = np.abs(np.matmul(weights[start:stop, None, :], steering)[:, 0, :])
+
+    return AF[0] if single else AF
+
+
+def fft_cost(N, num_points, oversample=FFT_OVERSAMPLE):
+    """
+    Modelled cost of ``fft_array_factor`` in units of one direct-summation term.
+
+    The FFT costs about L·log₂ L and the interpolation onto θ a fixed amount
+    per angle; the coefficients in ``src.config.constants`` are measured
+    relative to one exp-multiply-add of ``direct_array_factor``, whose cost
+    is therefore N · num_points.
+    """
+    L = fft_size(N, oversample)
+    return FFT_COST_PER_BUTTERFLY * L * np.log2(L) + FFT_COST_PER_ANGLE * num_points + FFT_COST_FIXED
+
+
+def select_method(N, num_points):
+    """Pick 'fft' or 'direct' for an N-element array evaluated at ``num_points`` angles."""
+    return 'fft' if fft_cost(N, num_points) < N * num_points else 'direct'
+
+
+def linear_array_factor(weights, d, theta, method='auto'):
+    """
+    Unnormalized |AF| of weighted linear arrays using the cheaper evaluation path.
+
+    Parameters:
+    - weights (ndarray): Element weights, shape (N,) or (M, N)
+    - d (float or ndarray): Element spacing in wavelengths
+    - theta (ndarray): Observation angles in radians, 1D
+    - method (str): 'auto', 'direct' or 'fft'
+    """
+    if method == 'auto':
+        method = select_method(np.shape(weights)[-1], np.size(theta))
+    if method == 'fft':
+        return fft_array_factor(weights, d, theta)
+    if method == 'direct':
+        return direct_array_factor(weights, d, theta)
+    raise ValueError(f"Unknown array factor method: {method!r}")
@@ -0,0 +1,184 @@
+"""
+Array factor of arbitrary element geometries.
+
+Conformal, sparse, thinned or perturbed layouts are described by an explicit
+list of element positions rₙ (in wavelengths) and complex weights wₙ. The
+pattern AF(k̂) = |Σ wₙ exp(j2π k̂·rₙ)| is evaluated as a steering-matrix
+product over blocks of directions and elements, so the temporary matrix never
+exceeds ``ENGINE_CHUNK_ELEMENTS`` entries even for 10k-element arrays on
+dense direction grids.
+"""
+import io
+import numpy as np
+from src.config.constants import ENGINE_CHUNK_ELEMENTS, DEFAULT_GRID_POINTS
+from src.engine.array_factor import theta_grid
+from src.engine.cache import cached_pattern
+
+
+def ula_geometry(N, d):
+    """Positions of an N-element linear array along z with spacing d (wavelengths)."""
+    positions = np.zeros((N, 3))
+    positions[:, 2] = np.arange(N) * d
+    return positions
+
+
+def parse_geometry(table):
+    """
+    Split a numeric table into element positions and complex weights.
+
+    Columns are x, y[, z[, amplitude[, phase in degrees]]]; missing z is 0 and
+    missing amplitude/phase default to uniform weighting.
+
+    Returns:
+    - (positions, weights) with shapes (M, 3) and (M,)
+    """
+    table = np.atleast_2d(np.asarray(table, dtype=float))
+    if table.shape[1] < 2 or table.shape[1] > 5:
+        raise ValueError("Geometry must have 2 to 5 columns: x, y[, z[, amplitude[, phase_deg]]]")
+
+    positions = np.zeros((len(table), 3))
+    positions[:, :min(table.shape[1], 3)] = table[:, :3]
+    amplitude = table[:, 3] if table.shape[1] > 3 else np.ones(len(table))
+    phase = np.radians(table[:, 4]) if table.shape[1] > 4 else np.zeros(len(table))
+    return positions, amplitude * np.exp(1j * phase)
+
+
+def load_geometry(source, filename):
+    """
+    Load element positions and weights from a CSV or NPY file.
+
+    Parameters:
+    - source: Path or binary file-like object
+    - filename (str): File name, used to pick the format from its extension
+
+    Returns:
+    - (positions, weights) as returned by ``parse_geometry``
+    """
+    if filename.lower().endswith('.npy'):
+        if hasattr(source, 'read'):
+            source = io.BytesIO(source.read())
+        return parse_geometry(np.load(source, allow_pickle=False))
+
+    if hasattr(source, 'read'):
+        text = source.read()
+        text = text.decode() if isinstance(text, bytes) else text
+    else:
+        with open(source) as f:
+            text = f.read()
+
+    # Skip a header row if the first line is not numeric
+    first_line = text.lstrip().splitlines()[0] if text.strip() else ''
+    try:
+        [float(v) for v in first_line.split(',')]
+        skiprows = 0
+    except ValueError:
+        skiprows = 1
+    return parse_geometry(np.loadtxt(io.StringIO(text), delimiter=',', skiprows=skiprows, ndmin=2))
+
+
+def direction_vectors(theta, phi):
+    """Unit direction vectors k̂ for polar angles ``theta`` and azimuths ``phi`` (radians)."""
+    theta, phi = np.broadcast_arrays(theta, phi)
+    return np.stack([
+        np.sin(theta) * np.cos(phi),
+        np.sin(theta) * np.sin(phi),
+        np.cos(theta)
+    ], axis=-1)
+
+
+def steering_weights(positions, weights, theta0_deg, phi0_deg):
+    """Apply the conjugate phase that points the main beam toward (θ₀, φ₀)."""
+    k0 = direction_vectors(np.radians(theta0_deg), np.radians(phi0_deg))
+    return weights * np.exp(-1j * 2 * np.pi * positions @ k0)
+
+
+def geometry_array_factor(positions, weights, directions, chunk_elements=ENGINE_CHUNK_ELEMENTS):
+    """
+    Magnitude |Σ wₙ exp(j2π k̂·rₙ)| for every direction, evaluated in bounded blocks.
+
+    Parameters:
+    - positions (ndarray): Element positions in wavelengths, shape (M, 3)
+    - weights (ndarray): Complex element weights, shape (M,)
+    - directions (ndarray): Unit direction vectors, shape (..., 3)
+    - chunk_elements (int): Maximum number of steering-matrix entries per block
+
+    Returns:
+    - ndarray of |AF| with shape ``directions.shape[:-1]`` (not normalized)
+    """
+    positions = np.asarray(positions, dtype=float)
+    weights = np.asarray(weights, dtype=complex)
+    flat = np.asarray(directions, dtype=float).reshape(-1, 3)
+
+    element_block = max(1, min(len(positions), chunk_elements))
+    direction_block = max(1, chunk_elements // element_block)
+
+    AF = np.empty(len(flat))
+    for d_start in range(0, len(flat), direction_block):
+        k_hat = flat[d_start:d_start + direction_block]
+        total = np.zeros(len(k_hat), dtype=complex)
+        for e_start in range(0, len(positions), element_block):
+            r = positions[e_start:e_start + element_block]
+            w = weights[e_start:e_start + element_block]
+            total += np.exp(1j * 2 * np.pi * (k_hat @ r.T)) @ w
+        AF[d_start:d_start + direction_block] = np.abs(total)
+
+    return AF.reshape(np.shape(directions)[:-1])
+
+
+def cut_aperture(positions, phi_deg=0.0):
+    """
+    Linear array (N, d) with the lobe widths of the elevation cut at azimuth ``phi_deg``.
+
+    The cut only sees the in-plane components (x cos φ + y sin φ, z) of the
+    positions, so its narrowest lobes are those of an aperture as long as the
+    projected array. The length is bounded by twice the largest distance from
+    the projected centroid, which is exact for a linear array along z.
+
+    Returns:
+    - tuple of the element count N and the spacing d giving that length over N - 1 gaps
+    """
+    positions = np.asarray(positions, dtype=float)
+    phi = np.radians(phi_deg)
+    projected = np.column_stack([positions[:, 0] * np.cos(phi) + positions[:, 1] * np.sin(phi), positions[:, 2]])
+    length = 2 * np.max(np.linalg.norm(projected - projected.mean(axis=0), axis=1))
+    N = len(positions)
+    return N, length / (N - 1) if N > 1 else 0.0
+
+
+@cached_pattern
+def geometry_pattern(positions, weights, phi_deg=0.0, theta=None):
+    """
+    Normalized elevation cut θ ∈ [0, π] of an arbitrary array at azimuth ``phi_deg``.
+
+    Returns:
+    - dict with ``theta`` and the normalized ``af``
+    """
+    theta = theta_grid() if theta is None else theta
+    AF = geometry_array_factor(positions, weights, direction_vectors(theta, np.radians(phi_deg)))
+    return {'theta': theta, 'af': AF / np.max(AF)}
+
+
+@cached_pattern
+def geometry_pattern_3d(positions, weights, num_az=DEFAULT_GRID_POINTS, num_el=DEFAULT_GRID_POINTS,
+                        dtype=np.float32):
+    """
+    Normalized pattern of an arbitrary array over an azimuth/elevation grid.
+
+    Returns:
+    - dict with the ``az`` and ``el`` axes (radians), the normalized ``af``
+      grid (el × az) and its Cartesian surface coordinates ``x``, ``y`` and ``z``
+    """
+    az = np.linspace(0, 2 * np.pi, num_az)
+    el = np.linspace(0, np.pi, num_el)
+    k_hat = direction_vectors(el[:, None], az[None, :])
+    AF = geometry_array_factor(positions, weights, k_hat)
+    AF = AF / np.max(AF)
+
+    return {
+        'az': az,
+        'el': el,
+        'af': AF.astype(dtype),
+        'x': (AF * k_hat[..., 0]).astype(dtype),
+        'y': (AF * k_hat[..., 1]).astype(dtype),
+        'z': (AF * k_hat[..., 2]).astype(dtype)
+    }
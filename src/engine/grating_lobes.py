@@ -0,0 +1,152 @@
+"""
+Closed-form grating-lobe analysis of uniform linear arrays.
+
+In u = cos θ the pattern of an array with electrical spacing d/λ whose main
+beam points at u₀ repeats every 1/d, so its grating lobes sit at
+u₀ + k/d for integer k ≠ 0 and are visible when they fall inside |u| ≤ 1.
+Requiring the null-to-null lobe (half-width 1/(Nd)) of the nearest one to
+stay outside as well gives the classic design limit
+
+    d ≤ (1 - 1/N) / (1 + |cos θ₀|)
+
+at the design frequency. Away from it the spacing scales to d·f/f₀, and
+phase shifters squint the beam to u₀ = cos θ₀ · f₀/f while time delays keep
+it on cos θ₀. Everything here is evaluated from these expressions with numpy
+broadcasting, so whole (d, θ₀, N, f) parameter planes cost no pattern
+sampling.
+"""
+import numpy as np
+from src.engine.cache import cached_pattern
+
+
+def beam_cosine(theta_steer_deg, frequency_ratio=1.0, true_time_delay=False):
+    """Main-beam direction cosine u₀ at f/f₀ of a beam steered to ``theta_steer_deg`` at f₀; |u₀| > 1 is invisible."""
+    c = np.cos(np.radians(theta_steer_deg))
+    return c if true_time_delay else c / np.asarray(frequency_ratio, dtype=float)
+
+
+def grating_lobe_margin(d, u_beam, N=None):
+    """
+    Distance in u from the edge of visible space to the nearest grating lobe.
+
+    Parameters:
+    - d (float or ndarray): Electrical element spacing in wavelengths
+    - u_beam (float or ndarray): Main-beam direction cosine
+    - N (int or ndarray): Number of elements; when given the lobe's first
+      null, 1/(Nd) beyond its peak, must stay outside visible space too
+
+    All parameters broadcast against each other.
+
+    Returns:
+    - ndarray of the broadcast shape; negative where a grating lobe (or with
+      ``N`` its main lobe) reaches into visible space
+    """
+    d = np.asarray(d, dtype=float)
+    u_beam = np.asarray(u_beam, dtype=float)
+    # The nearest order k ≠ 0 to -u₀ d is among these four
+    base = np.floor(-u_beam * d)
+    orders = base + np.arange(-1, 3).reshape((4,) + (1,) * base.ndim)
+    distance = np.where(orders != 0, np.abs(u_beam + orders / d), np.inf).min(axis=0)
+    margin = distance - 1
+    if N is not None:
+        margin = margin - 1 / (np.asarray(N, dtype=float) * d)
+    return margin
+
+
+def max_spacing(theta_steer_deg, N=None, frequency_ratio=1.0, true_time_delay=False):
+    """
+    Largest spacing in design wavelengths that keeps grating lobes out of visible space.
+
+    Parameters:
+    - theta_steer_deg (float or ndarray): Steering angle at f₀ in degrees
+    - N (int or ndarray): Number of elements, None to only keep the lobe peaks out
+    - frequency_ratio (float or ndarray): Highest operating frequency f/f₀
+    - true_time_delay (bool): Time-delay steering instead of fixed phase shifts
+
+    Returns:
+    - ndarray of the broadcast shape, (1 - 1/N) / (f/f₀ + |cos θ₀|) for
+      phase shifters and (1 - 1/N) / (f/f₀ · (1 + |cos θ₀|)) for time delays
+    """
+    c = np.abs(np.cos(np.radians(theta_steer_deg)))
+    r = np.asarray(frequency_ratio, dtype=float)
+    reach = 1.0 if N is None else 1 - 1 / np.asarray(N, dtype=float)
+    return reach / (r * (1 + c)) if true_time_delay else reach / (r + c)
+
+
+def max_scan_angle(d, N=None):
+    """
+    Steering range free of grating lobes at the design frequency.
+
+    Returns:
+    - tuple of the smallest and largest steering angles in degrees, NaN when
+      grating lobes are visible even at broadside
+    """
+    reach = 1.0 if N is None else 1 - 1 / np.asarray(N, dtype=float)
+    c = reach / np.asarray(d, dtype=float) - 1
+    c = np.where(c >= 0, np.minimum(c, 1), np.nan)
+    return np.degrees(np.arccos(c)), np.degrees(np.arccos(-c))
+
+
+def grating_lobe_onset(d, theta_steer_deg, true_time_delay=False):
+    """Lowest f/f₀ at which a grating lobe peak enters visible space."""
+    c = np.cos(np.radians(theta_steer_deg))
+    if true_time_delay:
+        return float(1 / (d * (1 + abs(c))))
+    # Phase shifters: the lobes sit at (cos θ₀ + k/d)·f₀/f, visible once f/f₀ ≥ |cos θ₀ + k/d|
+    return float(grating_lobe_margin(d, c) + 1)
+
+
+def grating_lobe_directions(d, u_beam):
+    """
+    Directions of the grating lobes at electrical spacings ``d`` and beam cosines ``u_beam``.
+
+    Parameters:
+    - d (float or ndarray): Electrical element spacing in wavelengths, shape (F,) or scalar
+    - u_beam (float or ndarray): Main-beam direction cosine, broadcast against ``d``
+
+    Returns:
+    - tuple of the lobe orders k (K,) and their directions in degrees (K, F),
+      NaN where a lobe lies outside visible space; only orders visible for
+      some entry are returned
+    """
+    d, u_beam = np.broadcast_arrays(np.atleast_1d(np.asarray(d, dtype=float)),
+                                    np.atleast_1d(np.asarray(u_beam, dtype=float)))
+    low = np.floor(np.min((-1 - u_beam) * d))
+    high = np.ceil(np.max((1 - u_beam) * d))
+    orders = np.arange(low, high + 1)
+    orders = orders[orders != 0]
+    cos_lobe = u_beam + orders[:, None] / d
+    visible = np.abs(cos_lobe) <= 1
+    keep = visible.any(axis=-1)
+    directions = np.where(visible, np.degrees(np.arccos(np.clip(cos_lobe, -1, 1))), np.nan)
+    return orders[keep], directions[keep]
+
+
+@cached_pattern
+def grating_lobe_region(d, theta_steer_deg, N=None, frequency_ratio=1.0, true_time_delay=False):
+    """
+    Grating-lobe margin over a plane of spacings and steering angles.
+
+    Parameters:
+    - d (ndarray): Element spacings in design wavelengths (D,)
+    - theta_steer_deg (ndarray): Steering angles at f₀ in degrees (S,)
+    - N (int): Number of elements, None to only keep the lobe peaks out
+    - frequency_ratio (float): Operating frequency f/f₀
+    - true_time_delay (bool): Time-delay steering instead of fixed phase shifts
+
+    Returns:
+    - dict with the ``d`` and ``theta_steer_deg`` axes, the ``margin`` (S, D)
+      from ``grating_lobe_margin``, the boolean ``free`` region where it is
+      non-negative and the boundary ``max_spacing`` per steering angle (S,)
+    """
+    d = np.asarray(d, dtype=float)
+    theta_steer_deg = np.asarray(theta_steer_deg, dtype=float)
+    u_beam = beam_cosine(theta_steer_deg, frequency_ratio, true_time_delay)
+    margin = grating_lobe_margin(d * frequency_ratio, u_beam[:, None], N)
+    return {
+        'd': d,
+        'theta_steer_deg': theta_steer_deg,
+        'margin': margin,
+        'free': margin >= 0,
+        'max_spacing': max_spacing(theta_steer_deg, N, frequency_ratio, true_time_delay)
+    }
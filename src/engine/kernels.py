@@ -0,0 +1,81 @@
+"""
+Dirichlet kernel shared by every uniform linear array pattern.
+
+The uniform array factor |sin(Nμ/2) / (N sin(μ/2))| is 0/0 at μ = 2πk, which
+is exactly where the main beam and the grating lobes peak; evaluated naively
+it returns NaN there and the NaN then poisons the peak normalization. The
+kernel here first reduces μ to [-π, π), where μ = 0 is the only singular
+point and sin(μ/2) keeps full relative precision next to it, and sets that
+point to its limit of 1. It runs in place on caller-owned buffers so a
+pattern costs one phase buffer and one work buffer instead of a temporary
+per arithmetic step, and it can evaluate in float32.
+"""
+import numpy as np
+
+
+def array_phase(d, theta, beta=0.0, dtype=np.float64):
+    """
+    Progressive phase μ = 2πd cos θ + β in a freshly allocated buffer.
+
+    Parameters:
+    - d (float or ndarray): Element spacing in wavelengths, broadcast against ``theta``
+    - theta (ndarray): Observation angles in radians
+    - beta (float or ndarray): Progressive phase shift in radians
+    - dtype: float64, or float32 for half the memory
+
+    Returns:
+    - ndarray of the broadcast shape of ``d``, ``theta`` and ``beta``
+    """
+    cos_theta = np.cos(theta)
+    kd = 2 * np.pi * np.asarray(d, dtype=float)
+    mu = np.empty(np.broadcast_shapes(kd.shape, cos_theta.shape, np.shape(beta)), dtype=dtype)
+    np.multiply(kd, cos_theta, out=mu)
+    mu += beta
+    return mu
+
+
+def dirichlet(N, mu, out=None, work=None):
+    """
+    Uniform array factor |sin(Nμ/2) / (N sin(μ/2))|, equal to 1 at μ = 2πk.
+
+    Parameters:
+    - N (int or ndarray): Number of elements, broadcast against ``mu``
+    - mu (ndarray): Progressive phase in radians
+    - out (ndarray): Output buffer of the broadcast shape; may be ``mu``
+      itself to evaluate in place. Allocated with ``mu``'s float dtype when None
+    - work (ndarray): Scratch buffer of the same shape and dtype as ``out``,
+      allocated when None
+
+    Returns:
+    - ndarray ``out`` holding the pattern
+    """
+    mu = np.asarray(mu)
+    shape = np.broadcast_shapes(np.shape(N), mu.shape)
+    if out is None:
+        out = np.empty(shape, dtype=mu.dtype if mu.dtype.kind == 'f' else np.float64)
+    if work is None:
+        work = np.empty_like(out)
+
+    # out = μ/2 reduced to [-π/2, π/2); |AF| is unchanged by μ → μ - 2πk
+    np.add(mu, np.pi, out=out)
+    np.remainder(out, 2 * np.pi, out=out)
+    out -= np.pi
+    out *= 0.5
+
+    np.multiply(out, N, out=work)
+    np.sin(work, out=work)
+    np.sin(out, out=out)
+    out *= N
+
+    singular = out == 0
+    np.divide(work, out, out=out, where=~singular)
+    out[singular] = 1
+    return np.abs(out, out=out)
+
+
+def dirichlet_power(N, mu):
+    """Unnormalized |Σ exp(jnμ)|² = N² · dirichlet(N, μ)², equal to N² at μ = 2πk."""
+    power = dirichlet(N, mu)
+    power *= N
+    power **= 2
+    return power
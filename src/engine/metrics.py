@@ -0,0 +1,142 @@
+"""
+Vectorized pattern metrics.
+
+All functions accept a single pattern of shape (T,) or a stack of patterns of
+shape (M, T) sampled on a shared, increasing θ grid (radians), and return one
+value per pattern. The main beam is the global maximum of each pattern; its
+extent is bounded by the first local minimum on either side.
+"""
+import numpy as np
+
+HALF_POWER = 1 / np.sqrt(2)
+
+
+def _rows(af):
+    af = np.asarray(af, dtype=float)
+    return np.atleast_2d(af), af.ndim == 1
+
+
+def _unstack(values, single):
+    return {k: (v[0] if single else v) for k, v in values.items()}
+
+
+def local_minima(af):
+    """Boolean mask of interior local minima along the last axis."""
+    mask = np.zeros(af.shape, dtype=bool)
+    mask[..., 1:-1] = (af[..., 1:-1] <= af[..., :-2]) & (af[..., 1:-1] < af[..., 2:])
+    return mask
+
+
+def _nearest_left(mask, peak):
+    """Index of the last True entry before ``peak`` in every row, -1 if none."""
+    idx = np.arange(mask.shape[-1])
+    return np.where(mask & (idx < peak[:, None]), idx, -1).max(axis=-1)
+
+
+def _nearest_right(mask, peak):
+    """Index of the first True entry after ``peak`` in every row, T if none."""
+    idx = np.arange(mask.shape[-1])
+    return np.where(mask & (idx > peak[:, None]), idx, mask.shape[-1]).min(axis=-1)
+
+
+def _crossing(theta, af, rows, i, j, level):
+    """Linearly interpolated θ where each row crosses ``level`` between samples i and j."""
+    a, b = af[rows, i], af[rows, j]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frac = np.where(b != a, (level - a) / (b - a), 0.0)
+    return theta[i] + frac * (theta[j] - theta[i])
+
+
+def main_lobe(theta, af):
+    """
+    Peak index and first-null indices bounding the main lobe of each pattern.
+
+    Returns:
+    - (peak, left_null, right_null) index arrays of shape (M,); missing nulls
+      are reported as 0 and T-1 (the grid edges)
+    """
+    af, _ = _rows(af)
+    peak = np.argmax(np.where(np.isnan(af), -np.inf, af), axis=-1)
+    minima = local_minima(af)
+    left = np.maximum(_nearest_left(minima, peak), 0)
+    right = np.minimum(_nearest_right(minima, peak), af.shape[-1] - 1)
+    return peak, left, right
+
+
+def half_power_beamwidth(theta, af):
+    """Half-power (-3 dB) beamwidth in degrees; NaN if the beam does not fall below -3 dB on both sides."""
+    af, single = _rows(af)
+    theta = np.asarray(theta)
+    rows = np.arange(len(af))
+    peak, _, _ = main_lobe(theta, af)
+    level = HALF_POWER * af[rows, peak]
+
+    below = af < level[:, None]
+    left = _nearest_left(below, peak)
+    right = _nearest_right(below, peak)
+    valid = (left >= 0) & (right < af.shape[-1])
+    left_c, right_c = np.maximum(left, 0), np.minimum(right, af.shape[-1] - 1)
+
+    theta_left = _crossing(theta, af, rows, left_c, np.minimum(left_c + 1, af.shape[-1] - 1), level)
+    theta_right = _crossing(theta, af, rows, np.maximum(right_c - 1, 0), right_c, level)
+    hpbw = np.where(valid, np.degrees(theta_right - theta_left), np.nan)
+    return hpbw[0] if single else hpbw
+
+
+def pattern_metrics(theta, af, target_deg=None):
+    """
+    Beamwidth, sidelobe and pointing metrics for one or many patterns.
+
+    Parameters:
+    - theta (ndarray): Shared observation angles in radians, increasing
+    - af (ndarray): Normalized magnitude patterns, shape (T,) or (M, T)
+    - target_deg (float or ndarray): Intended main-beam direction(s) in degrees
+
+    Returns:
+    - dict of scalars (single pattern) or (M,) arrays with ``peak_deg``,
+      ``pointing_error_deg``, ``hpbw_deg``, ``fnbw_deg``, ``sll_db`` (peak
+      sidelobe relative to the main beam) and ``num_nulls``
+    """
+    af, single = _rows(af)
+    theta = np.asarray(theta)
+    rows = np.arange(len(af))
+    peak, left, right = main_lobe(theta, af)
+    peak_value = af[rows, peak]
+
+    idx = np.arange(af.shape[-1])
+    outside = (idx < left[:, None]) | (idx > right[:, None])
+    sidelobe = np.where(outside, af, -np.inf).max(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sll_db = np.where(np.isfinite(sidelobe), 20 * np.log10(sidelobe / peak_value), np.nan)
+
+    minima = local_minima(af)
+    has_both_nulls = minima[rows, left] & minima[rows, right]
+    fnbw = np.where(has_both_nulls, np.degrees(theta[right] - theta[left]), np.nan)
+
+    peak_deg = np.degrees(theta[peak])
+    target = np.nan if target_deg is None else np.asarray(target_deg, dtype=float)
+
+    return _unstack({
+        'peak_deg': peak_deg,
+        'pointing_error_deg': np.broadcast_to(peak_deg - target, peak_deg.shape),
+        'hpbw_deg': np.atleast_1d(half_power_beamwidth(theta, af)),
+        'fnbw_deg': fnbw,
+        'sll_db': sll_db,
+        'num_nulls': minima.sum(axis=-1)
+    }, single)
+
+
+def null_positions(theta, af, max_level_db=-20):
+    """
+    Angles in degrees of the pattern nulls deeper than ``max_level_db``.
+
+    Returns a list with one array per pattern because the number of nulls
+    differs between patterns.
+    """
+    af, single = _rows(af)
+    theta = np.asarray(theta)
+    with np.errstate(divide='ignore'):
+        deep = 20 * np.log10(af / np.nanmax(af, axis=-1, keepdims=True)) < max_level_db
+    mask = local_minima(af) & deep
+    nulls = [np.degrees(theta[row]) for row in mask]
+    return nulls[0] if single else nulls
@@ -0,0 +1,76 @@
+"""
+Planar (uniform rectangular) array factor.
+
+The elements of a URA lie on a rectangular grid in the xy-plane, so its array
+factor separates into the product of two uniform linear array factors, one
+along x in u = sin θ cos φ and one along y in v = sin θ sin φ. Each direction
+therefore costs two closed-form Dirichlet evaluations regardless of Nx·Ny.
+"""
+import numpy as np
+from src.config.constants import DEFAULT_GRID_POINTS, MIN_POINTS_PER_LOBE
+from src.engine.cache import cached_pattern
+from src.engine.kernels import dirichlet
+from src.engine.sampling import lobe_count
+
+
+def direction_cosines(theta, phi):
+    """Direction cosines u = sin θ cos φ and v = sin θ sin φ."""
+    return np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi)
+
+
+def grid_points_per_lobe(Nx, Ny, dx, dy, num_az=DEFAULT_GRID_POINTS, num_el=DEFAULT_GRID_POINTS):
+    """
+    Samples per sidelobe width of an az/el grid along the sparser of the u and v axes.
+
+    Near the horizon one elevation or azimuth step moves u (or v) by up to the
+    step itself, so lobes of width 1/(N d) get 1/(N d · step) samples, counted
+    as ``lobe_resolution`` counts them for 1D grids.
+    """
+    step = max(np.pi / (num_el - 1), 2 * np.pi / (num_az - 1))
+    return min(2 / (lobe_count(Nx, dx) * step), 2 / (lobe_count(Ny, dy) * step))
+
+
+def planar_grid_size(Nx, Ny, dx, dy, points_per_lobe=MIN_POINTS_PER_LOBE):
+    """Smallest square az/el grid with ``points_per_lobe`` samples per sidelobe width along u and v."""
+    lobes = max(lobe_count(Nx, dx), lobe_count(Ny, dy))
+    return int(np.ceil(np.pi * points_per_lobe * lobes)) + 1
+
+
+@cached_pattern
+def planar_array_factor(Nx, Ny, dx, dy, theta0_deg=0, phi0_deg=0,
+                        num_az=DEFAULT_GRID_POINTS, num_el=DEFAULT_GRID_POINTS, dtype=np.float32):
+    """
+    Normalized array factor of a uniform rectangular array over an az/el grid.
+
+    Parameters:
+    - Nx (int): Number of elements along x
+    - Ny (int): Number of elements along y
+    - dx (float): Element spacing along x in wavelengths
+    - dy (float): Element spacing along y in wavelengths
+    - theta0_deg (float): Steering elevation (angle from the array normal) in degrees
+    - phi0_deg (float): Steering azimuth in degrees
+    - num_az (int): Number of azimuth samples over [0, 2π]
+    - num_el (int): Number of elevation samples over [0, π]
+    - dtype: Output dtype for the gridded arrays
+
+    Returns:
+    - dict with the ``az`` and ``el`` axes (radians), the normalized ``af``
+      grid (el × az) and its Cartesian surface coordinates ``x``, ``y`` and ``z``
+    """
+    az = np.linspace(0, 2 * np.pi, num_az)
+    el = np.linspace(0, np.pi, num_el)
+    u, v = direction_cosines(el[:, None], az[None, :])
+    u0, v0 = direction_cosines(np.radians(theta0_deg), np.radians(phi0_deg))
+
+    AF = dirichlet(Nx, 2 * np.pi * dx * (u - u0), out=np.empty(u.shape, dtype))
+    AF *= dirichlet(Ny, 2 * np.pi * dy * (v - v0), out=np.empty(u.shape, dtype))
+    AF /= np.max(AF)
+
+    return {
+        'az': az,
+        'el': el,
+        'af': AF,
+        'x': (AF * u).astype(dtype),
+        'y': (AF * v).astype(dtype),
+        'z': (AF * np.cos(el)[:, None]).astype(dtype)
+    }
@@ -0,0 +1,177 @@
+"""
+Angular sampling policies for 1D patterns.
+
+A fixed 1000-point θ grid undersamples the narrow lobes of large arrays and
+wastes points on small ones. The adaptive policy instead places a fixed
+number of samples per lobe: lobes of a linear array are evenly spaced in
+u = cos θ with a null-to-null width of about 1/(N d), so the grid is built
+uniformly in u, merged with a coarse uniform θ grid for smooth rendering
+near endfire, and finally refined locally around every peak and null.
+
+Grid sizes grow with N·d, so no policy aliases large arrays unless the caller
+caps the grid; ``lobe_resolution`` measures what a grid actually resolves, and
+metrics are withheld when it falls below ``MIN_POINTS_PER_LOBE``.
+"""
+import numpy as np
+from src.config.constants import (
+    DEFAULT_THETA_POINTS, DEFAULT_RESOLUTION, ADAPTIVE_POINTS_PER_LOBE,
+    ADAPTIVE_MIN_POINTS, ADAPTIVE_REFINE_POINTS, MAX_THETA_POINTS, MIN_POINTS_PER_LOBE
+)
+from src.engine.array_factor import theta_grid
+
+
+def lobe_count(N, d):
+    """Number of null-to-null sidelobe widths 1/(N d) spanning visible space, -1 ≤ u ≤ 1."""
+    return max(2 * N * d, 1.0)
+
+
+def lobe_resolution(theta, N, d):
+    """
+    Samples per sidelobe width 1/(N d) where the θ grid is sparsest in u = cos θ.
+
+    Peaks and nulls are only located reliably above ``MIN_POINTS_PER_LOBE``;
+    below it the sampled pattern aliases and its metrics are meaningless.
+    """
+    if len(theta) < 2:
+        return 0.0
+    step = np.max(np.abs(np.diff(np.cos(theta))))
+    return 2 / (lobe_count(N, d) * step)
+
+
+def undersampled(theta, N, d):
+    """True if ``theta`` resolves fewer than ``MIN_POINTS_PER_LOBE`` samples per lobe of the array."""
+    return lobe_resolution(theta, N, d) < MIN_POINTS_PER_LOBE
+
+
+def beamwidth_grid(N, d, points_per_lobe=ADAPTIVE_POINTS_PER_LOBE,
+                   min_points=ADAPTIVE_MIN_POINTS, max_points=None):
+    """
+    θ grid (radians, sorted) whose density scales with the expected lobe width.
+
+    Parameters:
+    - N (int): Number of elements
+    - d (float): Element spacing in wavelengths
+    - points_per_lobe (int): Samples per null-to-null lobe width in u-space
+    - min_points (int): Size of the uniform θ grid merged in for smooth rendering
+    - max_points (int): Optional cap on the number of u-space samples; a capped
+      grid may undersample, which ``lobe_resolution`` reports
+    """
+    num_u = int(max(np.ceil(lobe_count(N, d) * points_per_lobe), 2))
+    if max_points is not None:
+        num_u = min(num_u, max_points)
+    theta_u = np.arccos(np.linspace(1, -1, num_u))
+    return np.unique(np.concatenate([theta_u, theta_grid(min_points)]))
+
+
+def find_extrema(af):
+    """Indices of interior local maxima and minima of a sampled pattern."""
+    slope = np.diff(af)
+    turning = slope[:-1] * slope[1:] <= 0
+    return np.nonzero(turning)[0] + 1
+
+
+def refine_grid(theta, af, refine_points=ADAPTIVE_REFINE_POINTS):
+    """
+    Insert ``refine_points`` extra samples around every peak and null of ``af``.
+
+    The new samples are spread over the two intervals adjacent to each
+    extremum, so both the lobe tops and the null depths are resolved. Every
+    extremum is refined: with two per lobe this adds at most
+    ``2 · refine_points`` samples per lobe.
+    """
+    extrema = find_extrema(af)
+    if len(extrema) == 0:
+        return theta
+
+    fractions = np.linspace(0, 1, refine_points + 2)[1:-1]
+    left = theta[extrema - 1][:, None]
+    right = theta[extrema + 1][:, None]
+    extra = left + (right - left) * fractions
+    return np.unique(np.concatenate([theta, extra.ravel()]))
+
+
+def max_points_grid_size(N, d, points_per_lobe=ADAPTIVE_POINTS_PER_LOBE):
+    """
+    Size of the 'max-points' uniform θ grid: ``MAX_THETA_POINTS``, or more if N·d needs it.
+
+    A uniform θ grid is sparsest in u at broadside, where its step is π/(T-1),
+    so T ≈ π · lobes/2 · points_per_lobe keeps ``points_per_lobe`` there.
+    """
+    needed = np.ceil(np.pi / 2 * lobe_count(N, d) * points_per_lobe) + 1
+    return int(max(MAX_THETA_POINTS, needed))
+
+
+def sample_theta(N, d, resolution=DEFAULT_RESOLUTION, pattern=None, max_points=None):
+    """
+    θ grid in radians for the given resolution policy.
+
+    Parameters:
+    - N (int): Number of elements
+    - d (float): Element spacing in wavelengths
+    - resolution (str): 'fixed' (default 1000 points), 'adaptive' or 'max-points'
+    - pattern (callable): Optional ``pattern(theta) -> af`` used by the adaptive
+      policy to refine around peaks and nulls
+    - max_points (int): Optional cap on the grid size, for callers that hold
+      one row per θ for many configurations; by default the size scales with
+      N·d. 'fixed' grids and capped grids may undersample large arrays, so
+      check them with ``undersampled``
+    """
+    if resolution == 'fixed':
+        return theta_grid(DEFAULT_THETA_POINTS)
+    if resolution == 'max-points':
+        num_points = max_points_grid_size(N, d)
+        return theta_grid(num_points if max_points is None else min(num_points, max_points))
+    if resolution != 'adaptive':
+        raise ValueError(f"Unknown resolution policy: {resolution!r}")
+
+    theta = beamwidth_grid(N, d, max_points=max_points)
+    if pattern is not None:
+        theta = refine_grid(theta, pattern(theta))
+    return theta
+
+
+def sample_theta_uniform(N, d, resolution=DEFAULT_RESOLUTION, pattern=None):
+    """
+    θ grid, uniform in θ, for patterns whose lobes are not evenly spaced in u = cos θ.
+
+    An elevation cut of an array that is not aligned with the z axis has its
+    narrowest lobes wherever the cut crosses the aperture's broadside, which
+    may be anywhere in θ. A uniform θ grid whose step resolves the broadside
+    lobes of an N·d aperture resolves them all, and ``lobe_resolution`` still
+    measures it correctly. 'adaptive' sizes the grid for
+    ``ADAPTIVE_POINTS_PER_LOBE`` (at least ``ADAPTIVE_MIN_POINTS``) and refines it
+    around the peaks and nulls of ``pattern``; 'fixed' and 'max-points' are
+    as in ``sample_theta``.
+    """
+    if resolution == 'fixed':
+        return theta_grid(DEFAULT_THETA_POINTS)
+    if resolution == 'max-points':
+        return theta_grid(max_points_grid_size(N, d))
+    if resolution != 'adaptive':
+        raise ValueError(f"Unknown resolution policy: {resolution!r}")
+
+    num_points = int(np.ceil(np.pi / 2 * lobe_count(N, d) * ADAPTIVE_POINTS_PER_LOBE)) + 1
+    theta = theta_grid(max(num_points, ADAPTIVE_MIN_POINTS))
+    if pattern is not None:
+        theta = refine_grid(theta, pattern(theta))
+    return theta
+
+
+def sample_pattern(compute, resolution, N, d, spacing=None, **params):
+    """
+    Evaluate an engine function on the θ grid chosen by ``resolution``.
+
+    ``compute`` is any engine function taking ``(N, d, ..., theta=...)``; for
+    the adaptive policy it is evaluated once on the beamwidth grid to locate
+    peaks and nulls, then again on the refined grid. The grid is sized for
+    the lobes of an array with element spacing ``spacing``, which defaults to
+    ``d``; pass the electrical spacing when ``compute`` scales ``d`` by a
+    wavelength. The returned copy of the engine result also holds the grid's
+    ``points_per_lobe``.
+    """
+    spacing = d if spacing is None else spacing
+    theta = sample_theta(
+        N, spacing, resolution,
+        pattern=lambda th: compute(N, d, theta=th, **params)['af']
+    )
+    return {**compute(N, d, theta=theta, **params), 'points_per_lobe': lobe_resolution(theta, N, spacing)}
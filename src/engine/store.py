@@ -0,0 +1,203 @@
+"""
+Chunked on-disk pattern store.
+
+A store is a directory holding the θ grid (``theta.npy``), one ``af_XXXXX.npy``
+and ``directivity_XXXXX.npy`` pair per chunk of consecutive configurations, and
+a ``manifest.json`` sidecar with the parameter axes and the chunk index.
+Configurations are enumerated in C order over ``SWEEP_PARAMETERS``, so any
+parameter combination maps to one flat index and hence one chunk row.
+
+``PatternStoreWriter`` appends chunks as they are produced and rewrites the
+manifest atomically after each one, so a store can be browsed while a batch
+job is still filling it. ``PatternStore`` opens chunks read-only with
+``np.load(mmap_mode='r')``, so only the pages that are actually looked at are
+read from disk. One ``PatternStore`` may be shared by several threads (the app
+opens each store once per server process), so its refresh and chunk cache
+run under a lock.
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+from src.config.constants import STORE_OPEN_CHUNKS
+from src.engine.sweep import SWEEP_PARAMETERS
+
+MANIFEST = 'manifest.json'
+THETA = 'theta.npy'
+
+
+def chunk_names(index):
+    """File names of the pattern and directivity arrays of chunk ``index``."""
+    return f"af_{index:05d}.npy", f"directivity_{index:05d}.npy"
+
+
+class PatternStoreWriter:
+    """
+    Incrementally write a pattern store.
+
+    Parameters:
+    - path (str): Store directory, created if missing
+    - axes (dict): Parameter axes as returned by ``sweep_axes``
+    - theta (ndarray): Shared observation angles in radians
+    - dtype (str): Storage dtype of the patterns
+    """
+    def __init__(self, path, axes, theta, dtype='float32'):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, THETA), np.asarray(theta, dtype=float))
+        self.manifest = {
+            'parameters': list(SWEEP_PARAMETERS),
+            'shape': [len(axes[name]) for name in SWEEP_PARAMETERS],
+            'axes': {name: [None if np.isnan(v) else float(v) for v in axes[name]] for name in SWEEP_PARAMETERS},
+            'dtype': str(np.dtype(dtype)),
+            'complete': False,
+            'chunks': []
+        }
+        self._flush()
+
+    def write_chunk(self, index, start, af, directivity):
+        """Save the arrays of one chunk and register it in the manifest."""
+        af_name, directivity_name = chunk_names(index)
+        np.save(os.path.join(self.path, af_name), np.asarray(af, dtype=self.manifest['dtype']))
+        np.save(os.path.join(self.path, directivity_name), np.asarray(directivity, dtype=float))
+        self.add_chunk(index, start, start + len(af))
+
+    def add_chunk(self, index, start, stop):
+        """Register a chunk whose files were written by another process."""
+        af_name, directivity_name = chunk_names(index)
+        self.manifest['chunks'].append({'start': int(start), 'stop': int(stop),
+                                        'af': af_name, 'directivity': directivity_name})
+        self._flush()
+
+    def close(self, **info):
+        """Mark the store complete, recording any extra ``info`` in the manifest."""
+        self.manifest['chunks'].sort(key=lambda chunk: chunk['start'])
+        self.manifest.update(info, complete=True)
+        self._flush()
+
+    def _flush(self):
+        # Write-then-rename so readers never see a half-written manifest
+        temporary = os.path.join(self.path, MANIFEST + '.tmp')
+        with open(temporary, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(temporary, os.path.join(self.path, MANIFEST))
+
+
+class PatternStore:
+    """
+    Read-only, memory-mapped view of a pattern store.
+
+    Parameters:
+    - path (str): Store directory containing ``manifest.json``
+    - max_open_chunks (int): Number of chunk memory maps kept open at once
+    """
+    def __init__(self, path, max_open_chunks=STORE_OPEN_CHUNKS):
+        self.path = path
+        self.max_open_chunks = max_open_chunks
+        self._open = OrderedDict()
+        self._lock = threading.RLock()
+        self._manifest_mtime = None
+        self.refresh()
+
+    def refresh(self):
+        """
+        Re-read the manifest if it changed, picking up chunks written since the store was opened.
+
+        Returns:
+        - bool, True when the manifest was re-read
+        """
+        manifest_path = os.path.join(self.path, MANIFEST)
+        with self._lock:
+            # The writer replaces the manifest atomically, so a new mtime means new chunks
+            mtime = os.stat(manifest_path).st_mtime_ns
+            if mtime == self._manifest_mtime:
+                return False
+            with open(manifest_path) as f:
+                self.manifest = json.load(f)
+            self._manifest_mtime = mtime
+            self.shape = tuple(self.manifest['shape'])
+            self.axes = {
+                name: np.array([np.nan if v is None else v for v in values], dtype=float)
+                for name, values in self.manifest['axes'].items()
+            }
+            self.theta = np.load(os.path.join(self.path, THETA), mmap_mode='r')
+            self._starts = np.array([chunk['start'] for chunk in self.manifest['chunks']], dtype=int)
+            self._stops = np.array([chunk['stop'] for chunk in self.manifest['chunks']], dtype=int)
+            order = np.argsort(self._starts)
+            self._chunks = [self.manifest['chunks'][i] for i in order]
+            self._starts, self._stops = self._starts[order], self._stops[order]
+            # A sweep rerun into the same directory rewrites chunks under the same names
+            self._open.clear()
+            return True
+
+    def __len__(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def complete(self):
+        return self.manifest['complete']
+
+    @property
+    def num_written(self):
+        """Number of configurations whose chunks are on disk."""
+        with self._lock:
+            return int((self._stops - self._starts).sum())
+
+    def flat_index(self, **indices):
+        """Flat configuration index from per-parameter axis indices (missing ones are 0)."""
+        return int(np.ravel_multi_index(
+            tuple(indices.get(name, 0) for name in self.manifest['parameters']), self.shape
+        ))
+
+    def configuration(self, index):
+        """Parameter values of configuration ``index``; NaN marks no steering or uniform weighting."""
+        positions = np.unravel_index(index, self.shape)
+        return {name: float(self.axes[name][i]) for name, i in zip(self.manifest['parameters'], positions)}
+
+    def _chunk(self, position, kind):
+        # Keyed by file name: positions shift when ``refresh`` adds chunks.
+        # Callers hold the lock, so the chunk index cannot change under them.
+        name = self._chunks[position][kind]
+        if name in self._open:
+            self._open.move_to_end(name)
+            return self._open[name]
+        array = np.load(os.path.join(self.path, name), mmap_mode='r')
+        rows = self._stops[position] - self._starts[position]
+        expected = (rows, len(self.theta)) if kind == 'af' else (rows,)
+        if array.shape != expected:
+            raise ValueError(f"Chunk {name} has shape {array.shape}, but the manifest expects {expected}")
+        self._open[name] = array
+        while len(self._open) > self.max_open_chunks:
+            self._open.popitem(last=False)
+        return array
+
+    def _locate(self, index):
+        position = np.searchsorted(self._starts, index, side='right') - 1
+        if position < 0 or index >= self._stops[position]:
+            raise KeyError(f"Configuration {index} has not been written to the store yet")
+        return position, index - self._starts[position]
+
+    def pattern(self, index):
+        """Normalized pattern of configuration ``index`` as a read-only memory-mapped row."""
+        with self._lock:
+            position, row = self._locate(index)
+            return self._chunk(position, 'af')[row]
+
+    def directivity_dbi(self, index):
+        """Directivity of configuration ``index`` in dBi."""
+        with self._lock:
+            position, row = self._locate(index)
+            return 10 * np.log10(self._chunk(position, 'directivity')[row])
+
+    def page(self, start, stop):
+        """Patterns of configurations ``start:stop`` as an array, loaded chunk by chunk."""
+        rows = []
+        index = start
+        with self._lock:
+            while index < stop:
+                position, row = self._locate(index)
+                count = min(stop, self._stops[position]) - index
+                rows.append(self._chunk(position, 'af')[row:row + count])
+                index += count
+        return np.concatenate(rows) if rows else np.empty((0, len(self.theta)))
@@ -0,0 +1,148 @@
+"""
+Vectorized parameter sweeps over linear array configurations.
+
+``parameter_sweep`` evaluates every combination of N, d, β, steering angle,
+wavelength and Dolph-Chebyshev taper with numpy broadcasting. Configurations are processed in blocks so
+the temporary arrays stay below ``ENGINE_CHUNK_ELEMENTS`` entries no matter
+how large the sweep is.
+"""
+import numpy as np
+from src.config.constants import ENGINE_CHUNK_ELEMENTS
+from src.engine.array_factor import theta_grid, steering_phase, electrical_spacing, padded_chebyshev_weights
+from src.engine.cache import cached_pattern
+from src.engine.directivity import uniform_directivity, tapered_directivity, to_dbi
+from src.engine.fft_pattern import linear_array_factor
+from src.engine.kernels import array_phase, dirichlet
+
+SWEEP_PARAMETERS = ('N', 'd', 'beta', 'theta_steer', 'wavelength', 'R_dB')
+
+
+def _axis(value):
+    """1D float axis with ``None`` entries stored as NaN."""
+    value = np.atleast_1d(np.asarray(value, dtype=object))
+    return np.array([np.nan if v is None else v for v in value], dtype=float)
+
+
+def sweep_axes(N=8, d=0.5, beta=0.0, theta_steer=None, wavelength=1.0, R_dB=None):
+    """
+    Return the sweep parameters as 1D arrays in ``SWEEP_PARAMETERS`` order.
+
+    A ``theta_steer`` of ``None`` means no steering and an ``R_dB`` of
+    ``None`` means uniform weighting; both are stored as NaN and may also
+    appear as individual entries of a list.
+    """
+    values = (N, d, beta, theta_steer, wavelength, R_dB)
+    return {name: _axis(value) for name, value in zip(SWEEP_PARAMETERS, values)}
+
+
+def sweep_configurations(axes, start=0, stop=None):
+    """
+    Flattened parameter columns for configurations ``start:stop`` of the sweep.
+
+    Configurations are enumerated in C order over the axes in ``SWEEP_PARAMETERS``.
+    """
+    shape = tuple(len(axes[name]) for name in SWEEP_PARAMETERS)
+    stop = int(np.prod(shape)) if stop is None else stop
+    indices = np.unravel_index(np.arange(start, stop), shape)
+    return {name: axes[name][index] for name, index in zip(SWEEP_PARAMETERS, indices)}
+
+
+def electrical_parameters(params):
+    """Electrical spacing d·λ and total progressive phase (β plus steering) of flattened configurations."""
+    d_electrical = electrical_spacing(params['d'], params['wavelength'])
+    steer = np.where(
+        np.isnan(params['theta_steer']), 0.0,
+        steering_phase(d_electrical, np.nan_to_num(params['theta_steer']))
+    )
+    return d_electrical, params['beta'] + steer
+
+
+def sweep_block(params, theta):
+    """
+    Normalized patterns for a block of flattened configurations.
+
+    Parameters:
+    - params (dict): Equal-length 1D arrays for every name in ``SWEEP_PARAMETERS``
+    - theta (ndarray): Observation angles in radians
+
+    Uniform configurations use the closed-form Dirichlet kernel; tapered ones
+    are evaluated as one stacked weighted sum with phase-shifted weights.
+
+    Returns:
+    - ndarray of shape (len(block), len(theta))
+    """
+    d_electrical, beta = electrical_parameters(params)
+    tapered = ~np.isnan(params['R_dB'])
+    uniform = ~tapered
+    AF = np.empty((len(d_electrical), len(theta)))
+
+    if uniform.any():
+        mu = array_phase(d_electrical[uniform, None], theta, beta[uniform, None])
+        AF[uniform] = dirichlet(params['N'][uniform, None], mu, out=mu)
+    if tapered.any():
+        weights = padded_chebyshev_weights(params['N'][tapered], params['R_dB'][tapered])
+        weights = weights * np.exp(1j * np.arange(weights.shape[-1]) * beta[tapered, None])
+        AF[tapered] = linear_array_factor(weights, d_electrical[tapered], theta)
+    return AF / np.max(AF, axis=-1, keepdims=True)
+
+
+def sweep_directivity(params):
+    """Directivity (ratio) of a block of flattened configurations."""
+    d_electrical, beta = electrical_parameters(params)
+    tapered = ~np.isnan(params['R_dB'])
+    D = np.empty(len(d_electrical))
+    D[~tapered] = uniform_directivity(params['N'][~tapered], d_electrical[~tapered], beta[~tapered])
+    if tapered.any():
+        weights = padded_chebyshev_weights(params['N'][tapered], params['R_dB'][tapered])
+        D[tapered] = tapered_directivity(weights, d_electrical[tapered], beta[tapered])
+    return D
+
+
+@cached_pattern
+def parameter_sweep(N=8, d=0.5, beta=0.0, theta_steer=None, wavelength=1.0, R_dB=None,
+                    theta=None, dtype=np.float64, chunk_elements=ENGINE_CHUNK_ELEMENTS):
+    """
+    Normalized array factor for every combination of the given parameters.
+
+    Any parameter may be a scalar or a 1D array. The effective progressive
+    phase is ``beta`` plus the steering phase for ``theta_steer`` (degrees),
+    and the spacing is scaled by ``wavelength`` as in ``radiation_pattern``
+    (see ``electrical_spacing``).
+
+    Parameters:
+    - N (int or array): Number of elements
+    - d (float or array): Element spacing in wavelengths
+    - beta (float or array): Extra progressive phase shift in radians
+    - theta_steer (float or array): Steering angle in degrees, ``None`` for no steering
+    - wavelength (float or array): Wavelength of operation, scales the spacing
+    - R_dB (float or array): Dolph-Chebyshev sidelobe level in dB, ``None`` for uniform
+    - theta (ndarray): Observation angles in radians, defaults to ``theta_grid()``
+    - dtype: Output dtype, e.g. ``np.float32`` to halve memory
+    - chunk_elements (int): Maximum temporary array size per evaluation block
+
+    Returns:
+    - dict with ``theta``, the parameter ``axes``, ``af`` of shape
+      (len(N), len(d), len(beta), len(theta_steer), len(wavelength), len(R_dB),
+      len(theta))
+      and ``directivity_dbi`` with the same shape minus the θ axis
+    """
+    theta = theta_grid() if theta is None else np.asarray(theta)
+    axes = sweep_axes(N, d, beta, theta_steer, wavelength, R_dB)
+    shape = tuple(len(axes[name]) for name in SWEEP_PARAMETERS)
+    total = int(np.prod(shape))
+
+    AF = np.empty((total, len(theta)), dtype=dtype)
+    D = np.empty(total)
+    block = max(1, chunk_elements // len(theta))
+    for start in range(0, total, block):
+        stop = min(start + block, total)
+        params = sweep_configurations(axes, start, stop)
+        AF[start:stop] = sweep_block(params, theta)
+        D[start:stop] = sweep_directivity(params)
+
+    return {
+        'theta': theta,
+        'axes': axes,
+        'af': AF.reshape(shape + (len(theta),)),
+        'directivity_dbi': to_dbi(D).reshape(shape)
+    }
@@ -0,0 +1,157 @@
+"""
+Array pattern synthesis against angular masks.
+
+The array factor of N weights on a grid of K directions u = cos θ is
+f = A w with the steering matrix A[k, n] = exp(j2πd n u_k). Synthesis
+alternates between two projections:
+
+- pattern space: scale f to unit gain at the steering direction and clip
+  |f| into the mask [lower, upper], keeping the phase
+- weight space: the least-squares weights for the clipped pattern, w = A⁺ f,
+  with their amplitudes clipped to the allowed dynamic range
+
+A and its pseudo-inverse depend only on (N, d) and are cached, so every
+iteration is two matrix-vector products. Starting from the weights of the
+previous solve (a warm start) a small mask change typically needs only a few
+iterations, which keeps re-synthesis interactive for N in the hundreds.
+"""
+import functools
+import numpy as np
+from src.config.constants import (
+    SYNTHESIS_POINTS_PER_LOBE, SYNTHESIS_MIN_POINTS, SYNTHESIS_MAX_ITERATIONS,
+    SYNTHESIS_TOLERANCE_DB, SYNTHESIS_NULL_WIDTH
+)
+
+
+def synthesis_grid(N, d, points_per_lobe=SYNTHESIS_POINTS_PER_LOBE):
+    """Uniform u = cos θ grid over visible space with ``points_per_lobe`` samples per null spacing 1/(Nd)."""
+    return np.linspace(-1, 1, max(SYNTHESIS_MIN_POINTS, int(np.ceil(2 * points_per_lobe * N * d)) + 1))
+
+
+@functools.lru_cache(maxsize=8)
+def steering_matrix(N, d):
+    """
+    Steering matrix and its pseudo-inverse on ``synthesis_grid(N, d)``.
+
+    Memoized per (N, d); the returned arrays are read-only because they are shared.
+
+    Returns:
+    - tuple of the u grid (K,), ``A`` (K, N) and ``A⁺`` (N, K)
+    """
+    u = synthesis_grid(N, d)
+    A = np.exp(2j * np.pi * d * np.outer(u, np.arange(N)))
+    A_pinv = np.linalg.pinv(A)
+    for array in (u, A, A_pinv):
+        array.setflags(write=False)
+    return u, A, A_pinv
+
+
+def sidelobe_mask(N, d, u, theta_steer_deg=90.0, mainlobe_width=1.5, sll_db=-30.0,
+                  sectors=(), nulls_deg=(), null_depth_db=-60.0):
+    """
+    Lower and upper bounds on the normalized |AF| over the u grid.
+
+    Parameters:
+    - N (int): Number of elements
+    - d (float): Element spacing in wavelengths
+    - u (ndarray): Grid of u = cos θ
+    - theta_steer_deg (float): Main-beam direction in degrees
+    - mainlobe_width (float): Half-width of the unconstrained main-lobe region
+      in null spacings 1/(Nd); 1 is the first null of a uniform array
+    - sll_db (float): Sidelobe ceiling outside the main lobe in dB
+    - sectors (tuple): ``(theta_start_deg, theta_stop_deg, level_db)`` sectors
+      with their own ceiling, applied where lower than ``sll_db``
+    - nulls_deg (tuple): Directions in degrees that must stay below ``null_depth_db``
+    - null_depth_db (float): Ceiling in the null directions in dB
+
+    Returns:
+    - tuple of ``lower`` and ``upper`` arrays shaped like ``u``; ``lower`` is 1
+      at the grid point nearest the main beam and 0 elsewhere
+    """
+    spacing = 1 / (N * d)
+    u0 = np.cos(np.radians(theta_steer_deg))
+    upper = np.full(u.shape, 10**(sll_db / 20))
+    upper[np.abs(u - u0) <= mainlobe_width * spacing] = 1.0
+
+    theta_deg = np.degrees(np.arccos(u))
+    for start, stop, level_db in sectors:
+        sector = (theta_deg >= min(start, stop)) & (theta_deg <= max(start, stop))
+        upper[sector] = np.minimum(upper[sector], 10**(level_db / 20))
+    for null in nulls_deg:
+        near = np.abs(u - np.cos(np.radians(null))) <= SYNTHESIS_NULL_WIDTH * spacing
+        upper[near] = np.minimum(upper[near], 10**(null_depth_db / 20))
+
+    lower = np.zeros(u.shape)
+    lower[np.argmin(np.abs(u - u0))] = 1.0
+    upper[lower > 0] = 1.0
+    return lower, upper
+
+
+def synthesize(N, d, lower, upper, dynamic_range_db=None, initial=None,
+               max_iterations=SYNTHESIS_MAX_ITERATIONS, tolerance_db=SYNTHESIS_TOLERANCE_DB):
+    """
+    Weights whose pattern fits the mask by alternating projections.
+
+    Parameters:
+    - N (int): Number of elements
+    - d (float): Element spacing in wavelengths
+    - lower (ndarray): Lower bound on |AF| over ``synthesis_grid(N, d)``; its
+      single nonzero entry marks the main-beam sample used for normalization
+    - upper (ndarray): Upper bound on |AF| over the same grid
+    - dynamic_range_db (float): Largest allowed ratio of the largest to the
+      smallest weight amplitude, None for no limit
+    - initial (ndarray): Starting weights, e.g. the previous solution; the
+      main beam's uniformly steered weights when None or of another length
+    - max_iterations (int): Iteration limit
+    - tolerance_db (float): Stop once no sample exceeds the mask by more than this
+
+    Returns:
+    - dict with the complex ``weights`` (largest amplitude 1) of the best
+      iterate, the ``u`` grid, its normalized ``af`` there, the worst mask
+      ``excess_db``, the number of ``iterations`` run and ``converged``
+    """
+    u, A, A_pinv = steering_matrix(int(N), float(d))
+    beam = int(np.argmax(lower))
+    if initial is None or len(initial) != N:
+        initial = np.conj(A[beam])
+    w = np.asarray(initial, dtype=complex)
+    floor = None if dynamic_range_db is None else 10**(-dynamic_range_db / 20)
+
+    best = (np.inf, w, None)
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        f = A @ w
+        gain = np.abs(f[beam])
+        if gain == 0:
+            break
+        f /= gain
+        magnitude = np.abs(f)
+        with np.errstate(divide='ignore'):
+            excess_db = 20 * np.log10(np.max(magnitude / upper))
+        if excess_db < best[0]:
+            best = (excess_db, w / gain, magnitude)
+        if excess_db <= tolerance_db:
+            break
+
+        # Pattern-space projection onto the mask, phase preserved
+        clipped = np.clip(magnitude, lower, upper)
+        f *= np.divide(clipped, magnitude, out=np.ones_like(magnitude), where=magnitude > 0)
+
+        # Weight-space projection: least squares, then the amplitude range
+        w = A_pinv @ f
+        if floor is not None:
+            amplitude = np.abs(w)
+            limit = np.clip(amplitude, floor * amplitude.max(), None)
+            w *= np.divide(limit, amplitude, out=np.ones_like(amplitude), where=amplitude > 0)
+            w[amplitude == 0] = floor * amplitude.max()
+
+    excess_db, weights, magnitude = best
+    scale = np.abs(weights).max()
+    return {
+        'weights': weights / scale,
+        'u': u,
+        'af': magnitude,
+        'excess_db': excess_db,
+        'iterations': iterations,
+        'converged': excess_db <= tolerance_db
+    }
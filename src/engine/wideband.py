@@ -0,0 +1,92 @@
+"""
+Wideband patterns of steered uniform linear arrays.
+
+Phase shifters apply the progressive phase β = -2πd cos θ₀ worked out at the
+design frequency f₀, with d in design wavelengths. At a frequency f the
+electrical spacing grows to d·f/f₀ while β stays put, so
+
+    μ(θ, f) = 2πd (f/f₀) cos θ + β
+
+and the main beam squints to cos θ_b = cos θ₀ · f₀/f, while the grating lobe
+of order k sits at cos θ_k = (cos θ₀ + k/d) · f₀/f and enters visible space
+as the frequency rises (see ``src.engine.grating_lobes``). A true-time-delay
+taper scales β with f instead and keeps the beam on θ₀. The whole θ × frequency map is a single Dirichlet
+evaluation over the broadcast (frequency, θ) grid, filled in row blocks of at
+most ``ENGINE_CHUNK_ELEMENTS`` entries.
+"""
+import numpy as np
+from src.config.constants import ENGINE_CHUNK_ELEMENTS
+from src.engine.array_factor import theta_grid, steering_phase, main_beam_angle
+from src.engine.cache import cached_pattern
+from src.engine.directivity import uniform_directivity, to_dbi
+from src.engine.grating_lobes import grating_lobe_onset
+from src.engine.kernels import dirichlet
+
+# Fractional half-power bandwidth of a uniform array's gain towards θ₀ times N·d·|cos θ₀|
+SQUINT_BANDWIDTH_FACTOR = 0.886
+# |cos θ₀| below which the beam counts as broadside, where phase steering does not squint
+BROADSIDE_TOLERANCE = 1e-9
+
+
+@cached_pattern
+def wideband_pattern(N, d, theta_steer_deg, frequency_ratio, theta=None, true_time_delay=False,
+                     dtype=np.float32):
+    """
+    Patterns of a steered uniform linear array over a band of frequencies.
+
+    Parameters:
+    - N (int): Number of elements
+    - d (float): Element spacing in wavelengths at the design frequency
+    - theta_steer_deg (float): Steering angle at the design frequency in degrees
+    - frequency_ratio (ndarray): Frequencies f/f₀, one map row each
+    - theta (ndarray): Observation angles in radians, defaults to ``theta_grid()``
+    - true_time_delay (bool): Scale the progressive phase with frequency
+      (time delays) instead of holding it at its design value (phase shifters)
+    - dtype: Map dtype; float32 halves memory for large grids
+
+    Returns:
+    - dict with ``theta``, ``frequency_ratio``, the ``af`` map of shape
+      (len(frequency_ratio), len(theta)) relative to the coherent gain N (a
+      row peaks below 1 once its beam leaves visible space), the main-beam
+      direction ``beam_deg`` and ``squint_deg`` per frequency (NaN outside
+      visible space), the relative gain towards θ₀ ``target_gain``, the
+      approximate fractional half-power ``squint_bandwidth`` (inf when the beam
+      does not squint), the grating-lobe ``onset_ratio`` and the
+      directivities ``directivity_dbi``
+    """
+    theta = theta_grid() if theta is None else theta
+    frequency_ratio = np.asarray(frequency_ratio, dtype=float)
+    d_electrical = d * frequency_ratio
+    if true_time_delay:
+        beta = steering_phase(d_electrical, theta_steer_deg)
+    else:
+        beta = np.full(len(frequency_ratio), steering_phase(d, theta_steer_deg))
+
+    AF = np.empty((len(frequency_ratio), len(theta)), dtype=dtype)
+    rows = max(1, ENGINE_CHUNK_ELEMENTS // len(theta))
+    work = np.empty((min(rows, len(AF)), len(theta)), dtype=dtype)
+    cos_theta = np.cos(theta)
+    for start in range(0, len(AF), rows):
+        block = AF[start:start + rows]
+        np.multiply(2 * np.pi * d_electrical[start:start + rows, None], cos_theta, out=block)
+        block += beta[start:start + rows, None]
+        dirichlet(N, block, out=block, work=work[:len(block)])
+
+    beam_deg = main_beam_angle(d_electrical, beta)
+    cos_steer = np.cos(np.radians(theta_steer_deg))
+    target_gain = dirichlet(N, 2 * np.pi * d_electrical * cos_steer + beta)
+    if true_time_delay or abs(cos_steer) < BROADSIDE_TOLERANCE:
+        squint_bandwidth = np.inf
+    else:
+        squint_bandwidth = SQUINT_BANDWIDTH_FACTOR / (N * d * abs(cos_steer))
+    return {
+        'theta': theta,
+        'frequency_ratio': frequency_ratio,
+        'af': AF,
+        'beam_deg': beam_deg,
+        'squint_deg': beam_deg - theta_steer_deg,
+        'target_gain': target_gain,
+        'squint_bandwidth': squint_bandwidth,
+        'onset_ratio': grating_lobe_onset(d, theta_steer_deg, true_time_delay),
+        'directivity_dbi': to_dbi(uniform_directivity(N, d_electrical, beta))
+    }
@@ -2,14 +2,16 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 from src.plots.base_plot import BasePlot
-from src.config.constants import DEFAULT_N, DEFAULT_D
+from src.engine.array_factor import array_factor_3d, electrical_spacing
+from src.engine.sampling import lobe_resolution
+from src.config.constants import DEFAULT_N, DEFAULT_D, DEFAULT_GRID_POINTS, GRID_RESOLUTIONS, MIN_POINTS_PER_LOBE
 
 class ArrayFactor3D(BasePlot):
     def __init__(self):
         super().__init__()
         self.title = "3D Array Factor Pattern"
     
-    def plot(self, N, d, wavelength=1.0, color=None, name=None):
+    def plot(self, N, d, wavelength=1.0, grid_points=DEFAULT_GRID_POINTS, color=None, name=None):
         """
         Generate a 3D surface plot of the array factor across azimuth and elevation.
         
@@ -17,35 +19,26 @@ class ArrayFactor3D(BasePlot):
         - N (int): Number of elements
         - d (float): Element spacing in wavelengths
         - wavelength (float): Wavelength of operation
+        - grid_points (int): Number of azimuth and elevation samples
         - color (str): Color for the plot
         - name (str): Name for the plot in the legend
         """
-        # Create meshgrid for azimuth and elevation
-        az = np.linspace(0, 2 * np.pi, 100)
-        el = np.linspace(0, np.pi, 100)
-        AZ, EL = np.meshgrid(az, el)
-        
-        # Calculate array factor
-        mu = 2 * np.pi * d * np.cos(EL)
-        AF = np.abs(np.sin(N * mu / 2) / (N * np.sin(mu / 2)))
-        AF_normalized = AF / np.max(AF)
+        result = array_factor_3d(N, d, wavelength, num_az=grid_points, num_el=grid_points)
+        result = {**result, 'points_per_lobe': lobe_resolution(result['el'], N, electrical_spacing(d, wavelength))}
+        return self.render(result, name or f'N={N}, d={d}λ')
+    
+    def render(self, result, name):
+        """
+        Build the 3D surface and az/el contour figures for a gridded pattern.
         
-        # Convert to Cartesian coordinates for 3D plotting
-        X = AF_normalized * np.sin(EL) * np.cos(AZ)
-        Y = AF_normalized * np.sin(EL) * np.sin(AZ)
-        Z = AF_normalized * np.cos(EL)
+        Parameters:
+        - result (dict): Engine output with ``az``, ``el``, ``af``, ``x``, ``y`` and ``z``
+        - name (str): Name for the plot in the legend
+        """
+        self.result = result
         
         # Create 3D surface plot
-        fig_3d = go.Figure()
-        fig_3d.add_trace(go.Surface(
-            x=X, y=Y, z=Z,
-            colorscale='Viridis',
-            showscale=True,
-            name=name or f'N={N}, d={d}λ'
-        ))
-        
-        # Update layout for 3D plot
-        fig_3d.update_layout(
+        fig_3d = self.new_figure('surface', dict(
             title=self.title,
             scene=dict(
                 xaxis_title='X',
@@ -60,21 +53,16 @@ class ArrayFactor3D(BasePlot):
                 xanchor="left",
                 x=1.02
             )
-        )
-        
-        # Create contour plot
-        fig_contour = go.Figure()
-        fig_contour.add_trace(go.Contour(
-            x=np.degrees(az),
-            y=np.degrees(el),
-            z=AF_normalized,
+        ))
+        fig_3d.add_trace(go.Surface(
+            x=result['x'], y=result['y'], z=result['z'],
             colorscale='Viridis',
             showscale=True,
-            name=name or f'N={N}, d={d}λ'
+            name=name
         ))
         
-        # Update layout for contour plot
-        fig_contour.update_layout(
+        # Create contour plot
+        fig_contour = self.new_figure('contour', dict(
             title="Array Factor Contour Plot",
             xaxis_title="Azimuth (degrees)",
             yaxis_title="Elevation (degrees)",
@@ -85,14 +73,39 @@ class ArrayFactor3D(BasePlot):
                 xanchor="left",
                 x=1.02
             )
-        )
+        ))
+        fig_contour.add_trace(go.Contour(
+            x=np.degrees(result['az']),
+            y=np.degrees(result['el']),
+            z=result['af'],
+            colorscale='Viridis',
+            showscale=True,
+            name=name
+        ))
         
         return fig_3d, fig_contour
     
+    def notices(self):
+        """Warn when the az/el grid of the current surface is too coarse for the array's lobes."""
+        if self.result is None or 'az' not in self.result:
+            return []
+        points = self.result.get('points_per_lobe', np.inf)
+        if points >= MIN_POINTS_PER_LOBE:
+            return []
+        return [('warning', f"⚠️ The {len(self.result['el'])}×{len(self.result['az'])} grid has only {points:.2g} "
+                            f"samples per sidelobe (at least {MIN_POINTS_PER_LOBE} needed), so the surface misses "
+                            f"lobes and nulls")]
+    
     def get_controls(self):
         """Get the Streamlit controls for 3D array factor parameters."""
-        # No additional controls needed beyond N and d
-        return {}
+        grid_points = st.select_slider(
+            "Grid Resolution",
+            options=GRID_RESOLUTIONS,
+            value=st.session_state.get('grid_points', DEFAULT_GRID_POINTS),
+            help="Number of azimuth and elevation samples (N×N grid)"
+        )
+        st.session_state.grid_points = grid_points
+        return {'grid_points': grid_points}
     
     def get_about_text(self):
         return """
@@ -109,6 +122,7 @@ class ArrayFactor3D(BasePlot):
         #### Key Parameters
         - **Number of Elements (N)**: Affects the 3D pattern shape
         - **Element Spacing (d/λ)**: Influences the spatial distribution
+        - **Grid Resolution**: Number of azimuth/elevation samples; higher values give smoother surfaces
         
         #### Tips for Analysis
         - Rotate the 3D plot to examine the pattern from different angles
@@ -118,6 +132,7 @@ class ArrayFactor3D(BasePlot):
         
         #### Technical Details
         - The array factor is calculated in spherical coordinates
+        - For a linear array it depends only on elevation, so one elevation cut is computed and swept around in azimuth
         - Converted to Cartesian coordinates for 3D visualization
         - The pattern is normalized to show relative strength
         - The contour plot shows the pattern in azimuth-elevation space
@@ -0,0 +1,199 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from src.plots.base_plot import BasePlot
+from src.engine.array_factor import normalize, to_db, steering_phase
+from src.engine.directivity import tapered_directivity, to_dbi
+from src.engine.fft_pattern import linear_array_factor
+from src.engine.sampling import sample_theta, lobe_resolution
+from src.engine.synthesis import steering_matrix, sidelobe_mask, synthesize
+from src.config.constants import (
+    DEFAULT_RESOLUTION, MAX_SYNTHESIS_N, DEFAULT_SYNTHESIS_SLL_DB,
+    DEFAULT_DYNAMIC_RANGE_DB, DEFAULT_NULL_DEPTH_DB
+)
+
+
+def parse_angles(text):
+    """Comma-separated angles in degrees; raises ValueError for anything else."""
+    angles = [float(value) for value in text.replace(';', ',').split(',') if value.strip()]
+    if any(not 0 <= angle <= 180 for angle in angles):
+        raise ValueError("angles must lie between 0 and 180 degrees")
+    return tuple(angles)
+
+
+class ArraySynthesis(BasePlot):
+    def __init__(self):
+        super().__init__()
+        self.title = "Array Synthesis"
+        self.yaxis_title = "Normalized Array Factor (dB)"
+        # Synthesis result of the most recent plot() call
+        self.solution = None
+
+    def plot(self, N, d, theta_steer_deg=90.0, mainlobe_width=1.5, sll_db=DEFAULT_SYNTHESIS_SLL_DB,
+             sectors=(), nulls_deg=(), null_depth_db=DEFAULT_NULL_DEPTH_DB,
+             dynamic_range_db=DEFAULT_DYNAMIC_RANGE_DB, resolution=DEFAULT_RESOLUTION, color=None, name=None):
+        """
+        Synthesize weights for a sidelobe mask and plot their pattern against the mask.
+
+        The solve is warm-started from the weights of the previous rerun, so
+        dragging a mask slider only needs a few iterations.
+
+        Parameters:
+        - N (int): Number of elements, at most ``MAX_SYNTHESIS_N``
+        - d (float): Element spacing in wavelengths
+        - theta_steer_deg (float): Main-beam direction in degrees
+        - mainlobe_width (float): Half-width of the main-lobe region in null spacings
+        - sll_db (float): Sidelobe ceiling in dB
+        - sectors (tuple): ``(theta_start_deg, theta_stop_deg, level_db)`` sectors with their own ceiling
+        - nulls_deg (tuple): Null directions in degrees
+        - null_depth_db (float): Ceiling in the null directions in dB
+        - dynamic_range_db (float): Largest weight amplitude ratio in dB, None for no limit
+        - resolution (str): Angular resolution policy ('adaptive', 'fixed' or 'max-points')
+        - color (str): Color for the plot
+        - name (str): Name for the plot in the legend
+        """
+        self.solution = None
+        if N > MAX_SYNTHESIS_N:
+            return self.new_figure(title=f"Array synthesis is limited to N ≤ {MAX_SYNTHESIS_N}")
+
+        u, _, _ = steering_matrix(N, float(d))
+        lower, upper = sidelobe_mask(N, d, u, theta_steer_deg, mainlobe_width, sll_db,
+                                     sectors, nulls_deg, null_depth_db)
+        with self.stage('compute'):
+            solution = synthesize(N, d, lower, upper, dynamic_range_db,
+                                  initial=st.session_state.get('synthesis_weights'))
+        st.session_state.synthesis_weights = solution['weights']
+
+        weights = solution['weights']
+        theta = sample_theta(N, d, resolution)
+        af = normalize(linear_array_factor(weights, d, theta))
+        amplitude = np.abs(weights)
+        # The weights carry the steering phase; split it off as β so the
+        # directivity peak is also evaluated exactly at the main beam
+        beta = steering_phase(d, theta_steer_deg)
+        unsteered = weights * np.exp(-1j * beta * np.arange(N))
+        self.solution = solution
+        self.result = {
+            'theta': theta,
+            'af': af,
+            'weights': weights,
+            'target_deg': theta_steer_deg,
+            'desired_sll_db': sll_db,
+            'directivity_dbi': to_dbi(tapered_directivity(unsteered, d, beta)),
+            'points_per_lobe': lobe_resolution(theta, N, d),
+            'labels': [name or "Synthesized"]
+        }
+
+        floor = min(sll_db, null_depth_db, *(level for _, _, level in sectors)) - 20
+        status = "meets the mask" if solution['converged'] else f"exceeds the mask by {solution['excess_db']:.1f} dB"
+        if amplitude.min() > 0:
+            weight_range = f"{20 * np.log10(amplitude.max() / amplitude.min()):.1f} dB"
+        else:
+            weight_range = "unbounded"
+        fig = self.new_figure(
+            title=(f"{self.title}: {status} after {solution['iterations']} iterations, "
+                   f"weight range {weight_range}"),
+            yaxis_range=[floor, 3]
+        )
+        fig.add_trace(go.Scatter(
+            x=np.degrees(theta),
+            y=to_db(af, floor),
+            mode='lines',
+            name=name or f'N={N}, d={d}λ, synthesized',
+            line=dict(color=color or '#1f77b4', width=2)
+        ))
+        fig.add_trace(go.Scatter(
+            x=np.degrees(np.arccos(u)),
+            y=to_db(upper, floor),
+            mode='lines',
+            name="Mask (upper bound)",
+            line=dict(color='red', width=1, dash='dash')
+        ))
+        return fig
+
+    def notices(self):
+        """Warn when the most recent solve did not meet the mask."""
+        if self.solution is None or self.solution['converged']:
+            return []
+        return [('warning', f"⚠️ The mask could not be met: the best weights exceed it by "
+                            f"{self.solution['excess_db']:.1f} dB after {self.solution['iterations']} iterations. "
+                            "Widen the main lobe, raise the ceilings or loosen the dynamic range limit.")]
+    
+    def get_controls(self):
+        """Get the Streamlit controls for the synthesis mask."""
+        theta_steer_deg = st.slider(
+            "Main Beam Direction (degrees)", 0, 180,
+            value=st.session_state.get('synthesis_steer', 90),
+            help="Direction in which the synthesized pattern has unit gain"
+        )
+        st.session_state.synthesis_steer = theta_steer_deg
+        mainlobe_width = st.slider(
+            "Main Lobe Half-Width (null spacings)", 1.0, 4.0, 1.5, 0.1,
+            help="Unconstrained region around the main beam, in units of 1/(N·d/λ) in cos θ; "
+                 "1 is the first null of a uniform array"
+        )
+        sll_db = st.slider("Sidelobe Ceiling (dB)", -60, -10, DEFAULT_SYNTHESIS_SLL_DB,
+                           help="Upper bound on every sidelobe")
+
+        sectors = ()
+        if st.checkbox("Deep Sidelobe Sector", value=False, help="A sector with its own, lower ceiling"):
+            sector = st.slider("Sector (degrees)", 0, 180, (120, 150))
+            sector_db = st.slider("Sector Ceiling (dB)", -80, -10, -45)
+            sectors = ((sector[0], sector[1], sector_db),)
+
+        nulls_deg = ()
+        nulls_text = st.text_input("Null Directions (degrees)", value="",
+                                   help="Comma-separated interferer directions, e.g. 60, 130")
+        try:
+            nulls_deg = parse_angles(nulls_text)
+        except ValueError as e:
+            st.error(f"Invalid null directions: {e}")
+        null_depth_db = st.slider("Null Depth (dB)", -90, -30, DEFAULT_NULL_DEPTH_DB,
+                                  help="Ceiling of the pattern in the null directions")
+
+        dynamic_range_db = None
+        if st.checkbox("Limit Amplitude Dynamic Range", value=True,
+                       help="Bound the ratio of the largest to the smallest weight amplitude"):
+            dynamic_range_db = st.slider("Dynamic Range (dB)", 3, 60, DEFAULT_DYNAMIC_RANGE_DB)
+
+        return {
+            'theta_steer_deg': theta_steer_deg,
+            'mainlobe_width': mainlobe_width,
+            'sll_db': sll_db,
+            'sectors': sectors,
+            'nulls_deg': nulls_deg,
+            'null_depth_db': null_depth_db,
+            'dynamic_range_db': dynamic_range_db,
+            'resolution': self.get_resolution_control()
+        }
+
+    def get_about_text(self):
+        return """
+        ### Array Synthesis
+
+        This visualization computes complex element weights whose pattern fits an angular mask, going beyond the single sidelobe target of a Chebyshev taper.
+
+        #### What You're Seeing
+        - The synthesized pattern in dB
+        - The mask: unit gain at the main beam, a sidelobe ceiling elsewhere, optional deeper sectors and nulls
+        - The title reports whether the mask is met, the iterations used and the weight amplitude range
+        - A warning below the plot when the mask cannot be met
+
+        #### Key Parameters
+        - **Main Beam Direction**: Where the pattern is normalized to 0 dB
+        - **Main Lobe Half-Width**: Width of the unconstrained region around the main beam
+        - **Sidelobe Ceiling / Deep Sidelobe Sector**: Upper bounds on the sidelobes
+        - **Null Directions / Null Depth**: Interferer directions that must stay below the null depth
+        - **Dynamic Range**: Limit on the largest-to-smallest weight amplitude ratio
+
+        #### Tips for Analysis
+        - Narrow the main lobe or lower the ceiling until the mask can no longer be met to find the trade-off limit
+        - A tight dynamic range limit costs sidelobe depth; loosen it to see how much
+        - Drag sliders in small steps: every solve starts from the previous weights
+
+        #### Technical Details
+        - Alternating projections: the pattern f = A w on a uniform cos θ grid is clipped into the mask, the least-squares weights w = A⁺f are computed and their amplitudes are clipped to the dynamic range
+        - The steering matrix A and its pseudo-inverse are computed once per (N, d/λ), so an iteration costs two matrix-vector products
+        - The weights include the steering phase; the directivity splits it off as β = -2πd cos θ₀
+        - Synthesis is limited to N ≤ 512 elements
+        """
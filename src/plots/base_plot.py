@@ -1,23 +1,70 @@
 from abc import ABC, abstractmethod
+import plotly.graph_objects as go
 import streamlit as st
+from streamlit import runtime
 from src.utils.plot_utils import get_plot_layout
+from src.utils.profiling import profiler
+from src.config.constants import RESOLUTION_POLICIES, DEFAULT_RESOLUTION
 
 class BasePlot(ABC):
     def __init__(self):
         self.title = ""
         self.xaxis_title = "Angle θ (degrees)"
         self.yaxis_title = "Normalized Array Factor"
+        # Engine result behind the most recent plot() call, used for metrics
+        self.result = None
     
     @abstractmethod
     def plot(self, **kwargs):
         """Generate the plot with the given parameters."""
         pass
     
+    def compute_batch(self, N, d, **params):
+        """
+        Compute normalized patterns for many configurations in one call.
+        
+        Used for comparison overlays; each parameter is a 1D array with one
+        entry per configuration. Returns a dict with the shared ``theta`` axis
+        and an ``af`` matrix with one row per configuration.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batched patterns")
+    
+    def comparison_batch(self):
+        """
+        Configurations of the most recent plot() call that can be bulk-added to the comparisons.
+        
+        Returns None, or a ``(plot_type, columns)`` tuple with a comparable
+        plot type and one 1D array per comparison parameter, N and d included.
+        """
+        return None
+    
+    def notices(self):
+        """
+        Status messages about the most recent plot() call, shown below its figure.
+        
+        Returns a list of ``(level, message)`` tuples, where level names a
+        Streamlit status element ('success', 'info' or 'warning'). plot()
+        itself emits no Streamlit elements.
+        """
+        return []
+    
     @abstractmethod
     def get_controls(self):
         """Get the Streamlit controls for this plot type."""
         pass
     
+    def get_resolution_control(self):
+        """Get the angular resolution policy selector shared by the 1D plots."""
+        resolution = st.selectbox(
+            "Angular Resolution",
+            RESOLUTION_POLICIES,
+            index=RESOLUTION_POLICIES.index(st.session_state.get('resolution', DEFAULT_RESOLUTION)),
+            help="adaptive: density follows the beamwidth and is refined around peaks and nulls; "
+                 "fixed: 1000 uniform points; max-points: densest uniform grid"
+        )
+        st.session_state.resolution = resolution
+        return resolution
+    
     def get_about_text(self):
         """Get the about text for this plot type."""
         return """
@@ -33,4 +80,41 @@ class BasePlot(ABC):
     
     def get_layout(self):
         """Get the common layout settings for this plot type."""
-        return get_plot_layout(self.title, self.xaxis_title, self.yaxis_title) 
\ No newline at end of file
+        return get_plot_layout(self.title, self.xaxis_title, self.yaxis_title)
+    
+    def stage(self, name):
+        """Time a named render stage in the shared profiler (a no-op unless profiling is on)."""
+        return profiler.stage(name)
+    
+    def new_figure(self, name='main', layout=None, **updates):
+        """
+        Empty figure carrying this plot's layout, ready for new traces.
+        
+        Inside a Streamlit session the laid-out figure is kept per session,
+        plot class and ``name`` and reused on later reruns with its traces
+        and animation frames cleared, so the full layout (template included) is validated only
+        once. ``layout`` replaces the common layout; ``updates`` are applied
+        on every call and must therefore list everything that can change.
+        """
+        templates = st.session_state.setdefault('figure_templates', {}) if runtime.exists() else {}
+        key = (type(self).__name__, name)
+        fig = templates.get(key)
+        if fig is None:
+            fig = go.Figure()
+            self.apply_layout(fig, layout, **updates)
+            templates[key] = fig
+        else:
+            fig.data = []
+            fig.frames = []
+            if updates:
+                with self.stage('layout'):
+                    # Overwrite so that list properties such as sliders can be emptied
+                    fig.update_layout(updates, overwrite=True)
+        return fig
+    
+    def apply_layout(self, fig, layout=None, **updates):
+        """Apply ``layout`` (the common layout by default) plus ``updates`` to ``fig``, timed as the layout stage."""
+        with self.stage('layout'):
+            layout = dict(layout or self.get_layout())
+            layout.update(updates)
+            fig.update_layout(layout) 
\ No newline at end of file
@@ -2,44 +2,124 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 from src.plots.base_plot import BasePlot
-from src.config.constants import DEFAULT_N, DEFAULT_D, DEFAULT_THETA_STEER
+from src.engine.array_factor import beam_steering, beam_steering_batch, steering_scan, electrical_spacing
+from src.engine.sampling import sample_pattern, sample_theta, lobe_resolution, undersampled
+from src.config.constants import (
+    DEFAULT_N, DEFAULT_D, DEFAULT_THETA_STEER, DEFAULT_RESOLUTION,
+    SCAN_ANIMATION_STEP_DEG, SCAN_ANIMATION_POINTS, MAX_THETA_POINTS
+)
 
 class BeamSteering(BasePlot):
     def __init__(self):
         super().__init__()
         self.title = "Beam Steering Pattern"
     
-    def plot(self, N, d, theta_steer_deg, wavelength=1.0, color=None, name=None):
+    def plot(self, N, d, theta_steer_deg, wavelength=1.0, resolution=DEFAULT_RESOLUTION, animate=False,
+             color=None, name=None):
         """
         Plot the beam-steered radiation pattern of a ULA.
         
+        The patterns of every whole-degree steering angle are computed once per
+        (N, d, θ grid) as a scan cube, so moving the steering slider only
+        selects a row of it.
+        
         Parameters:
         - N (int): Number of antenna elements
         - d (float): Element spacing in wavelengths
         - theta_steer_deg (float): Desired steering angle in degrees
         - wavelength (float): Wavelength of operation
+        - resolution (str): Angular resolution policy ('adaptive', 'fixed' or 'max-points')
+        - animate (bool): Add a client-side animation of the full steering scan
         - color (str): Color for the plot
         - name (str): Name for the plot in the legend
         """
-        theta = np.linspace(0, np.pi, 1000)
-        theta_steer = np.radians(theta_steer_deg)
-        beta = -2 * np.pi * d * np.cos(theta_steer)
-        mu = 2 * np.pi * d * np.cos(theta) + beta
-        AF = np.abs(np.sin(N * mu / 2) / (N * np.sin(mu / 2)))
-        AF_normalized = AF / np.max(AF)
+        # One θ grid shared by every steering angle, so no per-angle refinement;
+        # it holds a row per angle, so its size is capped
+        d_actual = electrical_spacing(d, wavelength)
+        theta = sample_theta(N, d_actual, resolution, max_points=MAX_THETA_POINTS)
+        scan = steering_scan(N, d_actual, theta=theta)
+        rows = np.flatnonzero(scan['steer_deg'] == theta_steer_deg)
+        row = rows[0] if len(rows) else None
+        if row is not None and not undersampled(theta, N, d_actual):
+            self.result = {
+                'theta': theta,
+                'af': scan['af'][row].astype(float),
+                'beta': scan['beta'][row],
+                'target_deg': theta_steer_deg,
+                'directivity_dbi': scan['directivity_dbi'][row],
+                'points_per_lobe': lobe_resolution(theta, N, d_actual)
+            }
+        else:
+            # Off the scan, or too coarse for its metrics: sample this angle on its own
+            self.result = sample_pattern(
+                beam_steering, resolution, N, d, d_actual,
+                theta_steer_deg=theta_steer_deg, wavelength=wavelength
+            )
+        
+        if animate:
+            return self.animated_figure(scan, row, N, d, color, name)
         
-        fig = go.Figure()
+        fig = self.new_figure(updatemenus=[], sliders=[])
         fig.add_trace(go.Scatter(
-            x=np.degrees(theta),
-            y=AF_normalized,
+            x=np.degrees(self.result['theta']),
+            y=self.result['af'],
             mode='lines',
             name=name or f'N={N}, d={d}λ, θ={theta_steer_deg}°',
             line=dict(color=color or '#1f77b4', width=2)
         ))
+        return fig
+    
+    def animated_figure(self, scan, row, N, d, color=None, name=None):
+        """
+        Figure whose frames replay the steering scan in the browser.
+        
+        Frames are taken every ``SCAN_ANIMATION_STEP_DEG`` degrees on a θ grid
+        thinned to at most ``SCAN_ANIMATION_POINTS`` points, and only restyle
+        the first trace, so comparison overlays stay in place while playing.
+        """
+        stride = int(np.ceil(len(scan['theta']) / SCAN_ANIMATION_POINTS))
+        frame_rows = np.flatnonzero(scan['steer_deg'] % SCAN_ANIMATION_STEP_DEG == 0)
+        labels = [f"{angle:g}" for angle in scan['steer_deg'][frame_rows]]
+        start = 0 if row is None else int(np.argmin(np.abs(frame_rows - row)))
         
-        fig.update_layout(self.get_layout())
+        frame_args = dict(mode='immediate', frame=dict(duration=0, redraw=False), transition=dict(duration=0))
+        fig = self.new_figure(
+            updatemenus=[dict(
+                type='buttons',
+                direction='left',
+                showactive=False,
+                x=0, y=-0.2, xanchor='left', yanchor='top',
+                buttons=[
+                    dict(label="▶ Play", method='animate', args=[None, dict(
+                        frame=dict(duration=60, redraw=False), transition=dict(duration=0), fromcurrent=True
+                    )]),
+                    dict(label="⏸ Pause", method='animate', args=[[None], frame_args])
+                ]
+            )],
+            sliders=[dict(
+                active=start,
+                x=0.15, y=-0.2, len=0.85, xanchor='left', yanchor='top',
+                currentvalue=dict(prefix="θ₀ = ", suffix="°"),
+                steps=[dict(method='animate', label=label, args=[[label], frame_args]) for label in labels]
+            )]
+        )
+        fig.add_trace(go.Scatter(
+            x=np.degrees(scan['theta'][::stride]),
+            y=scan['af'][frame_rows[start], ::stride],
+            mode='lines',
+            name=name or f'N={N}, d={d}λ, steering scan',
+            line=dict(color=color or '#1f77b4', width=2)
+        ))
+        fig.frames = [
+            go.Frame(data=[dict(type='scatter', y=scan['af'][i, ::stride])], traces=[0], name=label)
+            for i, label in zip(frame_rows, labels)
+        ]
         return fig
     
+    def compute_batch(self, N, d, theta_steer_deg, wavelength=1.0, theta=None):
+        """Compute normalized patterns for arrays of parameters in one broadcast."""
+        return beam_steering_batch(N, d, theta_steer_deg, wavelength, theta)
+    
     def get_controls(self):
         """Get the Streamlit controls for beam steering parameters."""
         theta_steer_deg = st.slider(
@@ -49,7 +129,16 @@ class BeamSteering(BasePlot):
             help="Desired steering angle in degrees"
         )
         st.session_state.theta_steer_deg = theta_steer_deg
-        return {'theta_steer_deg': theta_steer_deg}
+        animate = st.checkbox(
+            "Animate Steering Scan",
+            value=False,
+            help=f"Play the 0–180° scan in the browser in {SCAN_ANIMATION_STEP_DEG}° steps without reruns"
+        )
+        return {
+            'theta_steer_deg': theta_steer_deg,
+            'resolution': self.get_resolution_control(),
+            'animate': animate
+        }
     
     def get_about_text(self):
         return """
@@ -72,10 +161,12 @@ class BeamSteering(BasePlot):
         - Observe how the pattern distorts at large steering angles
         - Compare different element spacings to find the steering limits
         - Use the comparison feature to see how N affects steering precision
+        - Turn on "Animate Steering Scan" and press Play to sweep the beam from endfire to endfire
         
         #### Technical Details
         - The phase shift (β) is calculated as: β = -2πd cos(θ₀)
         - The array factor is: AF = |sin(Nμ/2)/(N sin(μ/2))|
         - Where μ = 2πd cos(θ) + β
         - The pattern is normalized to show relative strength
+        - Steering only shifts the pattern in u = cos θ, so all whole-degree steering angles are computed at once per (N, d) and the slider just selects one
         """ 
\ No newline at end of file
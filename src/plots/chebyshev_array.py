@@ -1,16 +1,17 @@
 import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
-from scipy.signal import chebwin
 from src.plots.base_plot import BasePlot
-from src.config.constants import DEFAULT_N, DEFAULT_D, DEFAULT_R_DB
+from src.engine.array_factor import chebyshev_array, chebyshev_array_batch, electrical_spacing
+from src.engine.sampling import sample_pattern
+from src.config.constants import DEFAULT_N, DEFAULT_D, DEFAULT_R_DB, DEFAULT_RESOLUTION
 
 class ChebyshevArray(BasePlot):
     def __init__(self):
         super().__init__()
         self.title = "Chebyshev Array Pattern"
     
-    def plot(self, N, d, R_dB, wavelength=1.0, color=None, name=None):
+    def plot(self, N, d, R_dB, wavelength=1.0, resolution=DEFAULT_RESOLUTION, color=None, name=None):
         """
         Plot the radiation pattern of a Chebyshev-tapered antenna array.
         
@@ -19,23 +20,18 @@ class ChebyshevArray(BasePlot):
         - d (float): Element spacing in wavelengths
         - R_dB (float): Desired sidelobe level in decibels
         - wavelength (float): Wavelength of operation
+        - resolution (str): Angular resolution policy ('adaptive', 'fixed' or 'max-points')
         - color (str): Color for the plot
         - name (str): Name for the plot in the legend
         """
-        theta = np.linspace(0, np.pi, 1000)
-        weights = chebwin(N, at=R_dB)
-        AF = np.zeros_like(theta, dtype=complex)
+        result = sample_pattern(chebyshev_array, resolution, N, d, electrical_spacing(d, wavelength),
+                                R_dB=R_dB, wavelength=wavelength)
+        self.result = result
         
-        for n in range(N):
-            AF += weights[n] * np.exp(1j * 2 * np.pi * d * n * np.cos(theta))
-        
-        AF = np.abs(AF)
-        AF_normalized = AF / np.max(AF)
-        
-        fig = go.Figure()
+        fig = self.new_figure()
         fig.add_trace(go.Scatter(
-            x=np.degrees(theta),
-            y=AF_normalized,
+            x=np.degrees(result['theta']),
+            y=result['af'],
             mode='lines',
             name=name or f'N={N}, d={d}λ, R={R_dB} dB',
             line=dict(color=color or '#1f77b4', width=2)
@@ -44,15 +40,17 @@ class ChebyshevArray(BasePlot):
         # Add a horizontal line at the desired sidelobe level
         fig.add_trace(go.Scatter(
             x=[0, 180],
-            y=[10**(-R_dB/20), 10**(-R_dB/20)],
+            y=[result['sll'], result['sll']],
             mode='lines',
             name=f'Desired SLL ({R_dB} dB)',
             line=dict(color='red', width=1, dash='dash')
         ))
-        
-        fig.update_layout(self.get_layout())
         return fig
     
+    def compute_batch(self, N, d, R_dB, wavelength=1.0, theta=None):
+        """Compute normalized patterns for arrays of parameters in one broadcast."""
+        return chebyshev_array_batch(N, d, R_dB, wavelength, theta)
+    
     def get_controls(self):
         """Get the Streamlit controls for Chebyshev array parameters."""
         R_dB = st.slider(
@@ -62,7 +60,7 @@ class ChebyshevArray(BasePlot):
             help="Desired sidelobe level in decibels"
         )
         st.session_state.R_dB = R_dB
-        return {'R_dB': R_dB}
+        return {'R_dB': R_dB, 'resolution': self.get_resolution_control()}
     
     def get_about_text(self):
         return """
@@ -90,6 +88,7 @@ class ChebyshevArray(BasePlot):
         #### Technical Details
         - Uses Chebyshev window to generate array weights
         - The array factor is calculated as: AF = |Σ wₙ exp(j2πnd cos(θ))|
+        - For larger arrays the sum is evaluated with a zero-padded FFT in ψ = 2πd cos(θ) space and interpolated onto θ when a static cost model (about L·log₂L for an L-point FFT plus a fixed cost per angle) predicts it is cheaper than the N·len(θ) terms of direct summation
         - Where wₙ are the Chebyshev weights
         - The pattern is normalized to show relative strength
         - The dashed red line shows the desired sidelobe level in linear scale
@@ -2,14 +2,16 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 from src.plots.base_plot import BasePlot
-from src.config.constants import DEFAULT_N, DEFAULT_D, DEFAULT_WAVELENGTH
+from src.engine.array_factor import grating_lobe_check, grating_lobe_check_batch
+from src.engine.sampling import sample_pattern
+from src.config.constants import DEFAULT_WAVELENGTH, DEFAULT_RESOLUTION
 
 class GratingLobeCheck(BasePlot):
     def __init__(self):
         super().__init__()
         self.title = "Grating Lobe Check"
     
-    def plot(self, N, d, wavelength, color=None, name=None):
+    def plot(self, N, d, wavelength, resolution=DEFAULT_RESOLUTION, color=None, name=None):
         """
         Check for the presence of grating lobes and plot the radiation pattern.
         
@@ -17,55 +19,57 @@ class GratingLobeCheck(BasePlot):
         - N (int): Number of elements
         - d (float): Element spacing in wavelengths
         - wavelength (float): Wavelength of operation
+        - resolution (str): Angular resolution policy ('adaptive', 'fixed' or 'max-points')
         - color (str): Color for the plot
         - name (str): Name for the plot in the legend
         """
-        # Calculate critical spacing
-        critical_spacing = wavelength / 2
-        d_actual = d * wavelength
-        
-        # Calculate array factor
-        theta = np.linspace(0, np.pi, 1000)
-        mu = 2 * np.pi * d * np.cos(theta)
-        AF = np.abs(np.sin(N * mu / 2) / (N * np.sin(mu / 2)))
-        AF_normalized = AF / np.max(AF)
+        result = sample_pattern(grating_lobe_check, resolution, N, d, wavelength=wavelength)
+        self.result = result
         
         # Create the plot
-        fig = go.Figure()
+        fig = self.new_figure()
         
         # Add the radiation pattern
         fig.add_trace(go.Scatter(
-            x=np.degrees(theta),
-            y=AF_normalized,
+            x=np.degrees(result['theta']),
+            y=result['af'],
             mode='lines',
             name=name or f'N={N}, d={d}λ, λ={wavelength:.2f}',
             line=dict(color=color or '#1f77b4', width=2)
         ))
         
-        # Add a vertical line at the critical spacing
-        if d_actual > critical_spacing:
-            # Find the angles where grating lobes occur
-            grating_lobe_angles = np.arccos(np.array([-1, 1]) * wavelength / d_actual)
-            for angle in grating_lobe_angles:
-                fig.add_trace(go.Scatter(
-                    x=[np.degrees(angle), np.degrees(angle)],
-                    y=[0, 1],
-                    mode='lines',
-                    name='Grating Lobe',
-                    line=dict(color='red', width=1, dash='dash')
-                ))
-        
-        # Update layout
-        fig.update_layout(self.get_layout())
-        
-        # Add warning or success message
-        if d_actual > critical_spacing:
-            st.warning(f"⚠️ Grating lobes likely: d = {d_actual:.2f} > λ/2 = {critical_spacing:.2f}")
-        else:
-            st.success(f"✅ No grating lobes: d = {d_actual:.2f} ≤ λ/2 = {critical_spacing:.2f}")
+        # Add vertical lines at the angles where grating lobes occur
+        for angle in result['grating_lobe_angles']:
+            fig.add_trace(go.Scatter(
+                x=[np.degrees(angle), np.degrees(angle)],
+                y=[0, 1],
+                mode='lines',
+                name='Grating Lobe',
+                line=dict(color='red', width=1, dash='dash')
+            ))
         
         return fig
     
+    def notices(self):
+        """Grating lobe assessment of the current configuration."""
+        if self.result is None:
+            return []
+        critical_spacing = self.result['critical_spacing']
+        d_actual = self.result['d_actual']
+        if self.result['has_grating_lobes']:
+            angles = ', '.join(f"{np.degrees(angle):.1f}°" for angle in self.result['grating_lobe_angles'])
+            return [('warning', f"⚠️ Grating lobes at broadside: d = {d_actual:.2f} ≥ λ, at θ = {angles}")]
+        low, high = self.result['scan_range_deg']
+        if d_actual <= critical_spacing:
+            return [('success', f"✅ No grating lobes at any steering angle: d = {d_actual:.2f} ≤ "
+                                f"(1 - 1/N)·λ/2 = {critical_spacing:.2f}")]
+        return [('info', f"ℹ️ No grating lobes at broadside, but only steering between {low:.1f}° and "
+                         f"{high:.1f}° is grating-lobe free; scanning to endfire needs d ≤ {critical_spacing:.2f}")]
+    
+    def compute_batch(self, N, d, wavelength, theta=None):
+        """Compute normalized patterns for arrays of parameters in one broadcast."""
+        return grating_lobe_check_batch(N, d, wavelength, theta)
+    
     def get_controls(self):
         """Get the Streamlit controls for grating lobe check parameters."""
         wavelength = st.slider(
@@ -75,7 +79,7 @@ class GratingLobeCheck(BasePlot):
             help="Wavelength of operation"
         )
         st.session_state.wavelength = wavelength
-        return {'wavelength': wavelength}
+        return {'wavelength': wavelength, 'resolution': self.get_resolution_control()}
     
     def get_about_text(self):
         return """
@@ -85,8 +89,8 @@ class GratingLobeCheck(BasePlot):
         
         #### What You're Seeing
         - The radiation pattern for your current configuration
-        - A warning if grating lobes are likely to occur
-        - The relationship between wavelength and element spacing
+        - A warning if grating lobes are visible at broadside
+        - The steering range that stays free of grating lobes otherwise
         - Dashed red lines indicating grating lobe locations (if present)
         
         #### Key Parameters
@@ -96,13 +100,15 @@ class GratingLobeCheck(BasePlot):
         
         #### Tips for Analysis
         - Compare different wavelengths to see how they affect the critical spacing
-        - Look for the λ/2 threshold in the warning message
+        - Look for the (1 - 1/N)·λ/2 threshold in the message below the plot
+        - Open the Grating Lobe Map to see the safe spacings for every steering angle at once
         - Use the comparison feature to see how different spacings affect grating lobes
         - Try to find the optimal spacing for your operating frequency
         
         #### Technical Details
-        - Grating lobes occur when d > λ/2
-        - The grating lobe angles are given by: θ = ±arccos(λ/d)
+        - Grating lobes lie at cos θ = cos θ₀ + kλ/d for integer k ≠ 0
+        - At broadside they are visible once d ≥ λ, at θ = arccos(±kλ/d)
+        - Keeping the nearest one, including its null-to-null width, out of visible space requires d ≤ (1 - 1/N)·λ / (1 + |cos θ₀|)
         - The array factor is calculated as: AF = |sin(Nμ/2)/(N sin(μ/2))|
         - Where μ = 2πd cos(θ)
         - The pattern is normalized to show relative strength
@@ -0,0 +1,149 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from src.plots.base_plot import BasePlot
+from src.engine.grating_lobes import grating_lobe_region, grating_lobe_margin, beam_cosine, max_spacing
+from src.config.constants import DEFAULT_THETA_STEER, GRATING_MAP_SPACING, GRATING_MAP_POINTS
+
+class GratingLobeMap(BasePlot):
+    def __init__(self):
+        super().__init__()
+        self.title = "Grating Lobe Map"
+        self.xaxis_title = "Element Spacing (d/λ at f₀)"
+        self.yaxis_title = "Steering Angle θ₀ (degrees)"
+        self.design = None
+
+    def plot(self, N, d, theta_steer_deg=DEFAULT_THETA_STEER, frequency_ratio=1.0, true_time_delay=False,
+             lobe_width=True, color=None, name=None):
+        """
+        Plot the grating-lobe margin over the plane of spacings and steering angles.
+
+        Parameters:
+        - N (int): Number of elements
+        - d (float): Element spacing in wavelengths at f₀, marked on the map
+        - theta_steer_deg (float): Steering angle at f₀ in degrees, marked on the map
+        - frequency_ratio (float): Highest operating frequency f/f₀
+        - true_time_delay (bool): Steer with time delays instead of fixed phase shifts
+        - lobe_width (bool): Keep the grating lobes' null-to-null width out of visible space, not just their peaks
+        - color (str): Unused, kept for a uniform plot interface
+        - name (str): Unused, kept for a uniform plot interface
+        """
+        elements = N if lobe_width else None
+        with self.stage('compute'):
+            region = grating_lobe_region(
+                np.linspace(*GRATING_MAP_SPACING, GRATING_MAP_POINTS), np.arange(0.0, 181.0),
+                elements, frequency_ratio, true_time_delay
+            )
+        margin = float(grating_lobe_margin(d * frequency_ratio,
+                                           beam_cosine(theta_steer_deg, frequency_ratio, true_time_delay),
+                                           elements))
+        self.design = {
+            'd': d,
+            'theta_steer_deg': theta_steer_deg,
+            'margin': margin,
+            'max_spacing': float(max_spacing(theta_steer_deg, elements, frequency_ratio, true_time_delay))
+        }
+
+        fig = self.new_figure(
+            title=f"{self.title} (N={N}, f/f₀ = {frequency_ratio:g}, "
+                  f"{'time delays' if true_time_delay else 'phase shifters'})",
+            showlegend=True,
+            legend=dict(orientation='h', y=-0.2)
+        )
+        fig.add_trace(go.Heatmap(
+            x=region['d'],
+            y=region['theta_steer_deg'],
+            z=np.clip(region['margin'], -1, 1),
+            zmid=0,
+            colorscale='RdYlGn',
+            colorbar=dict(title="Margin in u"),
+            showlegend=False
+        ))
+        fig.add_trace(go.Scatter(
+            x=region['max_spacing'],
+            y=region['theta_steer_deg'],
+            mode='lines',
+            name="Largest grating-lobe-free spacing",
+            line=dict(color='black', width=2)
+        ))
+        fig.add_trace(go.Scatter(
+            x=[d],
+            y=[theta_steer_deg],
+            mode='markers',
+            name=f"Design (d={d}λ, θ₀={theta_steer_deg}°)",
+            marker=dict(color='white', size=12, symbol='x', line=dict(color='black', width=1))
+        ))
+        return fig
+
+    def notices(self):
+        """Grating lobe status of the design point."""
+        if self.design is None:
+            return []
+        design = self.design
+        if design['margin'] < 0:
+            return [('warning', f"⚠️ Grating lobes enter visible space at θ₀ = {design['theta_steer_deg']}°: "
+                                f"d = {design['d']:.2f}λ > {design['max_spacing']:.3f}λ")]
+        return [('success', f"✅ No grating lobes at θ₀ = {design['theta_steer_deg']}°: "
+                            f"d = {design['d']:.2f}λ ≤ {design['max_spacing']:.3f}λ")]
+
+    def get_controls(self):
+        """Get the Streamlit controls for the grating lobe map."""
+        theta_steer_deg = st.slider(
+            "Steering Angle (degrees)",
+            0, 180,
+            value=st.session_state.get('theta_steer_deg', DEFAULT_THETA_STEER),
+            help="Steering angle of the design point marked on the map"
+        )
+        st.session_state.theta_steer_deg = theta_steer_deg
+        frequency_ratio = st.slider(
+            "Highest Frequency (f/f₀)",
+            0.5, 2.0,
+            value=1.0,
+            step=0.05,
+            help="Top of the operating band relative to the design frequency; grating lobes only grow with frequency"
+        )
+        true_time_delay = st.checkbox(
+            "True Time Delay",
+            value=False,
+            help="Steer with time delays, which keep the beam on θ₀ at every frequency, instead of fixed phase shifts"
+        )
+        lobe_width = st.checkbox(
+            "Include Grating Lobe Width",
+            value=True,
+            help="Keep the whole grating lobe (to its first nulls, 1/(Nd) wide in cos θ) out of visible space"
+        )
+        return {
+            'theta_steer_deg': theta_steer_deg,
+            'frequency_ratio': frequency_ratio,
+            'true_time_delay': true_time_delay,
+            'lobe_width': lobe_width
+        }
+
+    def get_about_text(self):
+        return """
+        ### Grating Lobe Map
+
+        This visualization shows at a glance which combinations of element spacing and steering angle are free of grating lobes.
+
+        #### What You're Seeing
+        - A map over the element spacing d/λ (horizontal) and the steering angle θ₀ (vertical)
+        - Color showing how far the nearest grating lobe stays outside visible space, in u = cos θ; red means it is visible
+        - The black boundary of the grating-lobe-free region and your design point
+
+        #### Key Parameters
+        - **Number of Elements (N)**: Sets the grating lobe width when it is included
+        - **Element Spacing (d/λ)** and **Steering Angle**: The design point on the map
+        - **Highest Frequency**: The top of the band, where grating lobes are worst
+        - **True Time Delay**: Time-delay steering instead of phase shifters
+
+        #### Tips for Analysis
+        - The boundary reaches d = λ/2 at endfire: the classic half-wavelength rule for full scan
+        - Raise the highest frequency to see the safe region shrink across a wide band
+        - Untick "Include Grating Lobe Width" to compare with the peak-only criterion
+
+        #### Technical Details
+        - Grating lobes lie at u = u₀ + kλ/d for integer k ≠ 0 and are visible when |u| ≤ 1
+        - With phase shifters u₀ = cos θ₀ · f₀/f and the spacing is d·f/f₀; time delays keep u₀ = cos θ₀
+        - The boundary is d ≤ (1 - 1/N) / (f/f₀ + |cos θ₀|) for phase shifters and (1 - 1/N) / (f/f₀ · (1 + |cos θ₀|)) for time delays
+        - The map is evaluated in closed form, without sampling any pattern
+        """
@@ -0,0 +1,143 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from src.plots.base_plot import BasePlot
+from src.engine.array_factor import to_db, main_beam_angle
+from src.engine.sweep import parameter_sweep
+from src.config.constants import SWEEP_PARAMETER_LABELS, DEFAULT_SWEEP_STEPS, DB_FLOOR
+
+# Slider limits and defaults for each sweepable parameter
+SWEEP_RANGES = {
+    'theta_steer': dict(min_value=0.0, max_value=180.0, value=(0.0, 180.0)),
+    'd': dict(min_value=0.1, max_value=2.0, value=(0.1, 1.0)),
+    'N': dict(min_value=2, max_value=64, value=(2, 32)),
+    'beta': dict(min_value=-np.pi, max_value=np.pi, value=(-np.pi, np.pi))
+}
+
+class ParameterSweep(BasePlot):
+    def __init__(self):
+        super().__init__()
+        self.title = "Parameter Sweep"
+        self.sweep = None
+    
+    def plot(self, N, d, sweep_parameter, sweep_range, steps=DEFAULT_SWEEP_STEPS, db_scale=True, color=None, name=None):
+        """
+        Plot the normalized array factor as a heatmap over θ and one swept parameter.
+        
+        Parameters:
+        - N (int): Number of elements (fixed unless N is swept)
+        - d (float): Element spacing in wavelengths (fixed unless d is swept)
+        - sweep_parameter (str): One of 'theta_steer', 'd', 'N' or 'beta'
+        - sweep_range (tuple): (min, max) of the swept parameter
+        - steps (int): Number of sweep values
+        - db_scale (bool): Show the pattern in dB instead of linear scale
+        - color (str): Unused, kept for a uniform plot interface
+        - name (str): Unused, kept for a uniform plot interface
+        """
+        if sweep_parameter == 'N':
+            values = np.unique(np.linspace(sweep_range[0], sweep_range[1], steps).round())
+        else:
+            values = np.linspace(sweep_range[0], sweep_range[1], steps)
+        
+        params = {'N': N, 'd': d}
+        params[sweep_parameter] = values
+        result = parameter_sweep(**params)
+        
+        # Drop the singleton axes so only (sweep value, θ) remains
+        AF = result['af'].reshape(len(values), -1)
+        z = to_db(AF, DB_FLOOR) if db_scale else AF
+        
+        if sweep_parameter == 'theta_steer':
+            target_deg = values
+        elif sweep_parameter == 'beta':
+            target_deg = main_beam_angle(d, values)
+        else:
+            target_deg = np.full(len(values), 90.0)
+        self.result = {
+            'theta': result['theta'],
+            'af': AF,
+            'target_deg': target_deg,
+            'directivity_dbi': result['directivity_dbi'].reshape(len(values)),
+            'labels': [f"{sweep_parameter}={value:.4g}" for value in values]
+        }
+        self.sweep = (sweep_parameter, values, N, d)
+        
+        fig = self.new_figure(
+            yaxis_title=SWEEP_PARAMETER_LABELS[sweep_parameter],
+            showlegend=False
+        )
+        fig.add_trace(go.Heatmap(
+            x=np.degrees(result['theta']),
+            y=values,
+            z=z,
+            colorscale='Viridis',
+            colorbar=dict(title="dB" if db_scale else "|AF|")
+        ))
+
+        return fig
+    
+    def comparison_batch(self):
+        """Swept configurations as Beam Steering comparisons for a steering sweep, else Basic Radiation Pattern ones."""
+        if self.sweep is None:
+            return None
+        sweep_parameter, values, N, d = self.sweep
+        if sweep_parameter == 'theta_steer':
+            return "Beam Steering", {'N': N, 'd': d, 'theta_steer_deg': values}
+        columns = {'N': N, 'd': d, 'beta': 0.0}
+        columns[sweep_parameter] = values
+        return "Basic Radiation Pattern", columns
+    
+    def get_controls(self):
+        """Get the Streamlit controls for the parameter sweep."""
+        sweep_parameter = st.selectbox(
+            "Swept Parameter",
+            list(SWEEP_PARAMETER_LABELS),
+            format_func=SWEEP_PARAMETER_LABELS.get,
+            help="Parameter varied along the vertical axis of the heatmap"
+        )
+        sweep_range = st.slider(
+            "Sweep Range",
+            **SWEEP_RANGES[sweep_parameter],
+            help="Range of the swept parameter"
+        )
+        steps = st.slider(
+            "Sweep Steps",
+            10, 400,
+            value=DEFAULT_SWEEP_STEPS,
+            help="Number of values between the range limits"
+        )
+        db_scale = st.checkbox("dB Scale", value=True, help="Show the pattern in decibels")
+        return {
+            'sweep_parameter': sweep_parameter,
+            'sweep_range': sweep_range,
+            'steps': steps,
+            'db_scale': db_scale
+        }
+    
+    def get_about_text(self):
+        return """
+        ### Parameter Sweep
+        
+        This visualization maps the radiation pattern against one array parameter, so whole design families can be read at a glance.
+        
+        #### What You're Seeing
+        - A heatmap with the angle θ on the horizontal axis
+        - The swept parameter (steering angle, spacing, N or β) on the vertical axis
+        - Color showing the normalized array factor, optionally in dB
+        
+        #### Key Parameters
+        - **Swept Parameter**: Which parameter varies along the vertical axis
+        - **Sweep Range / Steps**: Limits and resolution of the sweep
+        - **Number of Elements (N)** and **Element Spacing (d/λ)**: Held fixed unless swept
+        
+        #### Tips for Analysis
+        - Sweep the steering angle to watch the main beam track θ₀ and broaden near endfire
+        - "Add Sweep to Comparisons" overlays every swept configuration in the Beam Steering (steering sweeps) or Basic Radiation Pattern view
+        - Sweep d/λ to see grating lobes appear once the spacing grows too large
+        - Sweep N to see the main beam narrow as the array grows
+        
+        #### Technical Details
+        - All configurations are evaluated with numpy broadcasting in memory-bounded blocks
+        - The array factor is: AF = |sin(Nμ/2)/(N sin(μ/2))|
+        - Where μ = 2πd cos(θ) + β, and β = -2πd cos(θ₀) when steering
+        """
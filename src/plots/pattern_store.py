@@ -0,0 +1,146 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from src.plots.base_plot import BasePlot
+from src.engine.array_factor import main_beam_angle, to_db
+from src.engine.store import PatternStore
+from src.engine.sweep import electrical_parameters
+from src.config.constants import SWEEP_PARAMETER_LABELS, DB_FLOOR
+
+STORE_PARAMETER_LABELS = {
+    **SWEEP_PARAMETER_LABELS,
+    'wavelength': "Wavelength (relative)",
+    'R_dB': "Chebyshev Sidelobe Level (dB)"
+}
+
+
+@st.cache_resource
+def open_store(path):
+    """
+    Open a pattern store once per server process; chunks are memory-mapped lazily.
+
+    The store is shared by every session; it locks its own refresh and chunk
+    cache, and sessions keep their selections in their own session state.
+    """
+    return PatternStore(path)
+
+
+def format_axis_value(name, value):
+    """Axis value for display, naming the NaN placeholders."""
+    if np.isnan(value):
+        return "none" if name == 'theta_steer' else "uniform"
+    return f"{value:.4g}"
+
+
+class PatternStoreBrowser(BasePlot):
+    def __init__(self):
+        super().__init__()
+        self.title = "Stored Sweep Pattern"
+
+    def plot(self, N, d, store=None, indices=None, db_scale=False, color=None, name=None):
+        """
+        Plot one precomputed pattern from an on-disk pattern store.
+
+        Parameters:
+        - N (int): Unused, the configuration comes from the store
+        - d (float): Unused, the configuration comes from the store
+        - store (PatternStore): Opened store, None if no store is loaded
+        - indices (dict): Axis index per parameter name
+        - db_scale (bool): Show the pattern in decibels
+        - color (str): Line color
+        - name (str): Trace name
+        """
+        yaxis_title = "Normalized Array Factor (dB)" if db_scale else self.yaxis_title
+        if store is None:
+            return self.new_figure(title="No pattern store loaded", yaxis_title=yaxis_title)
+
+        index = store.flat_index(**(indices or {}))
+        config = store.configuration(index)
+        label = ", ".join(f"{key}={format_axis_value(key, value)}" for key, value in config.items())
+        try:
+            af = np.asarray(store.pattern(index), dtype=float)
+            directivity_dbi = store.directivity_dbi(index)
+        except KeyError:
+            return self.new_figure(title=f"Configuration {index} has not been written yet", yaxis_title=yaxis_title)
+        except ValueError as e:
+            # A chunk that does not match the manifest, e.g. while a sweep is rewriting the store
+            return self.new_figure(title=f"Configuration {index} could not be read: {e}", yaxis_title=yaxis_title)
+
+        d_electrical, beta = electrical_parameters({key: np.array([value]) for key, value in config.items()})
+        self.result = {
+            'theta': np.asarray(store.theta),
+            'af': af,
+            'target_deg': main_beam_angle(d_electrical, beta)[0],
+            'directivity_dbi': directivity_dbi,
+            'labels': [label]
+        }
+
+        fig = self.new_figure(title=self.title, yaxis_title=yaxis_title)
+        fig.add_trace(go.Scatter(
+            x=np.degrees(store.theta),
+            y=to_db(af, DB_FLOOR) if db_scale else af,
+            mode='lines',
+            name=name or label,
+            line=dict(color=color or '#1f77b4', width=2)
+        ))
+        return fig
+
+    def get_controls(self):
+        """Get the Streamlit controls for picking a stored configuration."""
+        path = st.text_input(
+            "Pattern Store Directory",
+            value=st.session_state.get('store_path', ""),
+            help="Output directory of `python sweep_cli.py spec.json <directory>`"
+        )
+        st.session_state.store_path = path
+        if not path:
+            st.info("Enter the directory of a pattern store written by the sweep CLI.")
+            return {'store': None}
+
+        try:
+            store = open_store(path)
+            # Pick up chunks a running sweep has written since the last rerun;
+            # a no-op unless the manifest changed
+            store.refresh()
+        except (OSError, ValueError) as e:
+            st.error(f"Could not open pattern store: {e}")
+            return {'store': None}
+
+        if not store.complete:
+            st.caption(f"Sweep in progress: {store.num_written:,} of {len(store):,} patterns written")
+
+        indices = {}
+        for name, values in store.axes.items():
+            if len(values) > 1:
+                indices[name] = st.select_slider(
+                    STORE_PARAMETER_LABELS[name],
+                    options=list(range(len(values))),
+                    format_func=lambda i, name=name, values=values: format_axis_value(name, values[i]),
+                    key=f"store_{name}"
+                )
+        db_scale = st.checkbox("dB Scale", value=False, help="Show the pattern in decibels")
+        return {'store': store, 'indices': indices, 'db_scale': db_scale}
+
+    def get_about_text(self):
+        return """
+        ### Pattern Store
+
+        This view browses patterns precomputed by a headless sweep instead of computing them in the app.
+
+        #### What You're Seeing
+        - The stored pattern of the configuration picked with the sliders
+        - The usual pattern metrics and the stored directivity below the plot
+
+        #### Key Parameters
+        - **Pattern Store Directory**: Output directory of `sweep_cli.py`
+        - **Parameter sliders**: One per swept parameter; fixed parameters have no slider
+
+        #### Tips for Analysis
+        - Scrub one slider at a time to follow a design family
+        - A store can be opened while its sweep is still running; new chunks appear on the next rerun
+
+        #### Technical Details
+        - Patterns are stored in chunked `.npy` files indexed by `manifest.json`
+        - Chunks are memory-mapped read-only, so only the viewed rows are read from disk
+        - The sidebar N and d/λ are not used by this view
+        """
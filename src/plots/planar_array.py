@@ -0,0 +1,105 @@
+import streamlit as st
+from src.plots.array_factor_3d import ArrayFactor3D
+from src.engine.planar import planar_array_factor, grid_points_per_lobe, planar_grid_size
+from src.config.constants import (
+    DEFAULT_NY, DEFAULT_DY, DEFAULT_THETA0, DEFAULT_PHI0,
+    DEFAULT_GRID_POINTS, GRID_RESOLUTIONS, MAX_N, MAX_LARGE_N
+)
+
+class PlanarArray(ArrayFactor3D):
+    def __init__(self):
+        super().__init__()
+        self.title = "Planar Array Pattern"
+    
+    def plot(self, N, d, Ny=DEFAULT_NY, dy=DEFAULT_DY, theta0_deg=DEFAULT_THETA0, phi0_deg=DEFAULT_PHI0,
+             grid_points=DEFAULT_GRID_POINTS, color=None, name=None):
+        """
+        Generate 3D surface and contour plots of a steered uniform rectangular array.
+        
+        Parameters:
+        - N (int): Number of elements along x (Nx)
+        - d (float): Element spacing along x in wavelengths (dx)
+        - Ny (int): Number of elements along y
+        - dy (float): Element spacing along y in wavelengths
+        - theta0_deg (float): Steering elevation from the array normal in degrees
+        - phi0_deg (float): Steering azimuth in degrees
+        - grid_points (int): Minimum number of azimuth and elevation samples; raised
+          to resolve the lobes of the panel, up to the largest ``GRID_RESOLUTIONS`` entry
+        - color (str): Color for the plot
+        - name (str): Name for the plot in the legend
+        """
+        grid_points = min(max(grid_points, planar_grid_size(N, Ny, d, dy)), max(GRID_RESOLUTIONS))
+        result = planar_array_factor(
+            N, Ny, d, dy, theta0_deg, phi0_deg,
+            num_az=grid_points, num_el=grid_points
+        )
+        result = {**result, 'points_per_lobe': grid_points_per_lobe(N, Ny, d, dy, grid_points, grid_points)}
+        return self.render(result, name or f'{N}×{Ny}, d=({d}λ, {dy}λ), θ₀={theta0_deg}°, φ₀={phi0_deg}°')
+    
+    def get_controls(self):
+        """Get the Streamlit controls for planar array parameters."""
+        # Ny has the same limit as the sidebar N, which sets Nx
+        max_elements = MAX_LARGE_N if st.session_state.get('large_n') else MAX_N
+        col1, col2 = st.columns(2)
+        with col1:
+            Ny = st.slider(
+                "Elements along y (Ny)",
+                1, max_elements,
+                value=min(st.session_state.get('Ny', DEFAULT_NY), max_elements),
+                help="Number of rows; the sidebar N sets the elements along x (Nx)"
+            )
+            theta0_deg = st.slider(
+                "Steering Elevation θ₀ (degrees)",
+                0, 90,
+                value=st.session_state.get('theta0_deg', DEFAULT_THETA0),
+                help="Main beam angle from the array normal"
+            )
+        with col2:
+            dy = st.slider(
+                "Spacing along y (dy/λ)",
+                0.1, 1.0,
+                value=st.session_state.get('dy', DEFAULT_DY),
+                help="Row spacing in wavelengths; the sidebar d/λ sets the spacing along x (dx)"
+            )
+            phi0_deg = st.slider(
+                "Steering Azimuth φ₀ (degrees)",
+                0, 360,
+                value=st.session_state.get('phi0_deg', DEFAULT_PHI0),
+                help="Main beam azimuth"
+            )
+        st.session_state.Ny = Ny
+        st.session_state.dy = dy
+        st.session_state.theta0_deg = theta0_deg
+        st.session_state.phi0_deg = phi0_deg
+        
+        controls = super().get_controls()
+        controls.update({'Ny': Ny, 'dy': dy, 'theta0_deg': theta0_deg, 'phi0_deg': phi0_deg})
+        return controls
+    
+    def get_about_text(self):
+        return """
+        ### Planar Array
+        
+        This visualization shows the 3D pattern of a uniform rectangular array (URA), the layout used by most panel antennas.
+        
+        #### What You're Seeing
+        - 3D surface plot of the steered pattern
+        - Contour plot of the pattern in azimuth-elevation space
+        - The main beam pointing toward (θ₀, φ₀)
+        
+        #### Key Parameters
+        - **Number of Elements (N)** and **Element Spacing (d/λ)**: Elements and spacing along x (Nx, dx)
+        - **Ny, dy/λ**: Elements and spacing along y
+        - **Steering Elevation θ₀ / Azimuth φ₀**: Direction of the main beam
+        
+        #### Tips for Analysis
+        - Use unequal Nx and Ny to see an elliptical main beam
+        - Steer to large θ₀ with d/λ close to 1 to see grating lobes enter the pattern
+        - The grid is refined automatically for large panels, up to the highest grid resolution; beyond that a warning notes that the surface misses lobes
+        
+        #### Technical Details
+        - The array lies in the xy-plane, so u = sin θ cos φ and v = sin θ sin φ
+        - The array factor separates into two ULA factors: AF = AFx(u) · AFy(v)
+        - AFx = |sin(Nxψx/2)/(Nx sin(ψx/2))| with ψx = 2πdx(u - u₀), and likewise for y
+        - Each direction costs two closed-form evaluations, independent of Nx·Ny
+        """
@@ -2,38 +2,40 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 from src.plots.base_plot import BasePlot
-from src.config.constants import DEFAULT_N, DEFAULT_D, DEFAULT_BETA
+from src.engine.array_factor import radiation_pattern, radiation_pattern_batch, electrical_spacing
+from src.engine.sampling import sample_pattern
+from src.config.constants import DEFAULT_N, DEFAULT_D, DEFAULT_BETA, DEFAULT_RESOLUTION
 
 class RadiationPattern(BasePlot):
     def __init__(self):
         super().__init__()
         self.title = "ULA Radiation Pattern"
     
-    def plot(self, N, d, beta=0, wavelength=1.0, color=None, name=None):
-        theta = np.linspace(0, np.pi, 1000)
-        d_actual = d * wavelength
-        mu = 2 * np.pi * d_actual * np.cos(theta) + beta
-        AF = np.abs(np.sin(N * mu / 2) / (N * np.sin(mu / 2)))
-        AF_normalized = AF / np.max(AF)
+    def plot(self, N, d, beta=0, wavelength=1.0, resolution=DEFAULT_RESOLUTION, color=None, name=None):
+        result = sample_pattern(radiation_pattern, resolution, N, d, electrical_spacing(d, wavelength),
+                                beta=beta, wavelength=wavelength)
+        self.result = result
         
-        fig = go.Figure()
+        fig = self.new_figure()
         fig.add_trace(go.Scatter(
-            x=np.degrees(theta),
-            y=AF_normalized,
+            x=np.degrees(result['theta']),
+            y=result['af'],
             mode='lines',
             name=name or f'N={N}, d={d}λ, β={beta:.2f}',
             line=dict(color=color or '#1f77b4', width=2)
         ))
-        
-        fig.update_layout(self.get_layout())
         return fig
     
+    def compute_batch(self, N, d, beta=0, wavelength=1.0, theta=None):
+        """Compute normalized patterns for arrays of parameters in one broadcast."""
+        return radiation_pattern_batch(N, d, beta, wavelength, theta)
+    
     def get_controls(self):
         beta = st.slider("Phase Shift (β)", -np.pi, np.pi, 
                         value=st.session_state.get('beta', DEFAULT_BETA),
                         help="Progressive phase shift in radians")
         st.session_state.beta = beta
-        return {'beta': beta}
+        return {'beta': beta, 'resolution': self.get_resolution_control()}
     
     def get_about_text(self):
         return """
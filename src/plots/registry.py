@@ -0,0 +1,77 @@
+"""
+Registry of the visualization types offered in the sidebar.
+
+Every type registers its display name, the module and class implementing
+it, the plot-specific parameters a comparison records and the legend format
+of those parameters. Plot modules, and the heavier dependencies they pull in,
+are imported only when their type is first selected, which keeps the app's
+cold start short.
+"""
+import importlib
+
+
+class PlotType:
+    def __init__(self, name, module, class_name, parameters=None, legend=""):
+        """
+        Parameters:
+        - name (str): Name shown in the visualization type selector
+        - module (str): Dotted path of the module defining the plot class
+        - class_name (str): Name of the plot class in ``module``
+        - parameters (tuple): Plot-specific parameters recorded by "Add to
+          Comparison", None if the type cannot be compared
+        - legend (str): Format string for those parameters in comparison legends
+        """
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.parameters = parameters
+        self.legend = legend
+
+    @property
+    def comparable(self):
+        return self.parameters is not None
+
+    def load(self):
+        """Import the plot module on first use and return the plot class."""
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+    def create(self):
+        """Return a new instance of the plot class."""
+        return self.load()()
+
+
+PLOT_REGISTRY = {}
+
+
+def register_plot_type(name, module, class_name, parameters=None, legend=""):
+    """Register a visualization type; types are listed in registration order."""
+    PLOT_REGISTRY[name] = PlotType(name, module, class_name, parameters, legend)
+    return PLOT_REGISTRY[name]
+
+
+def format_legend_name(plot_data):
+    """Format the legend name of a comparison with its parameters."""
+    base_name = f"Plot {plot_data['name'].split()[-1]}"
+    params = [f"N={plot_data['N']}", f"d={plot_data['d']}λ"]
+    legend = PLOT_REGISTRY[plot_data['type']].legend
+    if legend:
+        params.append(legend.format(**plot_data))
+    return f"{base_name} ({', '.join(params)})"
+
+
+register_plot_type("Basic Radiation Pattern", "src.plots.radiation_pattern", "RadiationPattern",
+                   ('beta',), "β={beta:.2f} rad")
+register_plot_type("Beam Steering", "src.plots.beam_steering", "BeamSteering",
+                   ('theta_steer_deg',), "θ={theta_steer_deg}°")
+register_plot_type("Chebyshev Array", "src.plots.chebyshev_array", "ChebyshevArray",
+                   ('R_dB',), "R={R_dB} dB")
+register_plot_type("3D Array Factor", "src.plots.array_factor_3d", "ArrayFactor3D")
+register_plot_type("Grating Lobe Check", "src.plots.grating_lobe_check", "GratingLobeCheck",
+                   ('wavelength',), "λ={wavelength:.2f}")
+register_plot_type("Grating Lobe Map", "src.plots.grating_lobe_map", "GratingLobeMap")
+register_plot_type("Parameter Sweep", "src.plots.parameter_sweep", "ParameterSweep")
+register_plot_type("Planar Array", "src.plots.planar_array", "PlanarArray")
+register_plot_type("Custom Geometry", "src.plots.custom_geometry", "CustomGeometry")
+register_plot_type("Pattern Store", "src.plots.pattern_store", "PatternStoreBrowser")
+register_plot_type("Array Synthesis", "src.plots.array_synthesis", "ArraySynthesis")
+register_plot_type("Wideband Sweep", "src.plots.wideband_sweep", "WidebandSweep")
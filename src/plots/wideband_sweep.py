@@ -0,0 +1,177 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from src.plots.base_plot import BasePlot
+from src.engine.array_factor import to_db
+from src.engine.sampling import sample_theta, lobe_resolution
+from src.engine.wideband import wideband_pattern
+from src.engine.grating_lobes import beam_cosine, grating_lobe_directions
+from src.config.constants import (
+    DEFAULT_THETA_STEER, DEFAULT_RESOLUTION, DB_FLOOR, WIDEBAND_RATIO_LIMITS,
+    DEFAULT_WIDEBAND_BAND, DEFAULT_WIDEBAND_STEPS, MAX_THETA_POINTS
+)
+
+class WidebandSweep(BasePlot):
+    def __init__(self):
+        super().__init__()
+        self.title = "Wideband Sweep"
+
+    def plot(self, N, d, theta_steer_deg=DEFAULT_THETA_STEER, band=DEFAULT_WIDEBAND_BAND,
+             steps=DEFAULT_WIDEBAND_STEPS, true_time_delay=False, db_scale=True,
+             resolution=DEFAULT_RESOLUTION, color=None, name=None):
+        """
+        Plot the array factor as a heatmap over θ and frequency, with the main-beam and grating-lobe tracks.
+
+        Parameters:
+        - N (int): Number of elements
+        - d (float): Element spacing in wavelengths at the design frequency f₀
+        - theta_steer_deg (float): Steering angle at the design frequency in degrees
+        - band (tuple): (min, max) of the frequency ratio f/f₀
+        - steps (int): Number of frequencies
+        - true_time_delay (bool): Steer with time delays instead of fixed phase shifts
+        - db_scale (bool): Show the pattern in dB instead of linear scale
+        - resolution (str): Angular resolution policy ('adaptive', 'fixed' or 'max-points')
+        - color (str): Unused, kept for a uniform plot interface
+        - name (str): Unused, kept for a uniform plot interface
+        """
+        frequency_ratio = np.linspace(band[0], band[1], steps)
+        # Lobes are narrowest at the top of the band, so sample θ for it; the
+        # map holds a row per frequency, so the grid size is capped
+        theta = sample_theta(N, d * band[1], resolution, max_points=MAX_THETA_POINTS)
+        with self.stage('compute'):
+            result = wideband_pattern(N, d, theta_steer_deg, frequency_ratio, theta=theta,
+                                      true_time_delay=true_time_delay)
+        AF = result['af']
+        self.result = {
+            'theta': theta,
+            'af': AF,
+            'target_deg': theta_steer_deg,
+            'directivity_dbi': result['directivity_dbi'],
+            'points_per_lobe': lobe_resolution(theta, N, d * band[1]),
+            'labels': [f"f/f₀={ratio:.3g}" for ratio in frequency_ratio]
+        }
+
+        fig = self.new_figure(
+            title=f"{self.title}: {self.summary(result)}",
+            yaxis_title="Frequency f/f₀",
+            yaxis_range=[band[0], band[1]],
+            showlegend=True,
+            legend=dict(orientation='h', y=-0.2),
+            shapes=[dict(type='line', xref='paper', x0=0, x1=1, y0=1, y1=1,
+                         line=dict(color='white', width=1, dash='dot'))]
+        )
+        fig.add_trace(go.Heatmap(
+            x=np.degrees(theta),
+            y=frequency_ratio,
+            z=to_db(AF, DB_FLOOR) if db_scale else AF,
+            colorscale='Viridis',
+            colorbar=dict(title="dB" if db_scale else "|AF|/N"),
+            showlegend=False
+        ))
+        fig.add_trace(go.Scatter(
+            x=result['beam_deg'],
+            y=frequency_ratio,
+            mode='lines',
+            name="Main beam",
+            line=dict(color='white', width=2)
+        ))
+        _, lobes = grating_lobe_directions(d * frequency_ratio,
+                                           beam_cosine(theta_steer_deg, frequency_ratio, true_time_delay))
+        for i, lobe in enumerate(lobes):
+            fig.add_trace(go.Scatter(
+                x=lobe,
+                y=frequency_ratio,
+                mode='lines',
+                name="Grating lobes",
+                legendgroup="grating",
+                showlegend=i == 0,
+                line=dict(color='red', width=1, dash='dash')
+            ))
+        return fig
+
+    @staticmethod
+    def summary(result):
+        """Squint across the band, squint-limited bandwidth and grating-lobe onset as one title line."""
+        ratio = result['frequency_ratio']
+        visible = np.flatnonzero(np.isfinite(result['squint_deg']))
+        if len(visible) == 0:
+            return "beam outside visible space across the band"
+        low, high = visible[0], visible[-1]
+        parts = [f"squint {np.round(result['squint_deg'][low], 1) + 0:+.1f}° at f/f₀ = {ratio[low]:.2f} to "
+                 f"{np.round(result['squint_deg'][high], 1) + 0:+.1f}° at f/f₀ = {ratio[high]:.2f}"]
+        if low > 0:
+            parts.append(f"beam leaves visible space below f/f₀ = {ratio[low]:.2f}")
+        if result['squint_bandwidth'] < 2:
+            parts.append(f"3 dB squint bandwidth {100 * result['squint_bandwidth']:.1f} %")
+        if result['onset_ratio'] <= ratio[-1]:
+            parts.append(f"grating lobes above f/f₀ = {result['onset_ratio']:.2f}")
+        return ", ".join(parts)
+
+    def get_controls(self):
+        """Get the Streamlit controls for the wideband sweep."""
+        theta_steer_deg = st.slider(
+            "Steering Angle at f₀ (degrees)",
+            0, 180,
+            value=st.session_state.get('theta_steer_deg', DEFAULT_THETA_STEER),
+            help="Beam direction at the design frequency f₀"
+        )
+        st.session_state.theta_steer_deg = theta_steer_deg
+        band = st.slider(
+            "Band (f/f₀)",
+            *WIDEBAND_RATIO_LIMITS,
+            value=DEFAULT_WIDEBAND_BAND,
+            step=0.05,
+            help="Frequencies relative to the design frequency; d/λ is given at f₀"
+        )
+        steps = st.slider(
+            "Frequency Steps",
+            10, 400,
+            value=DEFAULT_WIDEBAND_STEPS,
+            help="Number of frequencies across the band"
+        )
+        true_time_delay = st.checkbox(
+            "True Time Delay",
+            value=False,
+            help="Steer with time delays, which scale with frequency, instead of fixed phase shifts"
+        )
+        db_scale = st.checkbox("dB Scale", value=True, help="Show the pattern in decibels")
+        return {
+            'theta_steer_deg': theta_steer_deg,
+            'band': band,
+            'steps': steps,
+            'true_time_delay': true_time_delay,
+            'db_scale': db_scale,
+            'resolution': self.get_resolution_control()
+        }
+
+    def get_about_text(self):
+        return """
+        ### Wideband Sweep
+
+        This visualization maps the pattern of a steered array across a frequency band, showing beam squint and the onset of grating lobes.
+
+        #### What You're Seeing
+        - A heatmap with the angle θ on the horizontal axis and the frequency f/f₀ on the vertical axis
+        - Color showing |AF|/N, so rows dim where the beam leaves visible space
+        - The main-beam track (white) and grating-lobe tracks (dashed red)
+        - The title with the squint at the band edges, the 3 dB squint bandwidth and the grating-lobe onset
+        - The metrics table with one row per frequency; its pointing error is the squint
+
+        #### Key Parameters
+        - **Element Spacing (d/λ)**: Spacing in wavelengths at the design frequency f₀
+        - **Steering Angle at f₀**: The phase taper is designed for this direction at f₀
+        - **Band**: The frequency range relative to f₀
+        - **True Time Delay**: Time-delay steering for comparison, which does not squint
+
+        #### Tips for Analysis
+        - Steer away from broadside to watch the beam track bend across the band
+        - Increase N to see the squint bandwidth shrink as the beam narrows
+        - Raise the top of the band to find where grating lobes enter for your spacing and scan angle
+
+        #### Technical Details
+        - Phase shifters hold β = -2πd cos θ₀ fixed, so μ = 2πd (f/f₀) cos θ + β
+        - The beam squints to cos θ_b = cos θ₀ · f₀/f
+        - Grating lobes lie at cos θ_k = (cos θ₀ + k/d) · f₀/f for integer k ≠ 0, or at cos θ₀ + k f₀/(d f) with time delays
+        - The 3 dB squint bandwidth is about 0.886 / (N d |cos θ₀|)
+        - The whole map is computed in one broadcast Dirichlet evaluation
+        """
@@ -0,0 +1,186 @@
+"""
+Session store of the configurations overlaid for comparison.
+
+Comparisons are grouped by plot type. Each group keeps its parameters as
+columnar numpy arrays (one entry per comparison) together with the pattern
+matrix last computed for them, so a rerun with an unchanged θ grid reuses the
+matrix and adding a comparison only evaluates the new rows. Identical
+configurations of a type are stored once. Stores are exported to and
+imported from JSON files holding the parameter columns, colors and numbers.
+"""
+import json
+import numpy as np
+from src.utils.plot_utils import get_next_color
+
+# Version of the exported JSON format
+COMPARISON_FILE_VERSION = 1
+
+
+def _column(name, values):
+    """Parameter column as an int array for N and a float array otherwise."""
+    return np.atleast_1d(np.asarray(values, dtype=int if name == 'N' else float))
+
+
+class ComparisonGroup:
+    def __init__(self, plot_type, parameters):
+        """
+        Parameters:
+        - plot_type (str): Visualization type of every comparison in the group
+        - parameters (tuple): Parameter names, N and d first
+        """
+        self.plot_type = plot_type
+        self.parameters = tuple(parameters)
+        self.columns = {name: _column(name, []) for name in self.parameters}
+        self.numbers = np.empty(0, dtype=int)
+        self.colors = []
+        self._keys = set()
+        self._result = None
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def add(self, columns, first_number):
+        """
+        Append the configurations not yet in the group, numbered consecutively
+        from ``first_number``; returns the indices of the appended rows of
+        ``columns``. The caller appends their colors.
+        """
+        rows = np.column_stack([columns[name] for name in self.parameters])
+        keep = []
+        for i, row in enumerate(map(tuple, rows.tolist())):
+            if row not in self._keys:
+                self._keys.add(row)
+                keep.append(i)
+        if not keep:
+            return keep
+
+        for name in self.parameters:
+            self.columns[name] = np.concatenate([self.columns[name], columns[name][keep]])
+        self.numbers = np.concatenate([self.numbers, first_number + np.arange(len(keep))])
+        return keep
+
+    def records(self):
+        """One dict per comparison with its type, name, color and parameters."""
+        columns = {name: column.tolist() for name, column in self.columns.items()}
+        return [{
+            'type': self.plot_type,
+            'name': f"Plot {number}",
+            'color': color,
+            **{name: columns[name][i] for name in self.parameters}
+        } for i, (number, color) in enumerate(zip(self.numbers.tolist(), self.colors))]
+
+    def patterns(self, compute, theta):
+        """
+        Batched patterns of the whole group on ``theta``.
+
+        The last result is kept: when ``theta`` is unchanged only comparisons
+        added since are passed to ``compute`` and appended to it.
+
+        Parameters:
+        - compute (callable): Batched pattern function called as
+          ``compute(theta=theta, **columns)``, e.g. a plot's ``compute_batch``
+        - theta (ndarray): Shared θ grid in radians
+
+        Returns:
+        - dict with the shared ``theta``, the ``af`` matrix with one row per
+          comparison and the other per-row arrays returned by ``compute``
+        """
+        result = self._result
+        if result is None or not np.array_equal(result['theta'], theta):
+            result = None
+        start = 0 if result is None else len(result['af'])
+        if start < len(self):
+            new = compute(theta=theta, **{name: column[start:] for name, column in self.columns.items()})
+            if result is None:
+                result = dict(new)
+            else:
+                result = {
+                    key: value if key == 'theta' else np.concatenate([result[key], value])
+                    for key, value in new.items()
+                }
+            self._result = result
+        return result
+
+
+class ComparisonStore:
+    def __init__(self):
+        self.groups = {}
+        self.next_number = 1
+
+    def __len__(self):
+        return sum(len(group) for group in self.groups.values())
+
+    def group(self, plot_type):
+        """Comparisons of ``plot_type``, None if there are none."""
+        group = self.groups.get(plot_type)
+        return group if group else None
+
+    def add(self, plot_type, colors=None, **columns):
+        """
+        Add one or many configurations of ``plot_type``.
+
+        Parameters:
+        - plot_type (str): Visualization type
+        - colors (list): Trace color per configuration; the next distinct
+          colors are picked when None
+        - columns: Scalar or 1D array per parameter, including N and d; the
+          parameter names must match earlier additions of the same type
+
+        Returns:
+        - int number of configurations added, duplicates not counted
+        """
+        parameters = ('N', 'd') + tuple(sorted(set(columns) - {'N', 'd'}))
+        group = self.groups.setdefault(plot_type, ComparisonGroup(plot_type, parameters))
+        if set(columns) != set(group.parameters):
+            raise ValueError(f"{plot_type} comparisons take parameters {group.parameters}, got {tuple(columns)}")
+
+        columns = {name: _column(name, values) for name, values in columns.items()}
+        count = np.broadcast(*columns.values()).size
+        columns = {name: np.broadcast_to(column, (count,)) for name, column in columns.items()}
+        keep = group.add(columns, self.next_number)
+        if colors is None:
+            used = [color for other in self.groups.values() for color in other.colors]
+            for _ in keep:
+                group.colors.append(get_next_color(used))
+                used.append(group.colors[-1])
+        else:
+            group.colors.extend(colors[i] for i in keep)
+        self.next_number += len(keep)
+        return len(keep)
+
+    def clear(self):
+        self.groups = {}
+        self.next_number = 1
+
+    def to_json(self):
+        """Export the parameters, colors and numbers of every comparison as a JSON string."""
+        return json.dumps({
+            'version': COMPARISON_FILE_VERSION,
+            'groups': [{
+                'type': group.plot_type,
+                'numbers': group.numbers.tolist(),
+                'colors': group.colors,
+                'columns': {name: column.tolist() for name, column in group.columns.items()}
+            } for group in self.groups.values() if group]
+        })
+
+    def load_json(self, text):
+        """
+        Add the comparisons of an exported JSON string.
+
+        Configurations already in the store are skipped and the imported ones
+        are numbered after the existing comparisons.
+
+        Returns:
+        - int number of comparisons added
+        """
+        data = json.loads(text)
+        if data.get('version') != COMPARISON_FILE_VERSION:
+            raise ValueError(f"Unsupported comparison file version {data.get('version')!r}")
+        added = 0
+        for group in data['groups']:
+            order = np.argsort(group['numbers'], kind='stable')
+            columns = {name: np.asarray(values)[order] for name, values in group['columns'].items()}
+            colors = [group['colors'][i] for i in order]
+            added += self.add(group['type'], colors=colors, **columns)
+        return added
@@ -1,5 +1,9 @@
+import numpy as np
 import plotly.graph_objects as go
-from src.config.constants import DISTINCT_COLORS
+import plotly.io as pio
+from src.config.constants import (
+    DISTINCT_COLORS, PAYLOAD_DTYPE, WEBGL_TRACE_THRESHOLD, OVERLAY_MAX_POINTS, MAIN_TRACE_MAX_POINTS
+)
 import random
 
 def get_next_color(existing_colors):
@@ -11,38 +15,6 @@ def get_next_color(existing_colors):
     # If all colors are used, generate a new one
     return f'rgb({random.randint(0, 255)}, {random.randint(0, 255)}, {random.randint(0, 255)})'
 
-def format_legend_name(plot_data):
-    """Format the legend name with detailed parameter information."""
-    base_name = f"Plot {plot_data['name'].split()[-1]}"
-    params = []
-    
-    if plot_data['type'] == "Basic Radiation Pattern":
-        params.extend([
-            f"N={plot_data['N']}",
-            f"d={plot_data['d']}λ",
-            f"β={plot_data['beta']:.2f} rad"
-        ])
-    elif plot_data['type'] == "Beam Steering":
-        params.extend([
-            f"N={plot_data['N']}",
-            f"d={plot_data['d']}λ",
-            f"θ={plot_data['theta_steer_deg']}°"
-        ])
-    elif plot_data['type'] == "Chebyshev Array":
-        params.extend([
-            f"N={plot_data['N']}",
-            f"d={plot_data['d']}λ",
-            f"R={plot_data['R_dB']} dB"
-        ])
-    elif plot_data['type'] == "Grating Lobe Check":
-        params.extend([
-            f"N={plot_data['N']}",
-            f"d={plot_data['d']}λ",
-            f"λ={plot_data['wavelength']:.2f}"
-        ])
-    
-    return f"{base_name} ({', '.join(params)})"
-
 def get_plot_layout(title, xaxis_title, yaxis_title):
     """Get common plot layout settings."""
     return dict(
@@ -57,4 +29,193 @@ def get_plot_layout(title, xaxis_title, yaxis_title):
             xanchor="left",
             x=1.02
         )
-    ) 
\ No newline at end of file
+    )
+
+
+def format_metrics_table(labels, metrics, nulls, desired_sll_db=None, directivity_dbi=None, max_nulls=6):
+    """Format vectorized pattern metrics as table rows, one per pattern."""
+    def fmt(value, digits=2):
+        return None if value is None or not np.isfinite(value) else round(float(value), digits)
+    
+    rows = []
+    for i, label in enumerate(labels):
+        row = {
+            'Pattern': label,
+            'Peak (°)': fmt(metrics['peak_deg'][i]),
+            'Pointing Error (°)': fmt(metrics['pointing_error_deg'][i]),
+            'HPBW (°)': fmt(metrics['hpbw_deg'][i]),
+            'FNBW (°)': fmt(metrics['fnbw_deg'][i]),
+            'Peak SLL (dB)': fmt(metrics['sll_db'][i])
+        }
+        if desired_sll_db is not None:
+            row['Desired SLL (dB)'] = fmt(desired_sll_db[i])
+        if directivity_dbi is not None:
+            row['Directivity (dBi)'] = fmt(directivity_dbi[i])
+        shown = ', '.join(f"{angle:.1f}" for angle in nulls[i][:max_nulls])
+        row['Nulls (°)'] = shown + (', …' if len(nulls[i]) > max_nulls else '')
+        rows.append(row)
+    return rows
+
+def lttb(x, y, num_points):
+    """
+    Largest-Triangle-Three-Buckets downsampling of one or more series sharing ``x``.
+    
+    Keeps the first and last samples and, from each of ``num_points - 2``
+    buckets, the sample forming the largest triangle with the previously kept
+    sample and the mean of the next bucket, so peaks and nulls survive.
+    
+    Parameters:
+    - x (ndarray): Shared, increasing x values of length T
+    - y (ndarray): Series of shape (T,) or (M, T)
+    - num_points (int): Number of samples to keep per series
+    
+    Returns:
+    - Index array of shape (num_points,) or (M, num_points) into the T samples
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    single = y.ndim == 1
+    y = np.atleast_2d(y)
+    M, T = y.shape
+    if num_points >= T or num_points < 3:
+        keep = np.broadcast_to(np.arange(T), (M, T))
+        return keep[0] if single else keep
+    
+    # Bucket edges over the interior samples; each bucket holds at least one sample
+    edges = np.linspace(1, T - 1, num_points - 1).astype(int)
+    rows = np.arange(M)
+    keep = np.empty((M, num_points), dtype=int)
+    keep[:, 0], keep[:, -1] = 0, T - 1
+    previous = np.zeros(M, dtype=int)
+    for i in range(num_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else T
+        next_x = x[hi:next_hi].mean()
+        next_y = y[:, hi:next_hi].mean(axis=-1)
+        px, py = x[previous], y[rows, previous]
+        area = np.abs(
+            (px - next_x)[:, None] * (y[:, lo:hi] - py[:, None])
+            - (px[:, None] - x[lo:hi]) * (next_y - py)[:, None]
+        )
+        previous = lo + np.argmax(area, axis=-1)
+        keep[:, i + 1] = previous
+    return keep[0] if single else keep
+
+def minmax_decimate(y, num_points):
+    """
+    Indices of the minimum and maximum of equal buckets of a series, plus its ends.
+    
+    With ``(num_points - 2) // 2`` buckets of consecutive samples, about one
+    per pixel column at the default budget, every peak and null of the series
+    survives, so the rendered line looks the same. Fully vectorized.
+    
+    Parameters:
+    - y (ndarray): Series of length T
+    - num_points (int): Largest number of samples to keep
+    
+    Returns:
+    - Sorted index array into the T samples
+    """
+    y = np.asarray(y, dtype=float)
+    T = len(y)
+    buckets = (num_points - 2) // 2
+    if num_points >= T or buckets < 1:
+        return np.arange(T)
+    
+    size = int(np.ceil(T / buckets))
+    # Edge padding repeats the last sample, whose index is clipped back to T - 1
+    blocks = np.pad(y, (0, size * buckets - T), mode='edge').reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    keep = np.concatenate([[0, T - 1], offsets + blocks.argmin(axis=-1), offsets + blocks.argmax(axis=-1)])
+    return np.unique(np.minimum(keep, T - 1))
+
+def _compact(values):
+    """Downcast a float array to the payload dtype; other values pass through."""
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+        return values.astype(PAYLOAD_DTYPE, copy=False)
+    if isinstance(values, (list, tuple)) and values and all(isinstance(v, float) for v in values):
+        return np.asarray(values, dtype=PAYLOAD_DTYPE)
+    return values
+
+def optimize_figure(fig, overlay_start=None, measure=False):
+    """
+    Shrink a figure's serialized payload in place before it is sent to the browser.
+    
+    - Float arrays of every trace are downcast to ``PAYLOAD_DTYPE``
+    - Overlay line traces (index ``overlay_start`` onwards) longer than
+      ``OVERLAY_MAX_POINTS`` are decimated with LTTB
+    - Other line traces longer than ``MAIN_TRACE_MAX_POINTS`` keep the minimum
+      and maximum of each bucket (``minmax_decimate``), except traces that
+      animation frames restyle; the plot's engine result keeps the full
+      resolution for metrics
+    - Figures with more than ``WEBGL_TRACE_THRESHOLD`` traces switch their
+      ``Scatter`` traces, animation frames included, to WebGL ``Scattergl``
+    
+    Parameters:
+    - fig (go.Figure): Figure to optimize
+    - overlay_start (int): Index of the first overlay trace, None if there are none
+    - measure (bool): Serialize before and after to report the bytes saved
+    
+    Returns:
+    - dict with ``points_before``, ``points_after`` and ``webgl``, plus
+      ``bytes_before`` and ``bytes_after`` when ``measure`` is set
+    """
+    stats = {}
+    if measure:
+        stats['bytes_before'] = len(pio.to_json(fig, validate=False))
+    
+    webgl = sum(isinstance(trace, go.Scatter) for trace in fig.data) > WEBGL_TRACE_THRESHOLD
+    # Frames replace the y values of these traces, so their x values must stay put
+    animated = {i for frame in fig.frames for i in (frame.traces or range(len(frame.data)))}
+    points_before = points_after = 0
+    overlays = []
+    for i, trace in enumerate(fig.data):
+        if not isinstance(trace, go.Scatter):
+            for name in ('x', 'y', 'z'):
+                if name in trace and trace[name] is not None:
+                    trace[name] = _compact(trace[name])
+            continue
+        
+        x, y = np.asarray(trace.x, dtype=float), np.asarray(trace.y, dtype=float)
+        points_before += len(y)
+        if overlay_start is not None and i >= overlay_start and len(y) > OVERLAY_MAX_POINTS:
+            overlays.append((trace, x, y))
+            continue
+        if len(y) > MAIN_TRACE_MAX_POINTS and i not in animated and trace.mode in (None, 'lines'):
+            keep = minmax_decimate(y, MAIN_TRACE_MAX_POINTS)
+            x, y = x[keep], y[keep]
+        points_after += len(y)
+        trace.update(x=_compact(x), y=_compact(y))
+    
+    # Overlays usually share one θ grid, so each group is decimated in a single LTTB pass
+    while overlays:
+        x = overlays[0][1]
+        group = [item for item in overlays if len(item[1]) == len(x) and np.array_equal(item[1], x)]
+        overlays = [item for item in overlays if not any(item is member for member in group)]
+        keep = lttb(x, np.stack([y for _, _, y in group]), OVERLAY_MAX_POINTS)
+        for (trace, _, y), rows in zip(group, keep):
+            points_after += len(rows)
+            trace.update(x=_compact(x[rows]), y=_compact(y[rows]))
+    
+    if webgl:
+        traces = []
+        for trace in fig.data:
+            if isinstance(trace, go.Scatter):
+                props = trace.to_plotly_json()
+                props.pop('type')
+                trace = go.Scattergl(**props)
+            traces.append(trace)
+        fig.data = []
+        fig.add_traces(traces)
+        # Animation frames must name the same trace types as the traces they update
+        for frame in fig.frames:
+            frame.data = [
+                go.Scattergl(**{k: v for k, v in trace.to_plotly_json().items() if k != 'type'})
+                if isinstance(trace, go.Scatter) else trace
+                for trace in frame.data
+            ]
+    
+    stats.update(points_before=points_before, points_after=points_after, webgl=webgl)
+    if measure:
+        stats['bytes_after'] = len(pio.to_json(fig, validate=False))
+    return stats
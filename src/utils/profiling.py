@@ -0,0 +1,125 @@
+import contextlib
+import csv
+import json
+import os
+import threading
+import time
+from src.engine.cache import pattern_cache
+
+# Stage names in display order. "compute" is the pattern-cache compute time
+# inside "render", and "figure" is what remains of "render" after compute and layout.
+STAGES = ['parameters', 'compute', 'layout', 'figure', 'render', 'comparisons', 'optimize', 'serialize', 'metrics']
+
+
+class _Stage:
+    """Context manager adding its wall time and pattern compute time to one profiler stage."""
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.compute_start = pattern_cache.thread_stats()['compute_seconds']
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        compute = pattern_cache.thread_stats()['compute_seconds'] - self.compute_start
+        timings, computes = self.profiler.timings, self.profiler.compute
+        timings[self.name] = timings.get(self.name, 0.0) + elapsed
+        computes[self.name] = computes.get(self.name, 0.0) + compute
+        return False
+
+
+class RenderProfiler(threading.local):
+    """
+    Per-stage timers and cache counters for one rerun of the app.
+
+    Streamlit runs every session's rerun in its own script thread, so the
+    profiler's state is thread-local: the shared ``profiler`` instance keeps
+    separate timings per concurrent rerun, and its cache counters only count
+    the lookups of that thread.
+
+    When disabled, ``stage`` returns a shared no-op context manager so the
+    instrumentation in the plot classes costs one attribute check per stage.
+    """
+    _disabled = contextlib.nullcontext()
+
+    def __init__(self):
+        self.enabled = False
+        self.timings = {}
+        self.compute = {}
+        self.values = {}
+        self._cache_start = {}
+
+    def start(self, enabled):
+        """Reset the timers at the beginning of a rerun."""
+        self.enabled = enabled
+        self.timings = {}
+        self.compute = {}
+        self.values = {}
+        if enabled:
+            self._cache_start = pattern_cache.thread_stats()
+
+    def stage(self, name):
+        """Context manager timing a named stage; stages may be entered repeatedly and accumulate."""
+        return _Stage(self, name) if self.enabled else self._disabled
+
+    def record(self, name, value):
+        """Record a non-timing value such as a payload size."""
+        if self.enabled:
+            self.values[name] = value
+
+    def finish(self):
+        """
+        Close the rerun and return its report.
+
+        Returns:
+        - dict with stage times in milliseconds (``<stage>_ms``), recorded
+          values, the pattern cache hits and misses of this rerun and the
+          number of cache entries
+        """
+        if not self.enabled:
+            return {}
+        timings = dict(self.timings)
+        if 'render' in timings:
+            timings['compute'] = self.compute['render']
+            timings['figure'] = max(0.0, timings['render'] - timings['compute'] - timings.get('layout', 0.0))
+
+        stats = pattern_cache.thread_stats()
+        report = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        report.update({f"{name}_ms": round(1e3 * timings[name], 3) for name in STAGES if name in timings})
+        report.update(self.values)
+        report.update({
+            'cache_hits': stats['hits'] - self._cache_start.get('hits', 0),
+            'cache_misses': stats['misses'] - self._cache_start.get('misses', 0),
+            'cache_entries': len(pattern_cache)
+        })
+        return report
+
+
+def append_log(report, path):
+    """
+    Append a profiler report to ``<path>.jsonl`` and ``<path>.csv``.
+
+    The CSV header is written when the file is created; later reports with
+    different keys are written against the existing header.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path + '.jsonl', 'a') as f:
+        f.write(json.dumps(report) + '\n')
+
+    csv_path = path + '.csv'
+    if os.path.exists(csv_path):
+        with open(csv_path, newline='') as f:
+            header = next(csv.reader(f), None)
+    else:
+        header = None
+    with open(csv_path, 'a', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=header or list(report), extrasaction='ignore')
+        if header is None:
+            writer.writeheader()
+        writer.writerow(report)
+
+
+profiler = RenderProfiler()
@@ -0,0 +1,43 @@
+"""
+Command-line entry point for headless parameter sweeps.
+
+Example:
+    python sweep_cli.py spec.json results/ --workers 8
+
+where spec.json is, for instance,
+    {"N": [8, 16, 32], "d": {"start": 0.25, "stop": 1.0, "num": 64},
+     "theta_steer": [null, 30, 60], "R_dB": [null, 20, 30]}
+"""
+import argparse
+import sys
+from src.config.constants import BATCH_CHUNK_CONFIGS
+from src.engine.batch import load_spec, run_sweep
+
+
+def print_progress(done, total, elapsed):
+    """Print a single updating progress line with throughput."""
+    rate = done / elapsed if elapsed > 0 else 0.0
+    sys.stderr.write(f"\r{done:,}/{total:,} patterns ({100 * done / total:5.1f}%)  {rate:,.0f} patterns/s")
+    sys.stderr.flush()
+
+
+def main(argv=None):
+    """Parse arguments and run the sweep."""
+    parser = argparse.ArgumentParser(description="Run an antenna array parameter sweep without the web UI.")
+    parser.add_argument("spec", help="JSON sweep spec")
+    parser.add_argument("output_dir", help="Directory for the per-chunk .npy files and manifest.json")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: all cores, 0: run in this process)")
+    parser.add_argument("--chunk", type=int, default=BATCH_CHUNK_CONFIGS,
+                        help="Configurations per chunk")
+    args = parser.parse_args(argv)
+
+    manifest = run_sweep(load_spec(args.spec), args.output_dir, args.workers, args.chunk, print_progress)
+    total = sum(chunk['stop'] - chunk['start'] for chunk in manifest['chunks'])
+    sys.stderr.write("\n")
+    print(f"Wrote {total:,} patterns in {len(manifest['chunks'])} chunks to {args.output_dir} "
+          f"in {manifest['elapsed_s']:.2f} s ({total / max(manifest['elapsed_s'], 1e-9):,.0f} patterns/s)")
+
+
+if __name__ == "__main__":
+    main()
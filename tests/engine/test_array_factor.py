@@ -0,0 +1,132 @@
+"""Engine array factors against the naive element sum."""
+import numpy as np
+import pytest
+from src.engine import array_factor
+from src.engine.array_factor import (
+    theta_grid, electrical_spacing, main_beam_angle, steering_phase, radiation_pattern,
+    radiation_pattern_batch, beam_steering, beam_steering_batch, steering_scan, chebyshev_array,
+    chebyshev_array_batch, grating_lobe_check, array_factor_3d, to_db
+)
+from src.engine.metrics import pattern_metrics
+from src.engine.sampling import sample_pattern
+from src.engine.sweep import parameter_sweep
+
+THETA = theta_grid(1441)
+
+
+def naive_pattern(weights, d, theta, beta=0.0):
+    """Normalized |Σ wₙ exp(jn(2πd cos θ + β))| summed element by element."""
+    n = np.arange(len(weights))[:, None]
+    af = np.abs((weights[:, None] * np.exp(1j * n * (2 * np.pi * d * np.cos(theta) + beta))).sum(axis=0))
+    return af / af.max()
+
+
+@pytest.mark.parametrize('N, d, beta, wavelength', [(8, 0.5, 0.0, 1.0), (13, 0.3, 1.1, 1.5), (6, 1.2, -0.4, 0.8)])
+def test_radiation_pattern_matches_naive_sum(N, d, beta, wavelength):
+    result = radiation_pattern(N, d, beta, wavelength, theta=THETA)
+    expected = naive_pattern(np.ones(N), electrical_spacing(d, wavelength), THETA, beta)
+    np.testing.assert_allclose(result['af'], expected, atol=1e-9)
+
+
+def test_batches_match_single_configurations():
+    N, d = np.array([4, 10]), np.array([0.4, 0.6])
+    batch = radiation_pattern_batch(N, d, np.array([0.0, 0.5]), np.array([1.0, 1.3]), theta=THETA)
+    steered = beam_steering_batch(N, d, np.array([45.0, 100.0]), theta=THETA)
+    tapered = chebyshev_array_batch(N, d, np.array([20.0, 30.0]), theta=THETA, method='direct')
+    for i in range(2):
+        single = radiation_pattern(int(N[i]), d[i], [0.0, 0.5][i], [1.0, 1.3][i], theta=THETA)
+        np.testing.assert_allclose(batch['af'][i], single['af'], atol=1e-9)
+        single = beam_steering(int(N[i]), d[i], [45.0, 100.0][i], theta=THETA)
+        np.testing.assert_allclose(steered['af'][i], single['af'], atol=1e-9)
+        single = chebyshev_array(int(N[i]), d[i], [20.0, 30.0][i], theta=THETA, method='direct')
+        np.testing.assert_allclose(tapered['af'][i], single['af'], atol=1e-9)
+
+
+def test_wavelength_scales_the_spacing_in_every_entry_point():
+    N, d, wavelength = 12, 0.4, 1.5
+    d_actual = electrical_spacing(d, wavelength)
+    entry_points = [
+        (radiation_pattern, dict(beta=0.3)),
+        (beam_steering, dict(theta_steer_deg=60.0)),
+        (chebyshev_array, dict(R_dB=30)),
+    ]
+    for compute, params in entry_points:
+        scaled = compute(N, d, wavelength=wavelength, theta=THETA, **params)
+        expected = compute(N, d_actual, theta=THETA, **params)
+        assert not np.allclose(scaled['af'], compute(N, d, theta=THETA, **params)['af'])
+        np.testing.assert_allclose(scaled['af'], expected['af'], atol=1e-12)
+        assert scaled['directivity_dbi'] == pytest.approx(expected['directivity_dbi'])
+
+        # The sampled grid follows the electrical spacing too
+        sampled = sample_pattern(compute, 'adaptive', N, d, d_actual, wavelength=wavelength, **params)
+        reference = sample_pattern(compute, 'adaptive', N, d_actual, **params)
+        np.testing.assert_array_equal(sampled['theta'], reference['theta'])
+        assert sampled['points_per_lobe'] == reference['points_per_lobe']
+
+    batches = [
+        (radiation_pattern_batch, [0.0, 0.3]),
+        (beam_steering_batch, [45.0, 60.0]),
+        (chebyshev_array_batch, [25.0, 30.0]),
+    ]
+    for compute, values in batches:
+        scaled = compute([N, N], [d, d], values, [wavelength, wavelength], THETA)
+        expected = compute([N, N], [d_actual, d_actual], values, [1.0, 1.0], THETA)
+        np.testing.assert_allclose(scaled['af'], expected['af'], atol=1e-12)
+        np.testing.assert_allclose(scaled['directivity_dbi'], expected['directivity_dbi'])
+
+    sweep = parameter_sweep(N=N, d=d, theta_steer=60.0, wavelength=wavelength, theta=THETA)
+    np.testing.assert_allclose(sweep['af'].reshape(-1, len(THETA))[0],
+                               beam_steering(N, d, 60.0, wavelength, THETA)['af'], atol=1e-9)
+    cut = array_factor_3d(N, d, wavelength, num_az=4, num_el=181)
+    np.testing.assert_allclose(cut['cut'], radiation_pattern(N, d, wavelength=wavelength, theta=cut['el'])['af'],
+                               atol=1e-6)
+
+
+def test_steering_scan_rows_match_beam_steering():
+    scan = steering_scan(10, 0.5, theta=THETA)
+    for angle in (0, 37, 90, 180):
+        row = int(np.flatnonzero(scan['steer_deg'] == angle)[0])
+        # The scan cube is float32
+        np.testing.assert_allclose(scan['af'][row], beam_steering(10, 0.5, angle, theta=THETA)['af'], atol=1e-5)
+
+
+def test_chebyshev_sidelobes_sit_at_the_design_level():
+    result = chebyshev_array(16, 0.5, 30, theta=THETA, method='direct')
+    np.testing.assert_allclose(result['af'], naive_pattern(result['weights'], 0.5, THETA), atol=1e-9)
+    assert pattern_metrics(THETA, result['af'])['sll_db'] == pytest.approx(-30, abs=0.1)
+
+
+def test_chebyshev_directivity_is_shared_across_theta_grids(monkeypatch):
+    calls = []
+    tapered_directivity = array_factor.tapered_directivity
+    monkeypatch.setattr(array_factor, 'tapered_directivity',
+                        lambda *args, **kwargs: calls.append(args) or tapered_directivity(*args, **kwargs))
+    coarse = chebyshev_array(23, 0.55, 27, theta=theta_grid(181))
+    fine = chebyshev_array(23, 0.55, 27, theta=theta_grid(2001))
+    assert len(calls) == 1
+    assert coarse['directivity_dbi'] == fine['directivity_dbi']
+
+
+def test_grating_lobe_check_finds_broadside_lobes():
+    result = grating_lobe_check(8, 1.25, 2.0, theta=THETA)
+    assert result['has_grating_lobes']
+    np.testing.assert_allclose(np.cos(result['grating_lobe_angles']), [0.8, -0.8])
+    assert result['d_actual'] == pytest.approx(2.5)
+    assert not grating_lobe_check(8, 0.5, 1.0, theta=THETA)['has_grating_lobes']
+
+
+def test_array_factor_3d_cut_matches_radiation_pattern():
+    result = array_factor_3d(8, 0.5, 1.2, num_az=9, num_el=181)
+    expected = radiation_pattern(8, 0.5, 0.0, 1.2, theta=result['el'])['af']
+    np.testing.assert_allclose(result['cut'], expected, atol=1e-6)
+    np.testing.assert_allclose(result['af'], np.broadcast_to(result['cut'][:, None], (181, 9)))
+
+
+def test_main_beam_angle_round_trips_steering_phase():
+    angles = np.array([0.0, 30.0, 90.0, 150.0])
+    np.testing.assert_allclose(main_beam_angle(0.5, steering_phase(0.5, angles)), angles, atol=1e-6)
+    assert np.isnan(main_beam_angle(0.25, 2.0))
+
+
+def test_to_db_clips_at_the_floor():
+    np.testing.assert_allclose(to_db(np.array([1.0, 0.1, 0.0]), floor_db=-40), [0.0, -20.0, -40.0])
@@ -0,0 +1,49 @@
+"""Headless batch sweeps: spec parsing and agreement with the in-memory sweep."""
+import json
+import numpy as np
+import pytest
+from src.engine.batch import load_spec, run_sweep
+from src.engine.store import PatternStore
+from src.engine.sweep import parameter_sweep
+from src.engine.array_factor import theta_grid
+
+SPEC = {
+    'N': [4, 12],
+    'd': {'start': 0.25, 'stop': 0.75, 'num': 3},
+    'theta_steer': [None, 45],
+    'R_dB': [None, 30],
+    'theta_points': 181,
+    'dtype': 'float64'
+}
+
+
+def test_load_spec(tmp_path):
+    path = tmp_path / 'spec.json'
+    path.write_text(json.dumps(SPEC))
+    spec = load_spec(str(path))
+    np.testing.assert_allclose(spec['axes']['d'], [0.25, 0.5, 0.75])
+    assert np.isnan(spec['axes']['theta_steer'][0]) and spec['axes']['theta_steer'][1] == 45
+    assert spec['theta_points'] == 181 and spec['dtype'] == 'float64'
+
+    defaults = load_spec({'N': 8})
+    assert defaults['dtype'] == 'float32'
+
+    with pytest.raises(ValueError):
+        load_spec({'N': 8, 'spacing': 0.5})
+
+
+def test_run_sweep_matches_parameter_sweep(tmp_path):
+    spec = load_spec(SPEC)
+    progress = []
+    manifest = run_sweep(spec, str(tmp_path), workers=0, chunk_configs=5,
+                         progress=lambda done, total, elapsed: progress.append((done, total)))
+    assert manifest['complete'] and len(manifest['chunks']) == 5
+    assert progress[-1] == (24, 24)
+
+    expected = parameter_sweep(theta=theta_grid(181), **{name: SPEC[name] for name in ('N', 'theta_steer', 'R_dB')},
+                               d=spec['axes']['d'])
+    store = PatternStore(str(tmp_path))
+    np.testing.assert_allclose(store.page(0, len(store)), expected['af'].reshape(len(store), -1), atol=1e-12)
+    np.testing.assert_allclose(
+        [store.directivity_dbi(i) for i in range(len(store))], expected['directivity_dbi'].ravel()
+    )
@@ -0,0 +1,72 @@
+"""Pattern cache: hits, eviction, read-only results and caller-owned arrays."""
+import threading
+import numpy as np
+from src.engine.cache import PatternCache, cached_pattern
+
+
+def make_cached(cache):
+    calls = []
+
+    @cached_pattern(cache=cache)
+    def pattern(N, d=0.5, theta=None):
+        calls.append((N, d))
+        theta = np.linspace(0, np.pi, 5) if theta is None else theta
+        return {'theta': theta, 'af': np.full(len(theta), float(N))}
+
+    return pattern, calls
+
+
+def test_positional_and_keyword_calls_share_entries():
+    cache = PatternCache()
+    pattern, calls = make_cached(cache)
+    first = pattern(8)
+    assert pattern(N=8, d=0.5) is first
+    assert pattern(8, 0.6) is not first
+    assert calls == [(8, 0.5), (8, 0.6)]
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+
+def test_results_are_read_only_but_caller_arrays_are_not():
+    cache = PatternCache()
+    pattern, _ = make_cached(cache)
+    theta = np.linspace(0, 1, 7)
+    result = pattern(4, theta=theta)
+    assert not result['af'].flags.writeable
+    assert not result['theta'].flags.writeable
+    # The result's θ is a copy, so the caller's array stays writeable
+    assert theta.flags.writeable and result['theta'] is not theta
+    np.testing.assert_array_equal(result['theta'], theta)
+
+
+def test_array_arguments_are_keyed_by_content():
+    cache = PatternCache()
+    pattern, calls = make_cached(cache)
+    pattern(4, theta=np.linspace(0, 1, 7))
+    pattern(4, theta=np.linspace(0, 1, 7))
+    pattern(4, theta=np.linspace(0, 1, 8))
+    assert len(calls) == 2
+
+
+def test_entry_and_byte_limits_evict_least_recently_used():
+    cache = PatternCache(max_entries=2)
+    pattern, calls = make_cached(cache)
+    pattern(1), pattern(2), pattern(1), pattern(3)
+    assert len(cache) == 2 and cache.stats()['evictions'] == 1
+    pattern(1)
+    assert calls == [(1, 0.5), (2, 0.5), (3, 0.5)]
+
+    cache = PatternCache(max_bytes=2 * 10 * 8)
+    pattern, _ = make_cached(cache)
+    pattern(1), pattern(2), pattern(3)
+    assert cache.stats()['bytes'] <= 2 * 10 * 8
+
+
+def test_thread_stats_count_only_the_calling_thread():
+    cache = PatternCache()
+    pattern, _ = make_cached(cache)
+    pattern(1)
+    worker = threading.Thread(target=lambda: [pattern(n) for n in range(2, 6)])
+    worker.start()
+    worker.join()
+    assert cache.thread_stats()['misses'] == 1
+    assert cache.stats()['misses'] == 5
@@ -0,0 +1,68 @@
+"""Closed-form and autocorrelation directivity against brute-force integration."""
+import numpy as np
+import pytest
+from src.engine.array_factor import chebyshev_weights
+from src.engine.directivity import uniform_directivity, tapered_directivity, to_dbi
+
+
+def brute_force_directivity(weights, d, beta=0.0, num_points=200001):
+    """2 max|AF|² / ∫₋₁¹ |AF(u)|² du with a dense trapezoid rule in u."""
+    u = np.linspace(-1, 1, num_points)
+    n = np.arange(len(weights))[:, None]
+    power = np.abs((weights[:, None] * np.exp(1j * n * (2 * np.pi * d * u + beta))).sum(axis=0))**2
+    return 2 * power.max() / np.trapz(power, u)
+
+
+@pytest.mark.parametrize('N, d, beta', [
+    (2, 0.5, 0.0), (8, 0.5, 0.0), (8, 0.25, 1.0), (16, 0.7, -2.0), (20, 1.2, 0.5), (5, 0.1, 2.5)
+])
+def test_uniform_closed_form_matches_brute_force(N, d, beta):
+    expected = brute_force_directivity(np.ones(N), d, beta)
+    assert uniform_directivity(N, d, beta) == pytest.approx(expected, rel=1e-3)
+    assert tapered_directivity(np.ones(N), d, beta) == pytest.approx(expected, rel=1e-3)
+
+
+def test_half_wavelength_broadside_directivity_is_N():
+    N = np.array([2, 4, 10, 50])
+    np.testing.assert_allclose(uniform_directivity(N, 0.5), N)
+
+
+@pytest.mark.parametrize('N, R_dB, d', [(8, 20, 0.5), (16, 30, 0.6), (32, 40, 0.4)])
+def test_tapered_autocorrelation_matches_brute_force(N, R_dB, d):
+    weights = chebyshev_weights(N, R_dB)
+    assert tapered_directivity(weights, d) == pytest.approx(brute_force_directivity(weights, d), rel=1e-3)
+
+
+def test_batched_directivity_matches_single_calls():
+    N = np.array([4, 9, 16])
+    d = np.array([0.5, 0.3, 0.8])
+    beta = np.array([0.0, 0.7, -1.2])
+    batched = uniform_directivity(N, d, beta)
+    for i in range(3):
+        assert batched[i] == pytest.approx(float(uniform_directivity(N[i], d[i], beta[i])))
+
+    weights = np.zeros((3, 16))
+    for i, n in enumerate(N):
+        weights[i, :n] = 1
+    np.testing.assert_allclose(tapered_directivity(weights, d, beta), batched, rtol=1e-6)
+
+
+def test_to_dbi():
+    np.testing.assert_allclose(to_dbi(np.array([1.0, 10.0, 100.0])), [0.0, 10.0, 20.0])
+    assert to_dbi(0.0) == -np.inf
+
+
+@pytest.mark.parametrize('weights, d, beta', [
+    (chebyshev_weights(12, 30), 0.1, 2.5),
+    (chebyshev_weights(9, 25) * np.exp(0.4j * np.arange(9)), 0.6, -0.4),
+    (np.array([1.0, -0.5, 0.8, 1.0, -0.2]), 0.45, 0.3)
+])
+def test_hidden_beams_and_general_weights_match_brute_force(weights, d, beta):
+    assert tapered_directivity(weights, d, beta) == pytest.approx(brute_force_directivity(weights, d, beta), rel=1e-3)
+
+
+def test_chunking_does_not_change_the_result():
+    weights = np.stack([chebyshev_weights(64, R) for R in (20, 30, 40, 50)])
+    d = np.array([0.3, 0.5, 0.9, 1.4])
+    np.testing.assert_allclose(tapered_directivity(weights, d, chunk_elements=1),
+                               tapered_directivity(weights, d), rtol=1e-12)
@@ -0,0 +1,96 @@
+"""Arbitrary geometries: file parsing and patterns against the linear array engine."""
+import io
+import numpy as np
+import pytest
+from src.engine.array_factor import radiation_pattern, beam_steering, theta_grid
+from src.config.constants import ADAPTIVE_POINTS_PER_LOBE
+from src.engine.geometry import (
+    ula_geometry, parse_geometry, load_geometry, steering_weights, geometry_array_factor,
+    direction_vectors, cut_aperture, geometry_pattern, geometry_pattern_3d
+)
+from src.engine.sampling import sample_theta_uniform, lobe_resolution, undersampled
+
+THETA = theta_grid(721)
+
+
+def test_linear_geometry_matches_radiation_pattern():
+    positions = ula_geometry(9, 0.6)
+    for phi in (0.0, 70.0):
+        result = geometry_pattern(positions, np.ones(9), phi, theta=THETA)
+        np.testing.assert_allclose(result['af'], radiation_pattern(9, 0.6, theta=THETA)['af'], atol=1e-9)
+
+
+def test_steering_weights_match_beam_steering():
+    positions = ula_geometry(12, 0.5)
+    weights = steering_weights(positions, np.ones(12), 50.0, 0.0)
+    result = geometry_pattern(positions, weights, theta=THETA)
+    np.testing.assert_allclose(result['af'], beam_steering(12, 0.5, 50.0, theta=THETA)['af'], atol=1e-9)
+
+
+def test_chunked_evaluation_matches_single_block():
+    rng = np.random.default_rng(1)
+    positions = rng.uniform(-3, 3, (50, 3))
+    weights = rng.uniform(0.5, 1, 50) * np.exp(1j * rng.uniform(-np.pi, np.pi, 50))
+    directions = direction_vectors(THETA[::10, None], np.linspace(0, 2 * np.pi, 13)[None, :])
+    np.testing.assert_allclose(geometry_array_factor(positions, weights, directions, chunk_elements=7),
+                               geometry_array_factor(positions, weights, directions))
+
+
+def test_3d_pattern_elevation_cut():
+    positions = ula_geometry(6, 0.5)
+    result = geometry_pattern_3d(positions, np.ones(6), num_az=8, num_el=91)
+    expected = radiation_pattern(6, 0.5, theta=result['el'])['af']
+    np.testing.assert_allclose(result['af'], np.broadcast_to(expected[:, None], (91, 8)), atol=1e-6)
+
+
+def test_parse_geometry_columns():
+    positions, weights = parse_geometry([[0, 1], [2, 3]])
+    np.testing.assert_array_equal(positions, [[0, 1, 0], [2, 3, 0]])
+    np.testing.assert_array_equal(weights, [1, 1])
+
+    positions, weights = parse_geometry([[0, 0, 1, 0.5, 90]])
+    np.testing.assert_array_equal(positions, [[0, 0, 1]])
+    np.testing.assert_allclose(weights, [0.5j], atol=1e-12)
+
+    with pytest.raises(ValueError):
+        parse_geometry([[0]])
+    with pytest.raises(ValueError):
+        parse_geometry([[0, 0, 0, 1, 0, 0]])
+
+
+def test_load_geometry_from_csv_and_npy():
+    positions, weights = load_geometry(io.BytesIO(b"x,y,z\n0,0,0\n0,0,0.5\n"), "array.csv")
+    np.testing.assert_array_equal(positions, [[0, 0, 0], [0, 0, 0.5]])
+
+    buffer = io.BytesIO()
+    np.save(buffer, np.array([[0.0, 0.0, 0.0, 1.0], [0.5, 0.0, 0.0, 0.5]]))
+    buffer.seek(0)
+    positions, weights = load_geometry(buffer, "ARRAY.NPY")
+    np.testing.assert_array_equal(positions[:, 0], [0, 0.5])
+    np.testing.assert_allclose(weights, [1, 0.5])
+
+
+def test_cut_aperture_of_a_linear_array_along_z_is_exact():
+    assert cut_aperture(ula_geometry(16, 0.7), 30.0) == pytest.approx((16, 0.7))
+
+
+def test_cut_aperture_projects_onto_the_cut_plane():
+    # A line along x seen in the φ = 0 cut, and end-on (a point) in the φ = 90° cut
+    positions = np.column_stack([np.arange(11) * 0.5, np.zeros(11), np.zeros(11)])
+    assert cut_aperture(positions, 0.0) == pytest.approx((11, 0.5))
+    assert cut_aperture(positions, 90.0) == pytest.approx((11, 0.0))
+
+
+@pytest.mark.parametrize('resolution', ['adaptive', 'max-points'])
+def test_uniform_theta_grid_resolves_a_line_broadside_to_z(resolution):
+    # The cut's main beam sits at θ = 0, where a grid uniform in u = cos θ is sparsest
+    N, d = 400, 0.5
+    positions = np.column_stack([np.arange(N) * d, np.zeros(N), np.zeros(N)])
+    theta = sample_theta_uniform(*cut_aperture(positions, 0.0), resolution,
+                                 pattern=lambda th: geometry_pattern(positions, np.ones(N), 0.0, th)['af'])
+    assert lobe_resolution(theta, N, d) >= ADAPTIVE_POINTS_PER_LOBE * 0.99
+    assert undersampled(theta_grid(), N, d)
+
+    # The cut is the pattern of a ULA along z evaluated at cos θ' = sin θ
+    result = geometry_pattern(positions, np.ones(N), 0.0, theta)
+    np.testing.assert_allclose(result['af'], radiation_pattern(N, d, theta=np.pi / 2 - theta)['af'], atol=1e-6)
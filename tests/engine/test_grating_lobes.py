@@ -0,0 +1,78 @@
+"""Closed-form grating-lobe analysis against brute-force lobe enumeration."""
+import numpy as np
+import pytest
+from src.engine.kernels import dirichlet
+from src.engine.grating_lobes import (
+    beam_cosine, grating_lobe_margin, max_spacing, max_scan_angle, grating_lobe_onset,
+    grating_lobe_directions, grating_lobe_region
+)
+
+
+def brute_force_margin(d, u_beam, N=None, max_order=100):
+    """Nearest grating lobe u₀ + k/d over every order |k| ≤ ``max_order``, measured from |u| = 1."""
+    orders = np.arange(-max_order, max_order + 1)
+    orders = orders[orders != 0]
+    margin = np.min(np.abs(u_beam + orders / d)) - 1
+    return margin if N is None else margin - 1 / (N * d)
+
+
+@pytest.mark.parametrize('N', [None, 8, 64])
+def test_margin_matches_brute_force(N):
+    rng = np.random.default_rng(0 if N is None else N)
+    for d, u_beam in zip(rng.uniform(0.1, 3, 200), rng.uniform(-1.5, 1.5, 200)):
+        assert grating_lobe_margin(d, u_beam, N) == pytest.approx(brute_force_margin(d, u_beam, N), abs=1e-12)
+
+
+@pytest.mark.parametrize('true_time_delay', [False, True])
+@pytest.mark.parametrize('N', [None, 16])
+def test_max_spacing_is_the_margin_boundary(true_time_delay, N):
+    for theta_steer in (0.0, 30.0, 90.0, 135.0):
+        for ratio in (0.8, 1.0, 1.5):
+            d = max_spacing(theta_steer, N, ratio, true_time_delay)
+            u_beam = beam_cosine(theta_steer, ratio, true_time_delay)
+            assert grating_lobe_margin(d * ratio, u_beam, N) == pytest.approx(0, abs=1e-9)
+            assert grating_lobe_margin(0.99 * d * ratio, u_beam, N) > 0
+            assert grating_lobe_margin(1.01 * d * ratio, u_beam, N) < 0
+
+
+def test_max_scan_angle_is_the_margin_boundary():
+    d, N = 0.6, 20
+    low, high = max_scan_angle(d, N)
+    for angle in (low, high):
+        assert grating_lobe_margin(d, beam_cosine(angle), N) == pytest.approx(0, abs=1e-9)
+    assert grating_lobe_margin(d, beam_cosine(90.0), N) > 0
+    assert np.isnan(max_scan_angle(1.5, N)[0])
+
+
+@pytest.mark.parametrize('true_time_delay', [False, True])
+def test_onset_is_where_the_first_lobe_peak_enters(true_time_delay):
+    d, theta_steer = 0.5, 60.0
+    ratio = grating_lobe_onset(d, theta_steer, true_time_delay)
+    margin = grating_lobe_margin(d * ratio, beam_cosine(theta_steer, ratio, true_time_delay))
+    assert margin == pytest.approx(0, abs=1e-9)
+
+
+def test_directions_match_pattern_peaks():
+    N, d, u_beam = 16, 1.7, 0.3
+    orders, directions = grating_lobe_directions(d, u_beam)
+    u = np.cos(np.radians(directions[:, 0]))
+    np.testing.assert_allclose(u, u_beam + orders / d)
+    # Every listed direction is a full-height lobe of the sampled pattern
+    np.testing.assert_allclose(dirichlet(N, 2 * np.pi * d * (u - u_beam)), 1, atol=1e-9)
+
+    u_grid = np.linspace(-1, 1, 200001)
+    af = dirichlet(N, 2 * np.pi * d * (u_grid - u_beam))
+    peaks = u_grid[1:-1][(af[1:-1] > 0.999) & (af[1:-1] >= af[:-2]) & (af[1:-1] >= af[2:])]
+    peaks = peaks[np.abs(peaks - u_beam) > 1e-3]
+    np.testing.assert_allclose(np.sort(u), peaks, atol=1e-4)
+
+
+def test_region_matches_pointwise_margin():
+    d = np.linspace(0.2, 1.2, 11)
+    theta_steer = np.array([0.0, 45.0, 90.0])
+    region = grating_lobe_region(d, theta_steer, N=10, frequency_ratio=1.2)
+    for i, angle in enumerate(theta_steer):
+        for j, spacing in enumerate(d):
+            expected = grating_lobe_margin(spacing * 1.2, beam_cosine(angle, 1.2), 10)
+            assert region['margin'][i, j] == pytest.approx(expected)
+    np.testing.assert_array_equal(region['free'], region['margin'] >= 0)
@@ -0,0 +1,52 @@
+"""Dirichlet kernel against the naive element sum."""
+import numpy as np
+import pytest
+from src.engine.kernels import array_phase, dirichlet, dirichlet_power
+
+
+def naive_af(N, mu):
+    """|Σ exp(jnμ)| / N summed element by element."""
+    n = np.arange(N).reshape((N,) + (1,) * np.ndim(mu))
+    return np.abs(np.exp(1j * n * mu).sum(axis=0)) / N
+
+
+@pytest.mark.parametrize('N', [1, 2, 7, 32, 1000])
+def test_dirichlet_matches_naive_sum(N):
+    rng = np.random.default_rng(N)
+    # Random phases plus the singular points μ = 2πk, where the ratio is 0/0
+    mu = np.concatenate([rng.uniform(-20, 20, 500), 2 * np.pi * np.arange(-3, 4)])
+    np.testing.assert_allclose(dirichlet(N, mu), naive_af(N, mu), atol=1e-9)
+
+
+def test_dirichlet_is_one_at_grating_lobe_peaks():
+    mu = 2 * np.pi * np.arange(-5, 6, dtype=float)
+    np.testing.assert_array_equal(dirichlet(16, mu), np.ones_like(mu))
+
+
+def test_dirichlet_in_place_float32():
+    mu = np.linspace(-np.pi, np.pi, 1001)
+    expected = naive_af(12, mu)
+    buffer = mu.astype(np.float32)
+    out = dirichlet(12, buffer, out=buffer)
+    assert out is buffer and out.dtype == np.float32
+    np.testing.assert_allclose(out, expected, atol=1e-5)
+
+
+def test_dirichlet_broadcasts_element_counts():
+    mu = np.linspace(-np.pi, np.pi, 101)
+    N = np.array([3, 8, 21])[:, None]
+    expected = np.stack([naive_af(n, mu) for n in N[:, 0]])
+    np.testing.assert_allclose(dirichlet(N, mu), expected, atol=1e-9)
+
+
+def test_dirichlet_power_is_unnormalized_square():
+    mu = np.linspace(-4, 4, 201)
+    np.testing.assert_allclose(dirichlet_power(9, mu), (9 * naive_af(9, mu))**2, rtol=1e-9, atol=1e-9)
+
+
+def test_array_phase():
+    theta = np.linspace(0, np.pi, 50)
+    d = np.array([0.25, 0.5])[:, None]
+    mu = array_phase(d, theta, beta=0.4)
+    np.testing.assert_allclose(mu, 2 * np.pi * d * np.cos(theta) + 0.4)
+    assert array_phase(0.5, theta, dtype=np.float32).dtype == np.float32
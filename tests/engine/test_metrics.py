@@ -0,0 +1,38 @@
+"""Pattern metrics against the analytic values of uniform arrays."""
+import numpy as np
+import pytest
+from src.engine.array_factor import radiation_pattern, beam_steering, theta_grid
+from src.engine.metrics import pattern_metrics, half_power_beamwidth, null_positions
+
+THETA = theta_grid(20001)
+
+
+def test_broadside_uniform_array():
+    N, d = 32, 0.5
+    metrics = pattern_metrics(THETA, radiation_pattern(N, d, theta=THETA)['af'], 90.0)
+    assert metrics['peak_deg'] == pytest.approx(90.0, abs=0.01)
+    assert metrics['pointing_error_deg'] == pytest.approx(0.0, abs=0.01)
+    # First nulls at cos θ = ±1/(Nd), half power at cos θ ≈ ±0.443/(Nd)
+    assert metrics['fnbw_deg'] == pytest.approx(np.degrees(2 * np.arcsin(1 / (N * d))), abs=0.02)
+    assert metrics['hpbw_deg'] == pytest.approx(np.degrees(2 * np.arcsin(0.4429 / (N * d))), abs=0.02)
+    assert metrics['sll_db'] == pytest.approx(-13.2, abs=0.1)
+    # Interior nulls at cos θ = k/(Nd) for 0 < |k| < Nd
+    assert metrics['num_nulls'] == 2 * (N * d - 1)
+
+
+def test_nulls_sit_at_multiples_of_the_null_spacing():
+    N, d = 10, 0.5
+    nulls = null_positions(THETA, radiation_pattern(N, d, theta=THETA)['af'])
+    k = np.array([k for k in range(-N + 1, N) if k % N != 0 and abs(k / (N * d)) < 1])
+    np.testing.assert_allclose(np.sort(nulls), np.sort(np.degrees(np.arccos(k / (N * d)))), atol=0.01)
+
+
+def test_stacked_patterns_match_single_patterns():
+    patterns = np.stack([beam_steering(16, 0.5, angle, theta=THETA)['af'] for angle in (40.0, 90.0, 130.0)])
+    stacked = pattern_metrics(THETA, patterns, np.array([40.0, 90.0, 130.0]))
+    for i, row in enumerate(patterns):
+        single = pattern_metrics(THETA, row, [40.0, 90.0, 130.0][i])
+        for name, value in single.items():
+            np.testing.assert_allclose(stacked[name][i], value)
+    np.testing.assert_allclose(stacked['pointing_error_deg'], 0, atol=0.01)
+    np.testing.assert_allclose(half_power_beamwidth(THETA, patterns), stacked['hpbw_deg'])
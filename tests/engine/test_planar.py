@@ -0,0 +1,46 @@
+"""Separable planar array factor against the element-by-element sum."""
+import numpy as np
+import pytest
+from src.engine.geometry import direction_vectors, geometry_array_factor, steering_weights
+from src.config.constants import MIN_POINTS_PER_LOBE
+from src.engine.planar import planar_array_factor, direction_cosines, grid_points_per_lobe, planar_grid_size
+
+
+def grid_positions(Nx, Ny, dx, dy):
+    """Element positions of an Nx × Ny rectangular grid in the xy-plane."""
+    x, y = np.meshgrid(np.arange(Nx) * dx, np.arange(Ny) * dy, indexing='ij')
+    return np.column_stack([x.ravel(), y.ravel(), np.zeros(Nx * Ny)])
+
+
+@pytest.mark.parametrize('Nx, Ny, dx, dy, theta0, phi0', [
+    (4, 4, 0.5, 0.5, 0, 0), (6, 3, 0.5, 0.7, 30, 45), (5, 8, 0.4, 0.6, 60, 200)
+])
+def test_separable_product_matches_element_sum(Nx, Ny, dx, dy, theta0, phi0):
+    result = planar_array_factor(Nx, Ny, dx, dy, theta0, phi0, num_az=37, num_el=37)
+    positions = grid_positions(Nx, Ny, dx, dy)
+    weights = steering_weights(positions, np.ones(len(positions)), theta0, phi0)
+    af = geometry_array_factor(positions, weights, direction_vectors(result['el'][:, None], result['az'][None, :]))
+    np.testing.assert_allclose(result['af'], af / af.max(), atol=1e-5)
+
+
+def test_surface_coordinates_scale_the_direction_vectors():
+    result = planar_array_factor(4, 6, 0.5, 0.5, num_az=19, num_el=19)
+    k_hat = direction_vectors(result['el'][:, None], result['az'][None, :])
+    for i, name in enumerate('xyz'):
+        np.testing.assert_allclose(result[name], result['af'] * k_hat[..., i], atol=1e-6)
+
+
+@pytest.mark.parametrize('Nx, Ny, dx, dy, num_points', [(8, 8, 0.5, 0.5, 100), (20, 5, 0.7, 0.4, 51)])
+def test_grid_points_per_lobe_bounds_the_measured_steps(Nx, Ny, dx, dy, num_points):
+    result = planar_array_factor(Nx, Ny, dx, dy, num_az=num_points, num_el=num_points)
+    u, v = direction_cosines(result['el'][:, None], result['az'][None, :])
+    steps = [np.abs(np.diff(c, axis=axis)).max() for c in (u, v) for axis in (0, 1)]
+    measured = min(1 / (Nx * dx * max(steps[:2])), 1 / (Ny * dy * max(steps[2:])))
+    estimate = grid_points_per_lobe(Nx, Ny, dx, dy, num_points, num_points)
+    assert estimate <= measured <= estimate * 1.01
+
+
+def test_planar_grid_size_resolves_both_axes():
+    size = planar_grid_size(8, 30, 0.5, 0.6)
+    assert grid_points_per_lobe(8, 30, 0.5, 0.6, size, size) >= MIN_POINTS_PER_LOBE
+    assert grid_points_per_lobe(8, 30, 0.5, 0.6, size - 1, size - 1) < MIN_POINTS_PER_LOBE
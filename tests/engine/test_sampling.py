@@ -0,0 +1,48 @@
+"""θ sampling policies: grid density, refinement and undersampling checks."""
+import numpy as np
+import pytest
+from src.config.constants import ADAPTIVE_POINTS_PER_LOBE, ADAPTIVE_REFINE_POINTS, MAX_THETA_POINTS
+from src.engine.array_factor import radiation_pattern, theta_grid
+from src.engine.metrics import pattern_metrics
+from src.engine.sampling import (
+    lobe_resolution, undersampled, beamwidth_grid, find_extrema, refine_grid, sample_theta, sample_pattern
+)
+
+
+@pytest.mark.parametrize('N, d', [(8, 0.5), (100, 0.5), (10000, 0.5), (300, 1.5)])
+def test_adaptive_and_max_points_grids_resolve_every_lobe(N, d):
+    for resolution in ('adaptive', 'max-points'):
+        theta = sample_theta(N, d, resolution)
+        assert lobe_resolution(theta, N, d) >= 0.99 * ADAPTIVE_POINTS_PER_LOBE
+        assert not undersampled(theta, N, d)
+
+
+def test_large_uniform_array_keeps_its_sidelobe_level():
+    # A grid capped at a fixed size aliases N = 10000 down to about -45 dB
+    result = sample_pattern(radiation_pattern, 'adaptive', 10000, 0.5)
+    assert pattern_metrics(result['theta'], result['af'])['sll_db'] == pytest.approx(-13.26, abs=0.05)
+    assert result['points_per_lobe'] >= 0.99 * ADAPTIVE_POINTS_PER_LOBE
+
+
+def test_fixed_and_capped_grids_report_undersampling():
+    assert undersampled(sample_theta(1000, 0.5, 'fixed'), 1000, 0.5)
+    assert not undersampled(sample_theta(20, 0.5, 'fixed'), 20, 0.5)
+    capped = sample_theta(10000, 0.5, 'adaptive', max_points=MAX_THETA_POINTS)
+    assert len(capped) <= MAX_THETA_POINTS + len(theta_grid(181))
+    assert undersampled(capped, 10000, 0.5)
+
+
+def test_refinement_covers_every_extremum():
+    # 4000 lobes give about 8000 peaks and nulls, more than a fixed budget used to allow
+    theta = beamwidth_grid(2000, 0.5)
+    af = radiation_pattern(2000, 0.5, theta=theta)['af']
+    extrema = find_extrema(af)
+    refined = refine_grid(theta, af)
+    inside = np.searchsorted(refined, theta[extrema + 1]) - np.searchsorted(refined, theta[extrema - 1], side='right')
+    # Each extremum gains its own samples plus the original sample at its centre
+    assert inside.min() >= ADAPTIVE_REFINE_POINTS + 1
+
+
+def test_unknown_policy_raises():
+    with pytest.raises(ValueError):
+        sample_theta(8, 0.5, 'dense')
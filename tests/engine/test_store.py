@@ -0,0 +1,94 @@
+"""Pattern store round trips through the writer and the memory-mapped reader."""
+import numpy as np
+import pytest
+from src.engine.array_factor import theta_grid
+from src.engine.store import PatternStoreWriter, PatternStore
+from src.engine.sweep import sweep_axes, sweep_configurations, sweep_block, sweep_directivity
+
+THETA = theta_grid(181)
+
+
+def write_chunk(writer, axes, index, start, stop):
+    params = sweep_configurations(axes, start, stop)
+    writer.write_chunk(index, start, sweep_block(params, THETA), sweep_directivity(params))
+
+
+@pytest.fixture
+def axes():
+    return sweep_axes(N=[4, 8, 16], d=[0.25, 0.5], theta_steer=[None, 60.0])
+
+
+def test_round_trip(tmp_path, axes):
+    writer = PatternStoreWriter(str(tmp_path), axes, THETA)
+    write_chunk(writer, axes, 1, 5, 12)
+    write_chunk(writer, axes, 0, 0, 5)
+    writer.close(note='test')
+
+    store = PatternStore(str(tmp_path))
+    assert store.complete and store.manifest['note'] == 'test'
+    assert len(store) == store.num_written == 12
+    np.testing.assert_array_equal(store.theta, THETA)
+    np.testing.assert_array_equal(store.axes['theta_steer'], axes['theta_steer'])
+
+    expected = sweep_block(sweep_configurations(axes), THETA).astype(np.float32)
+    np.testing.assert_array_equal(store.page(0, 12), expected)
+    np.testing.assert_array_equal(store.page(3, 7), expected[3:7])
+    for index in (0, 4, 5, 11):
+        np.testing.assert_array_equal(store.pattern(index), expected[index])
+        assert not store.pattern(index).flags.writeable
+    np.testing.assert_allclose(store.directivity_dbi(7), 10 * np.log10(sweep_directivity(sweep_configurations(axes, 7, 8))))
+
+
+def test_flat_index_and_configuration(tmp_path, axes):
+    PatternStoreWriter(str(tmp_path), axes, THETA)
+    store = PatternStore(str(tmp_path))
+    index = store.flat_index(N=2, d=1, theta_steer=1)
+    assert index == 11
+    configuration = store.configuration(index)
+    assert configuration['N'] == 16 and configuration['d'] == 0.5 and configuration['theta_steer'] == 60.0
+    assert np.isnan(store.configuration(0)['theta_steer']) and np.isnan(configuration['R_dB'])
+
+
+def test_refresh_picks_up_new_chunks(tmp_path, axes):
+    writer = PatternStoreWriter(str(tmp_path), axes, THETA)
+    write_chunk(writer, axes, 0, 0, 6)
+    store = PatternStore(str(tmp_path), max_open_chunks=1)
+    assert not store.complete
+    with pytest.raises(KeyError):
+        store.pattern(6)
+    assert not store.refresh()
+
+    write_chunk(writer, axes, 1, 6, 12)
+    assert store.refresh()
+    assert store.num_written == 12
+    np.testing.assert_array_equal(store.pattern(6), sweep_block(sweep_configurations(axes, 6, 7), THETA)[0].astype(np.float32))
+    np.testing.assert_array_equal(store.pattern(0), store.page(0, 1)[0])
+    assert len(store._open) == 1
+
+
+def test_refresh_drops_chunks_of_a_rewritten_store(tmp_path, axes):
+    writer = PatternStoreWriter(str(tmp_path), axes, THETA)
+    write_chunk(writer, axes, 0, 0, 12)
+    store = PatternStore(str(tmp_path))
+    old = np.array(store.pattern(3))
+
+    # Rerun a different sweep into the same directory: same chunk name, new shape
+    rerun = sweep_axes(N=[4, 8], d=[0.25, 0.5, 0.75, 1.0])
+    writer = PatternStoreWriter(str(tmp_path), rerun, THETA)
+    params = sweep_configurations(rerun, 0, 8)
+    writer.write_chunk(0, 0, sweep_block(params, THETA), sweep_directivity(params))
+    assert store.refresh()
+    assert store.shape[:2] == (2, 4) and not store._open
+    np.testing.assert_array_equal(store.pattern(3), sweep_block(params, THETA)[3].astype(np.float32))
+    assert not np.array_equal(store.pattern(3), old)
+
+
+def test_chunk_shape_is_checked_against_the_manifest(tmp_path, axes):
+    writer = PatternStoreWriter(str(tmp_path), axes, THETA)
+    write_chunk(writer, axes, 0, 0, 6)
+    # A chunk registered for more rows than its files hold
+    writer.manifest['chunks'][0]['stop'] = 8
+    writer.close()
+    store = PatternStore(str(tmp_path))
+    with pytest.raises(ValueError):
+        store.pattern(0)
@@ -0,0 +1,53 @@
+"""Vectorized sweeps against the single-configuration engine functions."""
+import numpy as np
+import pytest
+from src.engine.array_factor import radiation_pattern, beam_steering, chebyshev_array, theta_grid
+from src.engine.sweep import parameter_sweep, sweep_axes, sweep_configurations, electrical_parameters
+
+THETA = theta_grid(721)
+
+
+def test_uniform_sweep_matches_radiation_pattern():
+    N, d, beta, wavelength = [4, 9], [0.3, 0.5, 0.8], [0.0, 0.6], [0.75, 1.0, 1.4]
+    result = parameter_sweep(N=N, d=d, beta=beta, wavelength=wavelength, theta=THETA)
+    for i, n in enumerate(N):
+        for j, spacing in enumerate(d):
+            for k, phase in enumerate(beta):
+                for m, scale in enumerate(wavelength):
+                    expected = radiation_pattern(n, spacing, phase, scale, theta=THETA)
+                    np.testing.assert_allclose(result['af'][i, j, k, 0, m, 0], expected['af'], atol=1e-9)
+                    assert result['directivity_dbi'][i, j, k, 0, m, 0] == pytest.approx(expected['directivity_dbi'])
+
+
+def test_steered_sweep_matches_beam_steering():
+    theta_steer = [30.0, 90.0, 120.0]
+    result = parameter_sweep(N=12, d=0.5, theta_steer=theta_steer, theta=THETA)
+    for i, angle in enumerate(theta_steer):
+        expected = beam_steering(12, 0.5, angle, theta=THETA)
+        np.testing.assert_allclose(result['af'][0, 0, 0, i, 0, 0], expected['af'], atol=1e-9)
+        assert result['directivity_dbi'][0, 0, 0, i, 0, 0] == pytest.approx(expected['directivity_dbi'])
+
+
+def test_tapered_sweep_matches_chebyshev_array():
+    R_dB = [None, 25.0, 35.0]
+    result = parameter_sweep(N=16, d=0.5, R_dB=R_dB, theta=THETA)
+    for i, level in enumerate(R_dB[1:], start=1):
+        expected = chebyshev_array(16, 0.5, level, theta=THETA, method='direct')
+        np.testing.assert_allclose(result['af'][0, 0, 0, 0, 0, i], expected['af'], atol=1e-4)
+        assert result['directivity_dbi'][0, 0, 0, 0, 0, i] == pytest.approx(expected['directivity_dbi'], rel=1e-6)
+
+
+def test_chunking_does_not_change_the_result():
+    params = dict(N=[6, 10], d=[0.4, 0.7], theta_steer=[None, 45.0], R_dB=[None, 30.0], theta=THETA)
+    # Blocks may pick the FFT path or direct summation independently, so allow the FFT's error
+    np.testing.assert_allclose(parameter_sweep(chunk_elements=1000, **params)['af'],
+                               parameter_sweep(**params)['af'], atol=1e-4)
+
+
+def test_electrical_parameters_scale_spacing_with_wavelength():
+    axes = sweep_axes(N=8, d=[0.5], beta=0.2, theta_steer=[None, 60.0], wavelength=[0.5, 2.0])
+    params = sweep_configurations(axes)
+    d_electrical, beta = electrical_parameters(params)
+    np.testing.assert_allclose(d_electrical, [0.25, 1.0, 0.25, 1.0])
+    steer = -2 * np.pi * d_electrical[2:] * np.cos(np.radians(60.0))
+    np.testing.assert_allclose(beta, np.concatenate([[0.2, 0.2], 0.2 + steer]))
@@ -0,0 +1,56 @@
+"""Mask synthesis: steering matrix, masks and convergence."""
+import numpy as np
+import pytest
+from src.config.constants import SYNTHESIS_TOLERANCE_DB
+from src.engine.synthesis import synthesis_grid, steering_matrix, sidelobe_mask, synthesize
+
+
+def test_steering_matrix_and_pseudo_inverse():
+    u, A, A_pinv = steering_matrix(10, 0.5)
+    np.testing.assert_allclose(u, synthesis_grid(10, 0.5))
+    np.testing.assert_allclose(A, np.exp(2j * np.pi * 0.5 * np.outer(u, np.arange(10))))
+    np.testing.assert_allclose(A_pinv @ A, np.eye(10), atol=1e-9)
+    assert not A.flags.writeable
+
+
+def test_mask_bounds():
+    u, _, _ = steering_matrix(16, 0.5)
+    lower, upper = sidelobe_mask(16, 0.5, u, 60.0, sll_db=-25.0, nulls_deg=(120.0,), null_depth_db=-50.0)
+    beam = np.argmin(np.abs(u - np.cos(np.radians(60.0))))
+    assert lower[beam] == 1 and lower.sum() == 1 and upper[beam] == 1
+    assert upper.min() == pytest.approx(10**(-50 / 20))
+    assert upper[np.argmin(np.abs(u - 0.9))] == pytest.approx(10**(-25 / 20))
+
+
+@pytest.mark.parametrize('theta_steer', [90.0, 60.0])
+def test_synthesis_meets_a_sidelobe_mask(theta_steer):
+    N, d = 16, 0.5
+    u, A, _ = steering_matrix(N, d)
+    lower, upper = sidelobe_mask(N, d, u, theta_steer, mainlobe_width=3.0, sll_db=-25.0)
+    result = synthesize(N, d, lower, upper)
+    assert result['converged']
+    assert np.abs(result['weights']).max() == pytest.approx(1)
+
+    # The reported pattern is the weights' pattern, normalized at the main beam
+    beam = int(np.argmax(lower))
+    af = np.abs(A @ result['weights'])
+    np.testing.assert_allclose(result['af'], af / af[beam], atol=1e-9)
+    assert 20 * np.log10(np.max(result['af'] / upper)) == pytest.approx(result['excess_db'])
+    assert np.all(result['af'] <= upper * 10**(SYNTHESIS_TOLERANCE_DB / 20))
+
+
+def test_warm_start_converges_immediately():
+    N, d = 12, 0.5
+    u, _, _ = steering_matrix(N, d)
+    lower, upper = sidelobe_mask(N, d, u, 90.0, mainlobe_width=3.0, sll_db=-25.0)
+    first = synthesize(N, d, lower, upper)
+    again = synthesize(N, d, lower, upper, initial=first['weights'])
+    assert again['converged'] and again['iterations'] == 1
+
+
+def test_dynamic_range_limits_the_weight_amplitudes():
+    N, d = 16, 0.5
+    u, _, _ = steering_matrix(N, d)
+    lower, upper = sidelobe_mask(N, d, u, 90.0, mainlobe_width=2.0, sll_db=-30.0)
+    amplitude = np.abs(synthesize(N, d, lower, upper, dynamic_range_db=10.0)['weights'])
+    assert 20 * np.log10(amplitude.max() / amplitude.min()) <= 10.0 + 1e-6
@@ -0,0 +1,62 @@
+"""Wideband maps against a brute-force sum per frequency."""
+import numpy as np
+import pytest
+from src.engine.directivity import uniform_directivity, to_dbi
+from src.engine.wideband import wideband_pattern, SQUINT_BANDWIDTH_FACTOR
+
+
+def brute_force_map(N, d, theta_steer_deg, frequency_ratio, theta, true_time_delay):
+    """|Σ exp(jn(2πd (f/f₀) cos θ + β))| / N row by row, with β held or scaled with f."""
+    n = np.arange(N)[:, None]
+    rows = []
+    for ratio in frequency_ratio:
+        beta = -2 * np.pi * d * np.cos(np.radians(theta_steer_deg))
+        if true_time_delay:
+            beta *= ratio
+        mu = 2 * np.pi * d * ratio * np.cos(theta) + beta
+        rows.append(np.abs(np.exp(1j * n * mu).sum(axis=0)) / N)
+    return np.array(rows)
+
+
+@pytest.mark.parametrize('true_time_delay', [False, True])
+def test_map_matches_brute_force(true_time_delay):
+    N, d, theta_steer = 12, 0.5, 50.0
+    frequency_ratio = np.linspace(0.6, 1.8, 25)
+    theta = np.linspace(0, np.pi, 721)
+    result = wideband_pattern(N, d, theta_steer, frequency_ratio, theta=theta,
+                              true_time_delay=true_time_delay, dtype=np.float64)
+    expected = brute_force_map(N, d, theta_steer, frequency_ratio, theta, true_time_delay)
+    np.testing.assert_allclose(result['af'], expected, atol=1e-9)
+
+
+def test_float32_map_rows_are_chunked_consistently():
+    frequency_ratio = np.linspace(0.5, 2.0, 400)
+    theta = np.linspace(0, np.pi, 3001)
+    result = wideband_pattern(40, 0.5, 30.0, frequency_ratio, theta=theta)
+    assert result['af'].dtype == np.float32
+    expected = brute_force_map(40, 0.5, 30.0, frequency_ratio[::37], theta, False)
+    np.testing.assert_allclose(result['af'][::37], expected, atol=1e-5)
+
+
+def test_phase_shifters_squint_and_time_delays_do_not():
+    frequency_ratio = np.array([0.9, 1.0, 1.1])
+    shifted = wideband_pattern(16, 0.5, 60.0, frequency_ratio)
+    expected = np.degrees(np.arccos(np.cos(np.radians(60.0)) / frequency_ratio))
+    np.testing.assert_allclose(shifted['beam_deg'], expected)
+    assert shifted['squint_bandwidth'] == pytest.approx(SQUINT_BANDWIDTH_FACTOR / (16 * 0.5 * 0.5))
+
+    delayed = wideband_pattern(16, 0.5, 60.0, frequency_ratio, true_time_delay=True)
+    np.testing.assert_allclose(delayed['squint_deg'], 0, atol=1e-9)
+    assert delayed['squint_bandwidth'] == np.inf
+
+
+def test_broadside_has_unlimited_squint_bandwidth():
+    assert wideband_pattern(16, 0.5, 90.0, np.array([0.8, 1.2]))['squint_bandwidth'] == np.inf
+
+
+def test_directivity_matches_uniform_closed_form():
+    frequency_ratio = np.linspace(0.7, 1.4, 8)
+    result = wideband_pattern(10, 0.6, 40.0, frequency_ratio)
+    beta = -2 * np.pi * 0.6 * np.cos(np.radians(40.0))
+    np.testing.assert_allclose(result['directivity_dbi'],
+                               to_dbi(uniform_directivity(10, 0.6 * frequency_ratio, beta)))
@@ -0,0 +1,37 @@
+"""Large-N Chebyshev view within a time and memory budget."""
+import time
+import tracemalloc
+import pytest
+from src.engine.metrics import pattern_metrics
+from src.plots.chebyshev_array import ChebyshevArray
+
+# Before directivity moved to the weight autocorrelation, N=3000 alone took
+# 17 s and 557 MB
+TIME_BUDGET_S = 5.0
+MEMORY_BUDGET_MB = 400
+
+
+def render(N, d, R_dB):
+    plot = ChebyshevArray()
+    plot.plot(N, d, R_dB)
+    return plot.result, pattern_metrics(plot.result['theta'], plot.result['af'])
+
+
+def test_large_n_chebyshev_view_within_budget():
+    # Warm up imports and the FFT plans on a small array first
+    render(64, 0.5, 30)
+
+    start = time.perf_counter()
+    result, metrics = render(10000, 0.5, 30)
+    assert time.perf_counter() - start < TIME_BUDGET_S
+    assert metrics['sll_db'] == pytest.approx(-30, abs=0.1)
+    assert result['points_per_lobe'] >= 16 * 0.99
+
+    # A new sidelobe level so nothing comes from the pattern cache
+    tracemalloc.start()
+    try:
+        render(10000, 0.5, 35)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak / 1e6 < MEMORY_BUDGET_MB
@@ -0,0 +1,19 @@
+"""Planar array view: grid sizing and the undersampling notice."""
+from src.config.constants import GRID_RESOLUTIONS, MIN_POINTS_PER_LOBE
+from src.plots.planar_array import PlanarArray
+
+
+def test_default_panel_is_resolved_without_a_notice():
+    plot = PlanarArray()
+    plot.plot(8, 0.5, Ny=8, dy=0.5, grid_points=50)
+    assert plot.result['points_per_lobe'] >= MIN_POINTS_PER_LOBE
+    assert plot.result['af'].shape[0] > 50
+    assert plot.notices() == []
+
+
+def test_large_panel_is_capped_and_warns():
+    plot = PlanarArray()
+    plot.plot(8, 0.5, Ny=10000, dy=0.5)
+    assert plot.result['af'].shape == (max(GRID_RESOLUTIONS),) * 2
+    [(level, message)] = plot.notices()
+    assert level == 'warning' and 'samples per sidelobe' in message
@@ -0,0 +1,31 @@
+"""Plot type registry: lazy imports, plot classes and comparison legends."""
+import os
+import subprocess
+import sys
+from src.plots.base_plot import BasePlot
+from src.plots.registry import PLOT_REGISTRY, format_legend_name
+
+
+def test_importing_the_registry_loads_no_plot_module():
+    code = (
+        "import sys, src.plots.registry\n"
+        "print(sorted(m for m in sys.modules if m.startswith('src.plots.') or m == 'plotly'))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    out = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "['src.plots.registry']"
+
+
+def test_every_type_creates_its_plot_class():
+    for name, plot_type in PLOT_REGISTRY.items():
+        plot = plot_type.create()
+        assert isinstance(plot, BasePlot) and type(plot).__name__ == plot_type.class_name
+        assert plot.get_about_text().strip()
+
+
+def test_legend_names_follow_the_registered_format():
+    assert format_legend_name({'type': 'Chebyshev Array', 'name': 'Plot 3', 'N': 8, 'd': 0.5, 'R_dB': 30}) \
+        == "Plot 3 (N=8, d=0.5λ, R=30 dB)"
+    assert format_legend_name({'type': 'Basic Radiation Pattern', 'name': 'Plot 1', 'N': 4, 'd': 0.25,
+                               'beta': 0.5}) == "Plot 1 (N=4, d=0.25λ, β=0.50 rad)"
+    assert PLOT_REGISTRY['Beam Steering'].comparable and not PLOT_REGISTRY['Planar Array'].comparable
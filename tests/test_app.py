@@ -0,0 +1,64 @@
+"""Smoke test of the Streamlit app: every view renders without an exception."""
+import json
+import os
+import pytest
+from src.engine.array_factor import theta_grid
+from src.engine.store import PatternStoreWriter
+from src.engine.sweep import sweep_axes, sweep_configurations, sweep_block, sweep_directivity
+from src.plots.registry import PLOT_REGISTRY
+
+streamlit = pytest.importorskip('streamlit')
+if tuple(int(part) for part in streamlit.__version__.split('.')[:2]) < (1, 37):
+    pytest.skip("the app needs st.fragment (streamlit>=1.37)", allow_module_level=True)
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+# One overlaid comparison per comparable type, including a duplicate that is stored once
+COMPARISONS = {
+    "Basic Radiation Pattern": {'beta': 0.5},
+    "Beam Steering": {'theta_steer_deg': 60},
+    "Chebyshev Array": {'R_dB': 25},
+    "Grating Lobe Check": {'wavelength': 1.2},
+}
+
+
+@pytest.fixture(scope='module')
+def store_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('store'))
+    theta = theta_grid(181)
+    axes = sweep_axes(N=[4, 8], d=[0.5, 0.7])
+    writer = PatternStoreWriter(path, axes, theta)
+    params = sweep_configurations(axes)
+    writer.write_chunk(0, 0, sweep_block(params, theta), sweep_directivity(params))
+    writer.close()
+    return path
+
+
+@pytest.mark.parametrize('viz_type', list(PLOT_REGISTRY))
+def test_every_view_renders(viz_type, store_path):
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    assert not at.exception
+    if viz_type in COMPARISONS:
+        params = {name: [value] * 3 for name, value in COMPARISONS[viz_type].items()}
+        assert at.session_state['comparisons'].add(viz_type, N=[6, 10, 6], d=[0.5, 0.7, 0.5], **params) == 2
+    at.session_state['store_path'] = store_path
+
+    at.sidebar.radio[0].set_value(viz_type).run()
+    assert not at.exception, [exception.message for exception in at.exception]
+    charts = at.get('plotly_chart')
+    assert charts
+    if viz_type in COMPARISONS:
+        # The main pattern plus both comparisons
+        assert len(json.loads(charts[0].proto.spec)['data']) >= 3
+
+
+def test_plot_controls_rerun_the_figure():
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.run()
+    at.sidebar.radio[0].set_value("Beam Steering").run()
+    before = at.get('plotly_chart')[0].proto.spec
+    at.main.slider[0].set_value(45).run()
+    assert not at.exception
+    assert at.get('plotly_chart')[0].proto.spec != before
@@ -0,0 +1,62 @@
+"""Comparison store: columnar groups, cached patterns and JSON round trips."""
+import numpy as np
+import pytest
+from src.engine.array_factor import radiation_pattern_batch, theta_grid
+from src.utils.comparisons import ComparisonStore
+
+
+def test_add_numbers_deduplicates_and_colors_comparisons():
+    store = ComparisonStore()
+    assert store.add('Basic Radiation Pattern', N=[6, 10, 6], d=[0.5, 0.7, 0.5], beta=0.0) == 2
+    assert store.add('Chebyshev Array', N=8, d=0.5, R_dB=30) == 1
+    assert store.add('Basic Radiation Pattern', N=10, d=0.7, beta=0.0) == 0
+    assert len(store) == 3
+
+    group = store.group('Basic Radiation Pattern')
+    assert group.numbers.tolist() == [1, 2]
+    assert group.columns['N'].dtype.kind == 'i' and group.columns['d'].tolist() == [0.5, 0.7]
+    colors = group.colors + store.group('Chebyshev Array').colors
+    assert len(set(colors)) == 3
+    assert group.records()[1] == {'type': 'Basic Radiation Pattern', 'name': 'Plot 2', 'color': colors[1],
+                                  'N': 10, 'd': 0.7, 'beta': 0.0}
+
+    with pytest.raises(ValueError):
+        store.add('Chebyshev Array', N=8, d=0.5)
+    store.clear()
+    assert len(store) == 0 and store.group('Chebyshev Array') is None
+
+
+def test_patterns_only_compute_new_rows_on_an_unchanged_grid():
+    calls = []
+
+    def compute(theta, **columns):
+        calls.append(len(columns['N']))
+        return radiation_pattern_batch(theta=theta, **columns)
+
+    store = ComparisonStore()
+    store.add('Basic Radiation Pattern', N=[4, 8], d=0.5, beta=0.0)
+    group = store.group('Basic Radiation Pattern')
+    theta = theta_grid(361)
+    group.patterns(compute, theta)
+    store.add('Basic Radiation Pattern', N=12, d=0.5, beta=0.3)
+    result = group.patterns(compute, theta)
+    assert calls == [2, 1]
+    np.testing.assert_allclose(result['af'], radiation_pattern_batch([4, 8, 12], 0.5, [0.0, 0.0, 0.3],
+                                                                      theta=theta)['af'])
+
+    group.patterns(compute, theta_grid(721))
+    assert calls == [2, 1, 3]
+
+
+def test_json_round_trip_keeps_order_and_colors():
+    store = ComparisonStore()
+    store.add('Beam Steering', N=[6, 10], d=0.5, theta_steer_deg=[45.0, 120.0])
+    store.add('Grating Lobe Check', N=8, d=0.9, wavelength=1.2)
+    text = store.to_json()
+
+    loaded = ComparisonStore()
+    assert loaded.load_json(text) == 3
+    assert loaded.to_json() == text
+    assert loaded.load_json(text) == 0
+    with pytest.raises(ValueError):
+        loaded.load_json('{"version": 0, "groups": []}')
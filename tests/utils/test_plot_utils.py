@@ -0,0 +1,74 @@
+"""Figure payload optimization: decimation and compact arrays."""
+import numpy as np
+import plotly.graph_objects as go
+from src.config.constants import MAIN_TRACE_MAX_POINTS, OVERLAY_MAX_POINTS, WEBGL_TRACE_THRESHOLD
+from src.plots.radiation_pattern import RadiationPattern
+from src.utils.plot_utils import lttb, minmax_decimate, optimize_figure
+
+
+def test_minmax_decimate_keeps_every_bucket_extreme():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=100003)
+    keep = minmax_decimate(y, 1000)
+    assert len(keep) <= 1000
+    assert keep[0] == 0 and keep[-1] == len(y) - 1
+    assert np.all(np.diff(keep) > 0)
+
+    size = int(np.ceil(len(y) / 499))
+    for start in range(0, len(y), size):
+        bucket = y[start:start + size]
+        assert start + np.argmax(bucket) in keep and start + np.argmin(bucket) in keep
+
+    np.testing.assert_array_equal(minmax_decimate(y[:500], 1000), np.arange(500))
+
+
+def test_main_trace_is_decimated_and_the_result_keeps_full_resolution():
+    plot = RadiationPattern()
+    fig = plot.plot(10000, 1.0)
+    theta, af = plot.result['theta'].copy(), plot.result['af'].copy()
+    assert len(af) > 100 * MAIN_TRACE_MAX_POINTS
+
+    stats = optimize_figure(fig, overlay_start=len(fig.data))
+    trace = fig.data[0]
+    assert stats['points_after'] <= MAIN_TRACE_MAX_POINTS
+    assert len(trace.y) <= MAIN_TRACE_MAX_POINTS and trace.y.dtype == np.float32
+    # Peaks and nulls survive: the displayed envelope spans the full range
+    assert trace.y.max() == np.float32(af.max()) and trace.y.min() == np.float32(af.min())
+    np.testing.assert_array_equal(plot.result['theta'], theta)
+    np.testing.assert_array_equal(plot.result['af'], af)
+
+
+def test_animated_and_marker_traces_are_not_decimated():
+    x = np.linspace(0, 180, 3 * MAIN_TRACE_MAX_POINTS)
+    fig = go.Figure([go.Scatter(x=x, y=np.sin(x), mode='lines'), go.Scatter(x=x, y=np.cos(x), mode='markers')])
+    fig.frames = [go.Frame(data=[dict(type='scatter', y=np.cos(x))], traces=[0], name='0')]
+    optimize_figure(fig)
+    assert len(fig.data[0].y) == len(x) and len(fig.data[1].y) == len(x)
+
+
+def test_lttb_keeps_the_ends_and_the_spike_of_every_series():
+    x = np.linspace(0, 180, 20001)
+    y = np.stack([np.cos(np.radians(x))**2, np.zeros_like(x)])
+    y[1, 12345] = 1.0
+    keep = lttb(x, y, 500)
+    assert keep.shape == (2, 500)
+    assert np.all(keep[:, 0] == 0) and np.all(keep[:, -1] == len(x) - 1)
+    assert np.all(np.diff(keep, axis=-1) > 0)
+    assert 12345 in keep[1]
+    # Rows are decimated independently: a batch matches single series
+    np.testing.assert_array_equal(keep[0], lttb(x, y[0], 500))
+    np.testing.assert_array_equal(lttb(x, y[0], len(x)), np.arange(len(x)))
+
+
+def test_overlays_are_decimated_with_lttb_and_many_traces_switch_to_webgl():
+    x = np.linspace(0, 180, 3 * OVERLAY_MAX_POINTS)
+    fig = go.Figure([go.Scatter(x=x, y=np.sin(x + k), mode='lines') for k in range(WEBGL_TRACE_THRESHOLD + 1)])
+    stats = optimize_figure(fig, overlay_start=1)
+    assert stats['webgl'] and all(isinstance(trace, go.Scattergl) for trace in fig.data)
+    assert len(fig.data[0].y) == len(x)
+    assert all(len(trace.y) == OVERLAY_MAX_POINTS for trace in fig.data[1:])
+    assert stats['points_after'] == len(x) + WEBGL_TRACE_THRESHOLD * OVERLAY_MAX_POINTS
+
+    fig = go.Figure([go.Scatter(x=x, y=np.sin(x), mode='lines')])
+    stats = optimize_figure(fig, measure=True)
+    assert not stats['webgl'] and stats['bytes_after'] < stats['bytes_before']
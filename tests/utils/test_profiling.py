@@ -0,0 +1,79 @@
+"""Render profiler: stage timings, per-thread cache counters and the log files."""
+import csv
+import json
+import threading
+import time
+import pytest
+from src.engine.cache import cached_pattern
+from src.utils.profiling import RenderProfiler, append_log
+
+
+@cached_pattern
+def _slow_pattern(key, seconds):
+    time.sleep(seconds)
+    return {'key': key}
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = RenderProfiler()
+    profiler.start(False)
+    with profiler.stage('render'):
+        pass
+    profiler.record('payload_bytes', 10)
+    assert profiler.stage('layout') is profiler.stage('render')
+    assert profiler.finish() == {}
+
+
+def test_stages_accumulate_and_split_compute_from_figure_time():
+    profiler = RenderProfiler()
+    profiler.start(True)
+    key = 'stages'
+    with profiler.stage('render'):
+        _slow_pattern(key, 0.05)
+        _slow_pattern(key, 0.05)
+        with profiler.stage('layout'):
+            time.sleep(0.01)
+    with profiler.stage('serialize'):
+        pass
+    with profiler.stage('serialize'):
+        time.sleep(0.01)
+    profiler.record('payload_bytes', 1234)
+    report = profiler.finish()
+
+    assert report['cache_misses'] == 1 and report['cache_hits'] == 1
+    assert report['compute_ms'] >= 50 and report['layout_ms'] >= 10 and report['serialize_ms'] >= 10
+    figure_ms = report['render_ms'] - report['compute_ms'] - report['layout_ms']
+    assert report['figure_ms'] == pytest.approx(figure_ms, abs=0.01) and figure_ms >= 0
+    assert report['payload_bytes'] == 1234
+
+
+def test_concurrent_reruns_keep_separate_state():
+    profiler = RenderProfiler()
+    reports = {}
+
+    def rerun(name, seconds):
+        profiler.start(True)
+        with profiler.stage('render'):
+            _slow_pattern(name, seconds)
+        reports[name] = profiler.finish()
+
+    threads = [threading.Thread(target=rerun, args=('thread a', 0.02)),
+               threading.Thread(target=rerun, args=('thread b', 0.04))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert reports['thread a']['cache_misses'] == reports['thread b']['cache_misses'] == 1
+    assert 20 <= reports['thread a']['compute_ms'] < reports['thread b']['compute_ms']
+    assert profiler.finish() == {}
+
+
+def test_append_log_writes_jsonl_and_csv(tmp_path):
+    path = str(tmp_path / 'logs' / 'timings')
+    append_log({'render_ms': 1.5, 'cache_hits': 2}, path)
+    append_log({'render_ms': 2.5, 'cache_hits': 0, 'extra': 1}, path)
+    with open(path + '.jsonl') as f:
+        assert [json.loads(line)['render_ms'] for line in f] == [1.5, 2.5]
+    with open(path + '.csv', newline='') as f:
+        assert list(csv.DictReader(f)) == [{'render_ms': '1.5', 'cache_hits': '2'},
+                                          {'render_ms': '2.5', 'cache_hits': '0'}]